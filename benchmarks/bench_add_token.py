@@ -0,0 +1,78 @@
+"""
+Benchmark Parser.add_token: tokens per second with the precomputed dispatch
+tables, compared to the original scanning of the arcs of every DFA state.
+"""
+
+from pypyparser import pytokenizer
+from pypyparser.parser import ParseState, ParseError
+from pypyparser.pyparse import PythonParser
+
+from .util import best_of, expressions_corpus, report
+
+
+class ArcScanningState(ParseState):
+    """The add_token() implementation before the dispatch tables."""
+
+    def add_token(self, token_type, value, lineno, column, line):
+        label_index = self.classify(token_type, value, lineno, column, line)
+        sym_id = 0
+        while True:
+            node_type, state_index, node = self.stack[-1]
+            states, first = self.grammar.dfas[node_type - 256]
+            arcs, is_accepting = states[state_index]
+            for i, next_state in arcs:
+                sym_id = self.grammar.labels[i]
+                if label_index == i:
+                    self.shift(next_state, token_type, value, lineno, column)
+                    state = states[next_state]
+                    while state[1] and not state[0]:
+                        self.pop()
+                        if not self.stack:
+                            return True
+                        node_type, state_index, node = self.stack[-1]
+                        state = self.grammar.dfas[node_type - 256][0][state_index]
+                    return False
+                elif sym_id >= 256:
+                    sub_node_dfa = self.grammar.dfas[sym_id - 256]
+                    if label_index in sub_node_dfa[1]:
+                        self.push(next_state, sym_id, lineno, column)
+                        break
+            else:
+                if is_accepting:
+                    self.pop()
+                    if not self.stack:
+                        raise ParseError("too much input", token_type, value,
+                                         lineno, column, line)
+                else:
+                    raise ParseError("bad input", token_type, value, lineno,
+                                     column, line)
+
+
+def tokenize_corpus(corpus):
+    return [pytokenizer.generate_tokens(source.decode().splitlines(True), 0)
+            for source in corpus]
+
+
+def feed(new_state, token_lists):
+    for tokens in token_lists:
+        state = new_state()
+        for tp, value, lineno, column, line in tokens:
+            if state.add_token(tp, value, lineno, column, line):
+                break
+
+
+def main():
+    token_lists = tokenize_corpus(expressions_corpus())
+    count = sum(len(tokens) for tokens in token_lists)
+    parser = PythonParser("3.5")
+    grammar = parser.grammar
+    arc_scanning = lambda: ArcScanningState(grammar, frozenset(),
+                                            grammar.start, {})
+    for name, new_state in [("arc scanning (before)", arc_scanning),
+                            ("dispatch tables (after)", parser.new_state)]:
+        elapsed = best_of(lambda: feed(new_state, token_lists), number=20)
+        report(name, 20 * count / elapsed, "tokens/s")
+
+
+if __name__ == "__main__":
+    main()
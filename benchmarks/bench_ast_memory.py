@@ -0,0 +1,88 @@
+"""
+Benchmark the memory taken by AST nodes: bytes per node of the AST of a
+large generated module, with the __slots__ node classes of ast.py and with
+equivalent classes keeping their fields in an instance dictionary.  The
+__slots__ figure also counts the names, numbers and lists of the tree, which
+the copy shares.
+"""
+
+import tracemalloc
+
+from pypyparser import pyparse, ast
+
+from .bench_compact_tree import make_module
+from .util import report
+
+
+class DictNode:
+    pass
+
+
+def is_node(value):
+    # operators and expression contexts are shared instances, not nodes
+    return (isinstance(value, ast.AST) and
+            getattr(ast, type(value).__name__) is not value)
+
+
+def children(value):
+    if is_node(value):
+        return [value]
+    if isinstance(value, list):
+        return [item for item in value if is_node(item)]
+    return []
+
+
+def all_slots(node):
+    names = []
+    for cls in type(node).__mro__:
+        names.extend(getattr(cls, "__slots__", ()))
+    return names
+
+
+def to_dict_nodes(node):
+    """Copy a tree of AST nodes into DictNode instances."""
+    copy = DictNode()
+    for name in all_slots(node):
+        value = getattr(node, name)
+        if isinstance(value, list):
+            value = [to_dict_nodes(item) if is_node(item)
+                     else item for item in value]
+        elif is_node(value):
+            value = to_dict_nodes(value)
+        setattr(copy, name, value)
+    return copy
+
+
+def count_nodes(node):
+    count = 0
+    todo = [node]
+    while todo:
+        node = todo.pop()
+        count += 1
+        for name in all_slots(node):
+            todo.extend(children(getattr(node, name)))
+    return count
+
+
+def measure(func):
+    tracemalloc.start()
+    result = func()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, allocated
+
+
+def main():
+    source = make_module(2500)
+    parser = pyparse.PythonParser("3.5")
+    mod, slots_size = measure(lambda: parser.parse(
+        source, pyparse.CompileInfo("<bench>"), single_pass=True))
+    nodes = count_nodes(mod)
+    copy, dict_size = measure(lambda: to_dict_nodes(mod))
+    report("AST nodes", nodes, "nodes")
+    report("__dict__ nodes", dict_size / nodes, "bytes/node")
+    report("__slots__ nodes", slots_size / nodes, "bytes/node")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark astdump against pickle: size of the serialized AST of a large
+generated module and time to dump and load it, and whether a deeply nested
+expression can be serialized at all.
+"""
+
+import pickle
+
+from pypyparser import pyparse, astdump
+
+from .bench_compact_tree import make_module
+from .util import best_of, report
+
+
+def main():
+    parser = pyparse.PythonParser("3.5")
+    tree = parser.parse(make_module(2500), pyparse.CompileInfo("<bench>"))
+    for name, dumps, loads in (
+            ("pickle", pickle.dumps, pickle.loads),
+            ("astdump", astdump.dump, astdump.load)):
+        dumped = dumps(tree)
+        report("%s: size" % name, len(dumped) / 1024, "KiB")
+        report("%s: dump" % name,
+               best_of(lambda: dumps(tree), repeat=3) * 1000, "ms")
+        report("%s: load" % name,
+               best_of(lambda: loads(dumped), repeat=3) * 1000, "ms")
+
+    deep = parser.parse(b"x = " + b" + ".join([b"a"] * 5000),
+                        pyparse.CompileInfo("<bench>"))
+    for name, dumps in (("pickle", pickle.dumps), ("astdump", astdump.dump)):
+        try:
+            dumps(deep)
+        except RecursionError:
+            result = "RecursionError"
+        else:
+            result = "ok"
+        report("%s: 5000 nested BinOps" % name, result, "")
+
+
+if __name__ == "__main__":
+    main()
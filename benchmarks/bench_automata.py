@@ -0,0 +1,50 @@
+"""
+Benchmark automata.DFA.recognize(): time for pseudoDFA to split the lines
+of the modules of pypyparser into pseudo-tokens, the way the tokenizer
+walks a line.
+"""
+
+import glob
+import os
+
+from pypyparser.pytokenize import pseudoDFA
+
+from .util import best_of, report
+
+
+def source_lines():
+    package = os.path.join(os.path.dirname(__file__), os.pardir, "pypyparser")
+    lines = []
+    for path in sorted(glob.glob(os.path.join(package, "*.py"))):
+        with open(path, encoding="utf-8") as f:
+            lines.extend(f.read().splitlines(True))
+    return lines
+
+
+def split_lines(lines):
+    count = 0
+    for line in lines:
+        pos = 0
+        end = len(line)
+        while pos < end:
+            match = pseudoDFA.recognize(line, pos)
+            if match <= pos:
+                pos += 1
+            else:
+                pos = match
+            count += 1
+    return count
+
+
+def main():
+    lines = source_lines()
+    count = split_lines(lines)
+    report("lines", len(lines), "lines")
+    report("pseudo-tokens", count, "tokens")
+    elapsed = best_of(lambda: split_lines(lines), repeat=5)
+    report("pseudoDFA.recognize", elapsed * 1000, "ms")
+    report("per pseudo-token", elapsed / count * 1e9, "ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Benchmark PythonParser.check_syntax(): time and peak memory to check a
+large generated module, against parse_source() building its parse tree.
+"""
+
+import tracemalloc
+
+from pypyparser import pyparse
+
+from .bench_compact_tree import make_module
+from .util import best_of, report
+
+
+def main():
+    source = make_module(2500)
+    parser = pyparse.PythonParser("3.5")
+    for name, func in [("parse_source", parser.parse_source),
+                       ("check_syntax", parser.check_syntax)]:
+        tracemalloc.start()
+        func(source, pyparse.CompileInfo("<bench>"))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        report("%s peak memory" % name, peak / 1024 / 1024, "MiB")
+        elapsed = best_of(lambda: func(source, pyparse.CompileInfo("<bench>")),
+                          repeat=3)
+        report(name, elapsed * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark the compact parse trees: number of nodes and memory allocated to
+parse a large generated module, and the time to parse it and build its AST,
+with and without the compact mode of PythonParser.
+"""
+
+import tracemalloc
+
+from pypyparser import pyparse
+
+from .util import best_of, report
+
+
+LINES = [
+    "x = f(a, b[1], c.d + 2)",
+    "if x and not y:",
+    "    total += values[i] * weight - offset",
+    "result = [item.name for item in items if item.enabled]",
+]
+
+
+def make_module(n):
+    return ("\n".join(LINES * n) + "\n").encode()
+
+
+def count_nodes(node):
+    count = 0
+    todo = [node]
+    while todo:
+        node = todo.pop()
+        count += 1
+        for i in range(node.num_children()):
+            todo.append(node.get_child(i))
+    return count
+
+
+def main():
+    source = make_module(2500)
+    for compact in (False, True):
+        parser = pyparse.PythonParser("3.5", compact=compact)
+        name = "compact" if compact else "full"
+        tracemalloc.start()
+        tree = parser.parse_source(source, pyparse.CompileInfo("<bench>"))
+        allocated = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        report("%s: tree nodes" % name, count_nodes(tree), "nodes")
+        report("%s: peak memory of parse_source" % name,
+               allocated / 1024 / 1024, "MiB")
+        del tree
+        elapsed = best_of(lambda: parser.parse(
+            source, pyparse.CompileInfo("<bench>")), repeat=3)
+        report("%s: parse + build AST" % name, elapsed * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark the decoding of escapes in bytes literals: time per byte of
+escaped literals of increasing size, for parsestring.decode_bytes_escape()
+and for the previous decoder, which copied the rest of the literal at every
+backslash.  The time per byte stays flat when decoding is linear.
+"""
+
+import io
+
+from pypyparser import parsestring
+
+from .util import best_of, report
+
+
+def split_decode_bytes_escape(s):
+    """The previous decoder, handling only the escapes of the benchmark."""
+    buf = io.BytesIO()
+    while True:
+        r = s.split(b'\\', 1)
+        buf.write(r[0])
+        if len(r) == 1:
+            break
+        s = r[1]
+        if s[0] == 0x78: # x
+            buf.write(bytes([int(s[1:3], 16)]))
+            s = s[3:]
+        else:
+            buf.write(parsestring.BYTES_ESCAPE[s[0]])
+            s = s[1:]
+    return buf.getvalue()
+
+
+def make_literal(size):
+    """Return the body of a literal like the ones of generated modules."""
+    data = bytes(i % 256 for i in range(size))
+    return repr(data)[2:-1].encode()
+
+
+def main():
+    for size in (10000, 100000, 1000000):
+        literal = make_literal(size)
+        number = max(1, 100000 // size)
+        for name, func in (("split", split_decode_bytes_escape),
+                           ("index", parsestring.decode_bytes_escape)):
+            if name == "split" and size > 100000:
+                continue
+            assert func(literal) == bytes(i % 256 for i in range(size))
+            elapsed = best_of(lambda: func(literal), repeat=3,
+                              number=number) / number
+            report("%s, %d bytes" % (name, len(literal)),
+                   elapsed / len(literal) * 1e9, "ns/byte")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark incremental reparsing: time to get the AST of generated modules
+of increasing size after a local edit, with a full parse and with
+IncrementalParser.  An edit within a line leaves the line numbers of the
+other statements unchanged; an edit adding a line moves them, which is
+only done when they are read, so neither should depend on the size of the
+module.
+"""
+
+from pypyparser import pyparse, incremental
+
+from .bench_compact_tree import make_module
+from .util import best_of, report
+
+
+def main():
+    parser = pyparse.PythonParser("3.5")
+    for n in (250, 2500, 10000):
+        source = make_module(n).decode()
+        lineno = len(source.splitlines()) // 2
+        report("%d lines: full parse" % (4 * n,), best_of(
+            lambda: parser.parse(source, pyparse.CompileInfo("<bench>")),
+            repeat=1) * 1000, "ms")
+        inc = incremental.IncrementalParser("3.5", source)
+
+        def edit_in_line():
+            inc.edit((lineno, 0), (lineno, 1), "y")
+            inc.edit((lineno, 0), (lineno, 1), "x")
+
+        def edit_lines():
+            inc.edit((lineno, 0), (lineno, 0), "z = 1\n")
+            inc.edit((lineno, 0), (lineno + 1, 0), "")
+
+        report("%d lines: edit in a line" % (4 * n,),
+               best_of(edit_in_line, number=10) / 20 * 1000, "ms")
+        report("%d lines: edit adding a line" % (4 * n,),
+               best_of(edit_lines, number=10) / 20 * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark LazyASTBuilder: time to build the AST of a large generated module
+with ASTBuilder, against reading the names of the classes and methods of a
+lazy AST, and against building all of the lazy AST.
+"""
+
+from pypyparser import pyparse, astbuilder, lazyast
+
+from .bench_lazy_functions import make_module
+from .util import best_of, report
+
+
+def read_names(module):
+    names = []
+    for cls in module.body:
+        names.append(cls.name)
+        for func in cls.body[1:]:
+            names.append(func.name)
+    return names
+
+
+def main():
+    source = make_module(1000)
+    for compact in (False, True):
+        parser = pyparse.PythonParser("3.5", compact=compact)
+        name = "compact" if compact else "full"
+        info = pyparse.CompileInfo("<bench>")
+        tree = parser.parse_source(source, info)
+        elapsed = best_of(lambda: astbuilder.ASTBuilder(
+            tree, info, parser.syms).build_ast(), repeat=3)
+        report("%s: build_ast" % name, elapsed * 1000, "ms")
+        elapsed = best_of(lambda: read_names(lazyast.LazyASTBuilder(
+            tree, info, parser.syms).build_ast()), repeat=3)
+        report("%s: lazy, reading the names" % name, elapsed * 1000, "ms")
+        elapsed = best_of(lambda: lazyast.materialize(lazyast.LazyASTBuilder(
+            tree, info, parser.syms).build_ast()), repeat=3)
+        report("%s: lazy, materialize" % name, elapsed * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
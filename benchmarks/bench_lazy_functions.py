@@ -0,0 +1,61 @@
+"""
+Benchmark LazyParser: time to get the outline of a large generated module,
+made of classes of methods, against PythonParser.parse(), and the time to
+then read every function body.
+"""
+
+from pypyparser import pyparse, lazyfunctions
+
+from .util import best_of, report
+
+
+CLASS = '''\
+class C{n}(Base):
+    """A class."""
+
+    def method_a(self, x, y=1):
+        if x and not y:
+            total = self.values[x] * y - self.offset
+        for item in self.items:
+            total += item.weight
+        return total
+
+    def method_b(self, *args, **kwargs):
+        result = [item.name for item in args if item.enabled]
+        try:
+            value = kwargs["key"]
+        except KeyError:
+            value = None
+        return result, value
+
+'''
+
+
+def make_module(n):
+    return "".join(CLASS.format(n=i) for i in range(n)).encode()
+
+
+def read_bodies(module):
+    for cls in module.body:
+        for func in cls.body[1:]:
+            func.body
+
+
+def main():
+    source = make_module(1000)
+    parser = pyparse.PythonParser("3.5")
+    lazy_parser = lazyfunctions.LazyParser("3.5")
+    report("source lines", source.count(b"\n"), "lines")
+    elapsed = best_of(lambda: parser.parse(
+        source, pyparse.CompileInfo("<bench>")), repeat=3)
+    report("parse", elapsed * 1000, "ms")
+    elapsed = best_of(lambda: lazy_parser.parse(
+        source, pyparse.CompileInfo("<bench>")), repeat=3)
+    report("lazy parse, outline only", elapsed * 1000, "ms")
+    elapsed = best_of(lambda: read_bodies(lazy_parser.parse(
+        source, pyparse.CompileInfo("<bench>"))), repeat=3)
+    report("lazy parse, reading every body", elapsed * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
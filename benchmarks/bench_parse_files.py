@@ -0,0 +1,44 @@
+"""
+Benchmark pyparse.parse_files(): time to parse a directory of generated
+modules one after the other in this process, and with pools of processes
+of increasing size.
+"""
+
+import os
+import tempfile
+import time
+
+from pypyparser import pyparse
+
+from .bench_compact_tree import make_module
+from .util import report
+
+
+def parse_sequentially(paths):
+    parser = pyparse.PythonParser("3.5")
+    for path in paths:
+        with open(path, "rb") as f:
+            parser.parse(f.read(), pyparse.CompileInfo(path))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(200):
+            path = os.path.join(tmp, "mod%d.py" % (i,))
+            with open(path, "wb") as f:
+                f.write(make_module(25))
+            paths.append(path)
+        start = time.perf_counter()
+        parse_sequentially(paths)
+        report("sequential", (time.perf_counter() - start) * 1000, "ms")
+        for workers in sorted({1, 2, 4, os.cpu_count()}):
+            start = time.perf_counter()
+            for path, result in pyparse.parse_files(paths, "3.5", workers):
+                assert not isinstance(result, Exception)
+            report("parse_files, %d workers" % (workers,),
+                   (time.perf_counter() - start) * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark PythonParser.parse_imports(): time to get the imports of a large
+generated module, against parse() and walking its AST, and the time of
+parse_tree_imports() on a directory of such modules.
+"""
+
+import os
+import tempfile
+import time
+
+from pypyparser import pyparse, ast
+
+from .bench_lazy_functions import CLASS
+from .util import best_of, report
+
+
+IMPORTS = """\
+import os.path
+from . import a, b as c
+try:
+    from collections import OrderedDict
+except ImportError:
+    OrderedDict = dict
+"""
+
+
+def make_module(n):
+    return (IMPORTS + "".join(CLASS.format(n=i) for i in range(n))).encode()
+
+
+def imports_of_ast(tree):
+    imports = []
+    todo = [tree]
+    while todo:
+        node = todo.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(node)
+            continue
+        for name in node._fields:
+            value = getattr(node, name)
+            if isinstance(value, list):
+                todo.extend(item for item in value
+                            if isinstance(item, ast.AST))
+            elif isinstance(value, ast.AST):
+                todo.append(value)
+    return imports
+
+
+def main():
+    source = make_module(1000)
+    parser = pyparse.PythonParser("3.5")
+    elapsed = best_of(lambda: imports_of_ast(parser.parse(
+        source, pyparse.CompileInfo("<bench>"))), repeat=3)
+    report("parse and walk the AST", elapsed * 1000, "ms")
+    elapsed = best_of(lambda: parser.parse_imports(
+        source, pyparse.CompileInfo("<bench>")), repeat=3)
+    report("parse_imports", elapsed * 1000, "ms")
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(200):
+            with open(os.path.join(tmp, "mod%d.py" % (i,)), "wb") as f:
+                f.write(make_module(5))
+        for workers in sorted({1, os.cpu_count()}):
+            start = time.perf_counter()
+            for path, result in pyparse.parse_tree_imports(tmp, "3.5",
+                                                           workers):
+                assert not isinstance(result, Exception)
+            report("parse_tree_imports, %d workers" % (workers,),
+                   (time.perf_counter() - start) * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
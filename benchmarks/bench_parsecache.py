@@ -0,0 +1,36 @@
+"""
+Benchmark the on-disk parse cache: time to get the ASTs of generated
+modules without the cache, and through ParseCache with an empty cache
+(misses) and a full one (hits).
+"""
+
+import tempfile
+import time
+
+from pypyparser import pyparse, parsecache
+
+from .bench_compact_tree import make_module
+from .util import report
+
+
+def main():
+    sources = [make_module(25) + b"x = %d\n" % (i,) for i in range(100)]
+    parser = pyparse.PythonParser("3.5")
+    start = time.perf_counter()
+    for source in sources:
+        parser.parse(source, pyparse.CompileInfo("<bench>"))
+    report("no cache", (time.perf_counter() - start) * 1000, "ms")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = parsecache.ParseCache(tmp, "3.5")
+        for name in ("misses", "hits"):
+            start = time.perf_counter()
+            for source in sources:
+                cache.parse(source, pyparse.CompileInfo("<bench>"))
+            report("cache %s" % (name,),
+                   (time.perf_counter() - start) * 1000, "ms")
+        report("cache size", cache.size / 1024, "KiB")
+        report("hits / misses", "%d / %d" % (cache.hits, cache.misses), "")
+
+
+if __name__ == "__main__":
+    main()
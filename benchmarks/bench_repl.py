@@ -0,0 +1,45 @@
+"""
+Benchmark repl.InputChecker: time to check the input after every line of a
+cell typed line by line, against parsing the whole input again after every
+line with parse_source() and looking at the error, as done before.
+"""
+
+from pypyparser import pyparse, repl, error
+
+from .util import best_of, report
+
+
+def make_cell(n):
+    body = "".join("    total += values[%d] * (weight -\n"
+                   "                          offset)\n" % i for i in range(n))
+    return "def f(values, weight, offset):\n    total = 0\n" + body + "\n"
+
+
+def check_lines(lines):
+    checker = repl.InputChecker("3.5")
+    for i in range(1, len(lines) + 1):
+        checker.check("".join(lines[:i]))
+    assert checker.status == repl.COMPLETE
+
+
+def parse_lines(lines):
+    parser = pyparse.PythonParser("3.5")
+    for i in range(1, len(lines) + 1):
+        try:
+            parser.parse_source("".join(lines[:i]),
+                                pyparse.CompileInfo("<stdin>", "single"))
+        except error.SyntaxError:
+            pass
+
+
+def main():
+    for n in (10, 100):
+        lines = make_cell(n).splitlines(True)
+        report("%d lines: InputChecker" % len(lines),
+               best_of(lambda: check_lines(lines), repeat=3) * 1000, "ms")
+        report("%d lines: parse_source" % len(lines),
+               best_of(lambda: parse_lines(lines), repeat=3) * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Benchmark the single pass AST construction: peak memory allocated and time
+to parse a large generated module into an AST, building it from the whole
+parse tree or while parsing, with and without compact parse trees.
+"""
+
+import tracemalloc
+
+from pypyparser import pyparse
+
+from .bench_compact_tree import make_module
+from .util import best_of, report
+
+
+def main():
+    source = make_module(2500)
+    for compact in (False, True):
+        parser = pyparse.PythonParser("3.5", compact=compact)
+        for single_pass in (False, True):
+            name = "%s, %s" % ("compact" if compact else "full",
+                               "single pass" if single_pass else "two passes")
+            tracemalloc.start()
+            mod = parser.parse(source, pyparse.CompileInfo("<bench>"),
+                               single_pass=single_pass)
+            allocated = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del mod
+            report("%s: peak memory" % name,
+                   allocated / 1024 / 1024, "MiB")
+            elapsed = best_of(lambda: parser.parse(
+                source, pyparse.CompileInfo("<bench>"),
+                single_pass=single_pass), repeat=3)
+            report("%s: time" % name, elapsed * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
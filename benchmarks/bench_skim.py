@@ -0,0 +1,27 @@
+"""
+Benchmark Skimmer.skim(): time to read the outline of a large generated
+module, against PythonParser.parse(), with both tokenizers.
+"""
+
+from pypyparser import pyparse, skim
+
+from .bench_lazy_functions import make_module
+from .util import best_of, report
+
+
+def main():
+    source = b"import os.path\nfrom . import a, b as c\n" + make_module(1000)
+    for tokenizer in ("dfa", "regex"):
+        parser = pyparse.PythonParser("3.5", tokenizer=tokenizer)
+        skimmer = skim.Skimmer("3.5", tokenizer=tokenizer)
+        parse_time = best_of(lambda: parser.parse(
+            source, pyparse.CompileInfo("<bench>")), repeat=3)
+        report("%s: parse" % tokenizer, parse_time * 1000, "ms")
+        skim_time = best_of(lambda: skimmer.skim(
+            source, pyparse.CompileInfo("<bench>")), repeat=3)
+        report("%s: skim" % tokenizer, skim_time * 1000, "ms")
+        report("%s: parse / skim" % tokenizer, parse_time / skim_time, "")
+
+
+if __name__ == "__main__":
+    main()
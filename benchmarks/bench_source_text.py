@@ -0,0 +1,39 @@
+"""
+Benchmark SourceText: peak memory and time to tokenize a large generated
+module, with LF and with CRLF line ends, from the list of its lines as
+parse_source() used to make it and from a SourceText.
+"""
+
+from pypyparser import pytokenizer
+
+from .bench_compact_tree import make_module
+from .util import best_of, peak_memory, report
+
+
+def split_lines(text):
+    lines = text.splitlines(True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    return lines
+
+
+def tokenize(text, make_lines):
+    for tok in pytokenizer.iter_tokens(make_lines(text), 0):
+        pass
+
+
+def main():
+    text = make_module(10000).decode()
+    for name, source in [("LF", text), ("CRLF", text.replace("\n", "\r\n"))]:
+        report("%s: source" % name, len(source) / 1024 / 1024, "MiB")
+        for how, make_lines in [("lines", split_lines),
+                                ("SourceText", pytokenizer.SourceText)]:
+            peak = peak_memory(lambda: tokenize(source, make_lines))
+            report("%s: %s peak memory" % (name, how), peak / 1024 / 1024,
+                   "MiB")
+            elapsed = best_of(lambda: tokenize(source, make_lines), repeat=3)
+            report("%s: %s tokenize" % (name, how), elapsed * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
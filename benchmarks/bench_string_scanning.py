@@ -0,0 +1,60 @@
+"""
+Benchmark the tokenizing of sources made mostly of strings and comments:
+a module of multi-thousand-line docstrings, one of long single-line data
+literals, one of comment blocks, and ordinary code for comparison, with
+each tokenizer of pytokenizer.TOKENIZERS.
+"""
+
+from pypyparser import pytokenizer
+
+from .bench_compact_tree import make_module
+from .util import best_of, report
+
+
+def make_docstrings(n, lines=3000):
+    """Return a module of n functions with a docstring of `lines` lines."""
+    doc = "".join("    Line %d of the docstring, with 'quotes' and \\\\n.\n" % i
+                  for i in range(lines))
+    return "".join('def f%d():\n    """\n%s    """\n    return %d\n\n'
+                   % (i, doc, i) for i in range(n))
+
+
+def make_data_literals(n, length=20000):
+    """Return a module of n assignments of long bytes and str literals."""
+    data = bytes(range(256)) * (length // 256)
+    text = "abc\\t\\u20ac 'x' " * (length // 16)
+    return "".join("DATA%d = %r\nTEXT%d = \"%s\"\n" % (i, data, i, text)
+                   for i in range(n))
+
+
+def make_comments(n, lines=1000):
+    """Return a module of n blocks of `lines` comment lines."""
+    comment = "".join("    # comment line %d, with \"quotes\" and code: "
+                      "x = f(y)\n" % i for i in range(lines))
+    return "".join("def f%d():\n%s    return %d\n\n" % (i, comment, i)
+                   for i in range(n))
+
+
+def tokenize(lines, tokenizer):
+    for tok in pytokenizer.iter_tokens(lines, 0, tokenizer=tokenizer):
+        pass
+
+
+def main():
+    sources = [("docstrings", make_docstrings(10)),
+               ("data literals", make_data_literals(50)),
+               ("comments", make_comments(20)),
+               ("code", make_module(5000).decode())]
+    for name, source in sources:
+        lines = source.splitlines(True)
+        report("%s: source" % name, len(source) / 1024 / 1024, "MiB")
+        for tokenizer in sorted(pytokenizer.TOKENIZERS):
+            elapsed = best_of(lambda: tokenize(lines, tokenizer), repeat=3)
+            report("%s: %s tokenizer" % (name, tokenizer), elapsed * 1000,
+                   "ms")
+            report("%s: %s throughput" % (name, tokenizer),
+                   len(source) / elapsed / 1024 / 1024, "MiB/s")
+
+
+if __name__ == "__main__":
+    main()
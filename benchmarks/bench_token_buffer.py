@@ -0,0 +1,53 @@
+"""
+Benchmark TokenBuffer: memory held by the tokens of a large generated module
+as a list of 5-tuples and as a TokenBuffer, and the time to tokenize it and
+to parse it from the source and from the buffer.
+"""
+
+import tracemalloc
+
+from pypyparser import pyparse, pytokenizer
+
+from .bench_compact_tree import make_module
+from .util import best_of, report
+
+
+def retained_memory(func):
+    tracemalloc.start()
+    result = func()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, allocated
+
+
+def main():
+    lines = make_module(2500).decode().splitlines(True)
+    tokens, allocated = retained_memory(
+        lambda: pytokenizer.generate_tokens(lines, 0))
+    report("tokens", len(tokens), "tokens")
+    report("list of tuples", allocated / 1024 / 1024, "MiB")
+    del tokens
+    buffer, allocated = retained_memory(
+        lambda: pytokenizer.tokenize_buffer(lines, 0))
+    report("TokenBuffer", allocated / 1024 / 1024, "MiB")
+
+    elapsed = best_of(lambda: pytokenizer.generate_tokens(lines, 0), repeat=3)
+    report("generate_tokens", elapsed * 1000, "ms")
+    elapsed = best_of(lambda: pytokenizer.tokenize_buffer(lines, 0), repeat=3)
+    report("tokenize_buffer", elapsed * 1000, "ms")
+
+    parser = pyparse.PythonParser("3.5")
+    source = "".join(lines).encode()
+    elapsed = best_of(lambda: parser.parse_source(
+        source, pyparse.CompileInfo("<bench>")), repeat=3)
+    report("parse_source", elapsed * 1000, "ms")
+
+    def feed():
+        parser.prepare(parser.syms.file_input)
+        parser.add_tokens(buffer)
+    elapsed = best_of(feed, repeat=3)
+    report("Parser.add_tokens", elapsed * 1000, "ms")
+
+
+if __name__ == "__main__":
+    main()
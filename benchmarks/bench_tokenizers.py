@@ -0,0 +1,51 @@
+"""
+Benchmark the tokenizers of pytokenizer.TOKENIZERS over the modules of the
+standard library, checking that they give the same tokens for each module.
+
+Pass a number to only use every nth module.
+"""
+
+import glob
+import os
+import sys
+import sysconfig
+import time
+
+from pypyparser.test.test_tokenizers import tokenize
+
+from .util import report
+
+
+def stdlib_sample(step):
+    """Return the paths of every `step`th module of the standard library."""
+    stdlib = sysconfig.get_paths()["stdlib"]
+    paths = sorted(glob.glob(os.path.join(stdlib, "*.py")) +
+                   glob.glob(os.path.join(stdlib, "*", "*.py")))
+    return paths[::step]
+
+
+def main():
+    step = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    sources = []
+    for path in stdlib_sample(step):
+        with open(path, encoding="utf-8", errors="surrogateescape") as f:
+            sources.append((path, f.read().splitlines(True)))
+    report("modules", len(sources), "files")
+    report("lines", sum(len(lines) for path, lines in sources), "lines")
+    results = {}
+    for tokenizer in ("dfa", "regex"):
+        start = time.perf_counter()
+        results[tokenizer] = [tokenize(lines, tokenizer)
+                              for path, lines in sources]
+        elapsed = time.perf_counter() - start
+        report("%s tokenizer" % (tokenizer,), elapsed * 1000, "ms")
+    differences = [path for (path, lines), dfa_tokens, regex_tokens
+                   in zip(sources, results["dfa"], results["regex"])
+                   if dfa_tokens != regex_tokens]
+    report("modules with different tokens", len(differences), "files")
+    for path in differences:
+        print("    %s" % (path,))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark the tokenizing of UTF-8 bytes: time and peak memory to decode a
+large generated module at once and tokenize the text, against tokenizing
+its bytes with Utf8SourceText, which decodes one line at a time.
+"""
+
+from pypyparser import pytokenizer
+
+from .bench_compact_tree import make_module
+from .util import best_of, peak_memory, report
+
+
+def decode_then_tokenize(source):
+    for tok in pytokenizer.iter_tokens(
+            pytokenizer.SourceText(source.decode("utf-8")), 0):
+        pass
+
+
+def tokenize_bytes(source):
+    for tok in pytokenizer.iter_tokens(pytokenizer.Utf8SourceText(source), 0):
+        pass
+
+
+def main():
+    ascii_source = make_module(10000)
+    text = ascii_source.decode()
+    sources = [("ASCII", ascii_source),
+               ("non-ASCII", text.replace("values", "valeurs_é").replace(
+                   "result", "résultat").encode("utf-8"))]
+    for name, source in sources:
+        report("%s: source" % name, len(source) / 1024 / 1024, "MiB")
+        elapsed = best_of(lambda: source.decode("utf-8"), repeat=5)
+        report("%s: decode alone" % name, elapsed * 1000, "ms")
+        for how, func in [("decode + tokenize", decode_then_tokenize),
+                          ("Utf8SourceText", tokenize_bytes)]:
+            peak = peak_memory(lambda: func(source))
+            report("%s: %s peak memory" % (name, how), peak / 1024 / 1024,
+                   "MiB")
+            elapsed = best_of(lambda: func(source), repeat=3)
+            report("%s: %s" % (name, how), elapsed * 1000, "ms")
+            report("%s: %s throughput" % (name, how),
+                   len(source) / elapsed / 1024 / 1024, "MiB/s")
+
+
+if __name__ == "__main__":
+    main()
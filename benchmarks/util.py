@@ -0,0 +1,56 @@
+"""
+Helpers shared by the benchmarks.
+
+Run a benchmark from the top of the checkout with, e.g.::
+
+    $ python -m benchmarks.bench_add_token
+"""
+
+import time
+import tracemalloc
+
+from pypyparser import pyparse, error
+from pypyparser.test import expressions
+
+
+def best_of(func, repeat=5, number=1):
+    """Return the best time, in seconds, of `number` calls to func()."""
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        for j in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def peak_memory(func):
+    """Return the peak memory, in bytes, allocated while calling func()."""
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def expressions_corpus(version="3.5"):
+    """Return the snippets of test/expressions.py accepted by `version`."""
+    parser = pyparse.PythonParser(version)
+    corpus = []
+    for group in expressions.TESTS + expressions.EXEC_INPUTS:
+        for source in group:
+            source = source.encode()
+            try:
+                parser.parse_source(source, pyparse.CompileInfo("<bench>"))
+            except error.SyntaxError:
+                continue
+            corpus.append(source)
+    return corpus
+
+
+def report(name, value, unit):
+    if isinstance(value, float):
+        value = "%.1f" % (value,)
+    print("%-40s %12s %s" % (name, value, unit))
@@ -1,3 +1,4 @@
+# Generated by tools/asdl_py.py from tools/Python.asdl, do not edit.
 from . import misc
 
 class UnacceptableExpressionContext(Exception):
@@ -6,15 +7,20 @@ class UnacceptableExpressionContext(Exception):
         self.node = node
         self.msg = msg
 
+
 class AST:
+    # Nodes have no instance dictionary: an AST is made of many small nodes
+    # and the dictionaries would take most of its memory.
+    __slots__ = ()
     _fields = ()
 
 
 class mod(AST):
-    pass
+    __slots__ = ()
 
 
 class Module(mod):
+    __slots__ = ('body',)
     _fields = ('body',)
 
     def __init__(self, body):
@@ -22,6 +28,7 @@ class Module(mod):
 
 
 class Interactive(mod):
+    __slots__ = ('body',)
     _fields = ('body',)
 
     def __init__(self, body):
@@ -29,6 +36,7 @@ class Interactive(mod):
 
 
 class Expression(mod):
+    __slots__ = ('body',)
     _fields = ('body',)
 
     def __init__(self, body):
@@ -36,6 +44,7 @@ class Expression(mod):
 
 
 class Suite(mod):
+    __slots__ = ('body',)
     _fields = ('body',)
 
     def __init__(self, body):
@@ -43,11 +52,15 @@ class Suite(mod):
 
 
 class stmt(AST):
+    __slots__ = ('lineno', 'col_offset')
+
     def __init__(self, lineno, col_offset):
         self.lineno = lineno
         self.col_offset = col_offset
 
+
 class FunctionDef(stmt):
+    __slots__ = ('name', 'args', 'body', 'decorator_list', 'returns')
     _fields = ('name', 'args', 'body', 'decorator_list', 'returns')
 
     def __init__(self, name, args, body, decorator_list, returns, lineno, col_offset):
@@ -60,6 +73,7 @@ class FunctionDef(stmt):
 
 
 class AsyncFunctionDef(stmt):
+    __slots__ = ('name', 'args', 'body', 'decorator_list', 'returns')
     _fields = ('name', 'args', 'body', 'decorator_list', 'returns')
 
     def __init__(self, name, args, body, decorator_list, returns, lineno, col_offset):
@@ -72,6 +86,7 @@ class AsyncFunctionDef(stmt):
 
 
 class ClassDef(stmt):
+    __slots__ = ('name', 'bases', 'keywords', 'body', 'decorator_list')
     _fields = ('name', 'bases', 'keywords', 'body', 'decorator_list')
 
     def __init__(self, name, bases, keywords, body, decorator_list, lineno, col_offset):
@@ -84,6 +99,7 @@ class ClassDef(stmt):
 
 
 class Return(stmt):
+    __slots__ = ('value',)
     _fields = ('value',)
 
     def __init__(self, value, lineno, col_offset):
@@ -92,6 +108,7 @@ class Return(stmt):
 
 
 class Delete(stmt):
+    __slots__ = ('targets',)
     _fields = ('targets',)
 
     def __init__(self, targets, lineno, col_offset):
@@ -100,6 +117,7 @@ class Delete(stmt):
 
 
 class Assign(stmt):
+    __slots__ = ('targets', 'value')
     _fields = ('targets', 'value')
 
     def __init__(self, targets, value, lineno, col_offset):
@@ -109,6 +127,7 @@ class Assign(stmt):
 
 
 class AugAssign(stmt):
+    __slots__ = ('target', 'op', 'value')
     _fields = ('target', 'op', 'value')
 
     def __init__(self, target, op, value, lineno, col_offset):
@@ -119,6 +138,7 @@ class AugAssign(stmt):
 
 
 class For(stmt):
+    __slots__ = ('target', 'iter', 'body', 'orelse')
     _fields = ('target', 'iter', 'body', 'orelse')
 
     def __init__(self, target, iter, body, orelse, lineno, col_offset):
@@ -130,6 +150,7 @@ class For(stmt):
 
 
 class AsyncFor(stmt):
+    __slots__ = ('target', 'iter', 'body', 'orelse')
     _fields = ('target', 'iter', 'body', 'orelse')
 
     def __init__(self, target, iter, body, orelse, lineno, col_offset):
@@ -141,6 +162,7 @@ class AsyncFor(stmt):
 
 
 class While(stmt):
+    __slots__ = ('test', 'body', 'orelse')
     _fields = ('test', 'body', 'orelse')
 
     def __init__(self, test, body, orelse, lineno, col_offset):
@@ -151,6 +173,7 @@ class While(stmt):
 
 
 class If(stmt):
+    __slots__ = ('test', 'body', 'orelse')
     _fields = ('test', 'body', 'orelse')
 
     def __init__(self, test, body, orelse, lineno, col_offset):
@@ -161,6 +184,7 @@ class If(stmt):
 
 
 class With(stmt):
+    __slots__ = ('items', 'body')
     _fields = ('items', 'body')
 
     def __init__(self, items, body, lineno, col_offset):
@@ -170,6 +194,7 @@ class With(stmt):
 
 
 class AsyncWith(stmt):
+    __slots__ = ('items', 'body')
     _fields = ('items', 'body')
 
     def __init__(self, items, body, lineno, col_offset):
@@ -179,6 +204,7 @@ class AsyncWith(stmt):
 
 
 class Raise(stmt):
+    __slots__ = ('exc', 'cause')
     _fields = ('exc', 'cause')
 
     def __init__(self, exc, cause, lineno, col_offset):
@@ -188,6 +214,7 @@ class Raise(stmt):
 
 
 class Try(stmt):
+    __slots__ = ('body', 'handlers', 'orelse', 'finalbody')
     _fields = ('body', 'handlers', 'orelse', 'finalbody')
 
     def __init__(self, body, handlers, orelse, finalbody, lineno, col_offset):
@@ -199,6 +226,7 @@ class Try(stmt):
 
 
 class Assert(stmt):
+    __slots__ = ('test', 'msg')
     _fields = ('test', 'msg')
 
     def __init__(self, test, msg, lineno, col_offset):
@@ -208,6 +236,7 @@ class Assert(stmt):
 
 
 class Import(stmt):
+    __slots__ = ('names',)
     _fields = ('names',)
 
     def __init__(self, names, lineno, col_offset):
@@ -216,6 +245,7 @@ class Import(stmt):
 
 
 class ImportFrom(stmt):
+    __slots__ = ('module', 'names', 'level')
     _fields = ('module', 'names', 'level')
 
     def __init__(self, module, names, level, lineno, col_offset):
@@ -226,6 +256,7 @@ class ImportFrom(stmt):
 
 
 class Global(stmt):
+    __slots__ = ('names',)
     _fields = ('names',)
 
     def __init__(self, names, lineno, col_offset):
@@ -234,6 +265,7 @@ class Global(stmt):
 
 
 class Nonlocal(stmt):
+    __slots__ = ('names',)
     _fields = ('names',)
 
     def __init__(self, names, lineno, col_offset):
@@ -242,6 +274,7 @@ class Nonlocal(stmt):
 
 
 class Expr(stmt):
+    __slots__ = ('value',)
     _fields = ('value',)
 
     def __init__(self, value, lineno, col_offset):
@@ -250,21 +283,28 @@ class Expr(stmt):
 
 
 class Pass(stmt):
+    __slots__ = ()
+
     def __init__(self, lineno, col_offset):
         stmt.__init__(self, lineno, col_offset)
 
 
 class Break(stmt):
+    __slots__ = ()
+
     def __init__(self, lineno, col_offset):
         stmt.__init__(self, lineno, col_offset)
 
 
 class Continue(stmt):
+    __slots__ = ()
+
     def __init__(self, lineno, col_offset):
         stmt.__init__(self, lineno, col_offset)
 
 
 class expr(AST):
+    __slots__ = ('lineno', 'col_offset')
     _description = None
 
     def __init__(self, lineno, col_offset):
@@ -283,6 +323,7 @@ class expr(AST):
 
 
 class BoolOp(expr):
+    __slots__ = ('op', 'values')
     _description = 'operator'
     _fields = ('op', 'values')
 
@@ -293,6 +334,7 @@ class BoolOp(expr):
 
 
 class BinOp(expr):
+    __slots__ = ('left', 'op', 'right')
     _description = 'operator'
     _fields = ('left', 'op', 'right')
 
@@ -304,6 +346,7 @@ class BinOp(expr):
 
 
 class UnaryOp(expr):
+    __slots__ = ('op', 'operand')
     _description = 'operator'
     _fields = ('op', 'operand')
 
@@ -314,6 +357,7 @@ class UnaryOp(expr):
 
 
 class Lambda(expr):
+    __slots__ = ('args', 'body')
     _description = 'lambda'
     _fields = ('args', 'body')
 
@@ -324,6 +368,7 @@ class Lambda(expr):
 
 
 class IfExp(expr):
+    __slots__ = ('test', 'body', 'orelse')
     _description = 'conditional expression'
     _fields = ('test', 'body', 'orelse')
 
@@ -335,6 +380,7 @@ class IfExp(expr):
 
 
 class Dict(expr):
+    __slots__ = ('keys', 'values')
     _description = 'literal'
     _fields = ('keys', 'values')
 
@@ -345,6 +391,7 @@ class Dict(expr):
 
 
 class Set(expr):
+    __slots__ = ('elts',)
     _description = 'literal'
     _fields = ('elts',)
 
@@ -354,6 +401,7 @@ class Set(expr):
 
 
 class ListComp(expr):
+    __slots__ = ('elt', 'generators')
     _description = 'list comprehension'
     _fields = ('elt', 'generators')
 
@@ -364,6 +412,7 @@ class ListComp(expr):
 
 
 class SetComp(expr):
+    __slots__ = ('elt', 'generators')
     _description = 'set comprehension'
     _fields = ('elt', 'generators')
 
@@ -374,6 +423,7 @@ class SetComp(expr):
 
 
 class DictComp(expr):
+    __slots__ = ('key', 'value', 'generators')
     _description = 'dict comprehension'
     _fields = ('key', 'value', 'generators')
 
@@ -385,6 +435,7 @@ class DictComp(expr):
 
 
 class GeneratorExp(expr):
+    __slots__ = ('elt', 'generators')
     _description = 'generator expression'
     _fields = ('elt', 'generators')
 
@@ -395,6 +446,7 @@ class GeneratorExp(expr):
 
 
 class Await(expr):
+    __slots__ = ('value',)
     _fields = ('value',)
 
     def __init__(self, value, lineno, col_offset):
@@ -403,6 +455,7 @@ class Await(expr):
 
 
 class Yield(expr):
+    __slots__ = ('value',)
     _description = 'yield expression'
     _fields = ('value',)
 
@@ -412,6 +465,7 @@ class Yield(expr):
 
 
 class YieldFrom(expr):
+    __slots__ = ('value',)
     _fields = ('value',)
 
     def __init__(self, value, lineno, col_offset):
@@ -420,6 +474,7 @@ class YieldFrom(expr):
 
 
 class Compare(expr):
+    __slots__ = ('left', 'ops', 'comparators')
     _description = 'comparison'
     _fields = ('left', 'ops', 'comparators')
 
@@ -431,6 +486,7 @@ class Compare(expr):
 
 
 class Call(expr):
+    __slots__ = ('func', 'args', 'keywords')
     _description = 'function call'
     _fields = ('func', 'args', 'keywords')
 
@@ -442,6 +498,7 @@ class Call(expr):
 
 
 class Num(expr):
+    __slots__ = ('n',)
     _description = 'literal'
     _fields = ('n',)
 
@@ -451,6 +508,7 @@ class Num(expr):
 
 
 class Str(expr):
+    __slots__ = ('s',)
     _description = 'literal'
     _fields = ('s',)
 
@@ -460,6 +518,7 @@ class Str(expr):
 
 
 class FormattedValue(expr):
+    __slots__ = ('value', 'conversion', 'format_spec')
     _fields = ('value', 'conversion', 'format_spec')
 
     def __init__(self, value, conversion, format_spec, lineno, col_offset):
@@ -470,6 +529,7 @@ class FormattedValue(expr):
 
 
 class JoinedStr(expr):
+    __slots__ = ('values',)
     _fields = ('values',)
 
     def __init__(self, values, lineno, col_offset):
@@ -478,6 +538,7 @@ class JoinedStr(expr):
 
 
 class Bytes(expr):
+    __slots__ = ('s',)
     _description = 'literal'
     _fields = ('s',)
 
@@ -487,6 +548,7 @@ class Bytes(expr):
 
 
 class NameConstant(expr):
+    __slots__ = ('value',)
     _fields = ('value',)
 
     def __init__(self, value, lineno, col_offset):
@@ -495,6 +557,7 @@ class NameConstant(expr):
 
 
 class Ellipsis(expr):
+    __slots__ = ()
     _description = 'Ellipsis'
 
     def __init__(self, lineno, col_offset):
@@ -502,6 +565,7 @@ class Ellipsis(expr):
 
 
 class Attribute(expr):
+    __slots__ = ('value', 'attr', 'ctx')
     _fields = ('value', 'attr', 'ctx')
 
     def __init__(self, value, attr, ctx, lineno, col_offset):
@@ -517,6 +581,7 @@ class Attribute(expr):
 
 
 class Subscript(expr):
+    __slots__ = ('value', 'slice', 'ctx')
     _fields = ('value', 'slice', 'ctx')
 
     def __init__(self, value, slice, ctx, lineno, col_offset):
@@ -530,6 +595,7 @@ class Subscript(expr):
 
 
 class Starred(expr):
+    __slots__ = ('value', 'ctx')
     _fields = ('value', 'ctx')
 
     def __init__(self, value, ctx, lineno, col_offset):
@@ -543,6 +609,7 @@ class Starred(expr):
 
 
 class Name(expr):
+    __slots__ = ('id', 'ctx')
     _fields = ('id', 'ctx')
 
     def __init__(self, id, ctx, lineno, col_offset):
@@ -557,6 +624,7 @@ class Name(expr):
 
 
 class List(expr):
+    __slots__ = ('elts', 'ctx')
     _fields = ('elts', 'ctx')
 
     def __init__(self, elts, ctx, lineno, col_offset):
@@ -572,6 +640,7 @@ class List(expr):
 
 
 class Tuple(expr):
+    __slots__ = ('elts', 'ctx')
     _description = '()'
     _fields = ('elts', 'ctx')
 
@@ -591,6 +660,7 @@ class Tuple(expr):
 
 
 class Const(expr):
+    __slots__ = ('obj',)
     _fields = ('obj',)
 
     def __init__(self, obj, lineno, col_offset):
@@ -599,36 +669,57 @@ class Const(expr):
 
 
 class expr_context(AST):
-    pass
+    __slots__ = ()
+
+    def __repr__(self):
+        return type(self).__name__
+
+    def __reduce__(self):
+        return type(self).__name__
+
 
 class Load(expr_context):
-    pass
+    __slots__ = ()
+
+Load = Load()
 
 
 class Store(expr_context):
-    pass
+    __slots__ = ()
+
+Store = Store()
 
 
 class Del(expr_context):
-    pass
+    __slots__ = ()
+
+Del = Del()
 
 
 class AugLoad(expr_context):
-    pass
+    __slots__ = ()
+
+AugLoad = AugLoad()
 
 
 class AugStore(expr_context):
-    pass
+    __slots__ = ()
+
+AugStore = AugStore()
 
 
 class Param(expr_context):
-    pass
+    __slots__ = ()
+
+Param = Param()
 
 
 class slice(AST):
-    pass
+    __slots__ = ()
+
 
 class Slice(slice):
+    __slots__ = ('lower', 'upper', 'step')
     _fields = ('lower', 'upper', 'step')
 
     def __init__(self, lower, upper, step):
@@ -638,6 +729,7 @@ class Slice(slice):
 
 
 class ExtSlice(slice):
+    __slots__ = ('dims',)
     _fields = ('dims',)
 
     def __init__(self, dims):
@@ -645,6 +737,7 @@ class ExtSlice(slice):
 
 
 class Index(slice):
+    __slots__ = ('value',)
     _fields = ('value',)
 
     def __init__(self, value):
@@ -652,134 +745,221 @@ class Index(slice):
 
 
 class boolop(AST):
-    pass
+    __slots__ = ()
+
+    def __repr__(self):
+        return type(self).__name__
+
+    def __reduce__(self):
+        return type(self).__name__
+
 
 class And(boolop):
-    pass
+    __slots__ = ()
+
+And = And()
 
 
 class Or(boolop):
-    pass
+    __slots__ = ()
+
+Or = Or()
 
 
 class operator(AST):
-    pass
+    __slots__ = ()
+
+    def __repr__(self):
+        return type(self).__name__
+
+    def __reduce__(self):
+        return type(self).__name__
+
 
 class Add(operator):
-    pass
+    __slots__ = ()
+
+Add = Add()
 
 
 class Sub(operator):
-    pass
+    __slots__ = ()
+
+Sub = Sub()
 
 
 class Mult(operator):
-    pass
+    __slots__ = ()
+
+Mult = Mult()
 
 
 class MatMult(operator):
-    pass
+    __slots__ = ()
+
+MatMult = MatMult()
 
 
 class Div(operator):
-    pass
+    __slots__ = ()
+
+Div = Div()
 
 
 class Mod(operator):
-    pass
+    __slots__ = ()
+
+Mod = Mod()
 
 
 class Pow(operator):
-    pass
+    __slots__ = ()
+
+Pow = Pow()
 
 
 class LShift(operator):
-    pass
+    __slots__ = ()
+
+LShift = LShift()
 
 
 class RShift(operator):
-    pass
+    __slots__ = ()
+
+RShift = RShift()
 
 
 class BitOr(operator):
-    pass
+    __slots__ = ()
+
+BitOr = BitOr()
 
 
 class BitXor(operator):
-    pass
+    __slots__ = ()
+
+BitXor = BitXor()
 
 
 class BitAnd(operator):
-    pass
+    __slots__ = ()
+
+BitAnd = BitAnd()
 
 
 class FloorDiv(operator):
-    pass
+    __slots__ = ()
+
+FloorDiv = FloorDiv()
 
 
 class unaryop(AST):
-    pass
+    __slots__ = ()
+
+    def __repr__(self):
+        return type(self).__name__
+
+    def __reduce__(self):
+        return type(self).__name__
+
 
 class Invert(unaryop):
-    pass
+    __slots__ = ()
+
+Invert = Invert()
 
 
 class Not(unaryop):
-    pass
+    __slots__ = ()
+
+Not = Not()
 
 
 class UAdd(unaryop):
-    pass
+    __slots__ = ()
+
+UAdd = UAdd()
 
 
 class USub(unaryop):
-    pass
+    __slots__ = ()
+
+USub = USub()
 
 
 class cmpop(AST):
-    pass
+    __slots__ = ()
+
+    def __repr__(self):
+        return type(self).__name__
+
+    def __reduce__(self):
+        return type(self).__name__
+
 
 class Eq(cmpop):
-    pass
+    __slots__ = ()
+
+Eq = Eq()
 
 
 class NotEq(cmpop):
-    pass
+    __slots__ = ()
+
+NotEq = NotEq()
 
 
 class Lt(cmpop):
-    pass
+    __slots__ = ()
+
+Lt = Lt()
 
 
 class LtE(cmpop):
-    pass
+    __slots__ = ()
+
+LtE = LtE()
 
 
 class Gt(cmpop):
-    pass
+    __slots__ = ()
+
+Gt = Gt()
 
 
 class GtE(cmpop):
-    pass
+    __slots__ = ()
+
+GtE = GtE()
 
 
 class Is(cmpop):
-    pass
+    __slots__ = ()
+
+Is = Is()
 
 
 class IsNot(cmpop):
-    pass
+    __slots__ = ()
+
+IsNot = IsNot()
 
 
 class In(cmpop):
-    pass
+    __slots__ = ()
+
+In = In()
 
 
 class NotIn(cmpop):
-    pass
+    __slots__ = ()
+
+NotIn = NotIn()
 
 
 class comprehension(AST):
+    __slots__ = ('target', 'iter', 'ifs')
     _fields = ('target', 'iter', 'ifs')
 
     def __init__(self, target, iter, ifs):
@@ -789,11 +969,15 @@ class comprehension(AST):
 
 
 class excepthandler(AST):
+    __slots__ = ('lineno', 'col_offset')
+
     def __init__(self, lineno, col_offset):
         self.lineno = lineno
         self.col_offset = col_offset
 
+
 class ExceptHandler(excepthandler):
+    __slots__ = ('type', 'name', 'body')
     _fields = ('type', 'name', 'body')
 
     def __init__(self, type, name, body, lineno, col_offset):
@@ -804,6 +988,7 @@ class ExceptHandler(excepthandler):
 
 
 class arguments(AST):
+    __slots__ = ('args', 'vararg', 'kwonlyargs', 'kw_defaults', 'kwarg', 'defaults')
     _fields = ('args', 'vararg', 'kwonlyargs', 'kw_defaults', 'kwarg', 'defaults')
 
     def __init__(self, args, vararg, kwonlyargs, kw_defaults, kwarg, defaults):
@@ -816,6 +1001,7 @@ class arguments(AST):
 
 
 class arg(AST):
+    __slots__ = ('arg', 'annotation', 'lineno', 'col_offset')
     _fields = ('arg', 'annotation')
 
     def __init__(self, arg, annotation, lineno, col_offset):
@@ -826,6 +1012,7 @@ class arg(AST):
 
 
 class keyword(AST):
+    __slots__ = ('arg', 'value')
     _fields = ('arg', 'value')
 
     def __init__(self, arg, value):
@@ -834,6 +1021,7 @@ class keyword(AST):
 
 
 class alias(AST):
+    __slots__ = ('name', 'asname')
     _fields = ('name', 'asname')
 
     def __init__(self, name, asname):
@@ -842,6 +1030,7 @@ class alias(AST):
 
 
 class withitem(AST):
+    __slots__ = ('context_expr', 'optional_vars')
     _fields = ('context_expr', 'optional_vars')
 
     def __init__(self, context_expr, optional_vars):
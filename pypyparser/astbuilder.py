@@ -53,14 +53,7 @@ class ASTBuilder:
                 stmt = n.get_child(i)
                 if stmt.type == Token.NEWLINE:
                     continue
-                sub_stmts_count = self.number_of_statements(stmt)
-                if sub_stmts_count == 1:
-                    stmts.append(self.handle_stmt(stmt))
-                else:
-                    stmt = stmt.get_child(0)
-                    for j in range(sub_stmts_count):
-                        small_stmt = stmt.get_child(j * 2)
-                        stmts.append(self.handle_stmt(small_stmt))
+                self.add_statements(stmt, stmts)
             return ast.Module(stmts)
         elif n.type == self.syms.eval_input:
             body = self.handle_testlist(n.get_child(0))
@@ -85,6 +78,17 @@ class ASTBuilder:
         else:
             raise AssertionError("unknown root node")
 
+    def add_statements(self, stmt, stmts):
+        """Append the AST statements of a stmt node to the list stmts."""
+        sub_stmts_count = self.number_of_statements(stmt)
+        if sub_stmts_count == 1:
+            stmts.append(self.handle_stmt(stmt))
+        else:
+            stmt = stmt.get_child(0)
+            for j in range(sub_stmts_count):
+                small_stmt = stmt.get_child(j * 2)
+                stmts.append(self.handle_stmt(small_stmt))
+
     def number_of_statements(self, n):
         """Compute the number of AST statements contained in a node."""
         stmt_type = n.type
@@ -843,6 +847,15 @@ class ASTBuilder:
                 return self.handle_factor(expr_node)
             elif expr_node_type == self.syms.power:
                 return self.handle_power(expr_node)
+            # The following nodes are only seen directly in compact trees,
+            # where the pass-through nodes above them are left out.
+            elif expr_node_type == self.syms.atom_expr:
+                return self.handle_atom_expr(expr_node)
+            elif expr_node_type == self.syms.atom:
+                return self.handle_atom(expr_node)
+            elif expr_node_type == self.syms.lambdef or \
+                    expr_node_type == self.syms.lambdef_nocond:
+                return self.handle_lambdef(expr_node)
             else:
                 raise AssertionError("unknown expr")
 
@@ -959,40 +972,40 @@ class ASTBuilder:
             return atom_expr
 
     def handle_power(self, power_node):
-        atom_expr = self.handle_atom_expr(power_node.get_child(0))
+        atom_expr = self.handle_expr(power_node.get_child(0))
         if power_node.num_children() == 1:
             return atom_expr
-        if power_node.get_child(-1).type == self.syms.factor:
-            right = self.handle_expr(power_node.get_child(-1))
-            atom_expr = ast.BinOp(atom_expr, ast.Pow, right, power_node.get_lineno(),
-                                  power_node.get_column())
+        right = self.handle_expr(power_node.get_child(-1))
+        atom_expr = ast.BinOp(atom_expr, ast.Pow, right, power_node.get_lineno(),
+                              power_node.get_column())
         return atom_expr
 
     def handle_slice(self, slice_node):
+        # subscript: test | [test] ':' [test] [sliceop]
+        # The tests are recognized by elimination, as they are not test nodes
+        # in compact trees.
         first_child = slice_node.get_child(0)
-        if slice_node.num_children() == 1 and first_child.type == self.syms.test:
+        if slice_node.num_children() == 1 and first_child.type != Token.COLON:
             index = self.handle_expr(first_child)
             return ast.Index(index)
         lower = None
         upper = None
         step = None
-        if first_child.type == self.syms.test:
+        if first_child.type != Token.COLON:
             lower = self.handle_expr(first_child)
         if first_child.type == Token.COLON:
             if slice_node.num_children() > 1:
                 second_child = slice_node.get_child(1)
-                if second_child.type == self.syms.test:
+                if second_child.type != self.syms.sliceop:
                     upper = self.handle_expr(second_child)
         elif slice_node.num_children() > 2:
             third_child = slice_node.get_child(2)
-            if third_child.type == self.syms.test:
+            if third_child.type != self.syms.sliceop:
                 upper = self.handle_expr(third_child)
         last_child = slice_node.get_child(-1)
         if last_child.type == self.syms.sliceop:
             if last_child.num_children() != 1:
-                step_child = last_child.get_child(1)
-                if step_child.type == self.syms.test:
-                    step = self.handle_expr(step_child)
+                step = self.handle_expr(last_child.get_child(1))
         return ast.Slice(lower, upper, step)
 
     def handle_trailer(self, trailer_node, left_expr):
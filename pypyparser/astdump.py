@@ -0,0 +1,170 @@
+"""Compact serialization of ASTs.
+
+dump() turns a tree of ast.py nodes into bytes and load() rebuilds it.  The
+tree is stored as a flat array of integers plus a table of constants, with
+no recursion in either direction, so that deep trees (long chains of binary
+operators, say) can be transferred where pickle would exceed the recursion
+limit.
+
+The array holds one record per node and per list, as 32-bit integers when
+they are small enough:
+
+* a node is its type code, followed by the values of its fields and
+  attributes (see node_slots());
+* a list is `-1 - length`, followed by the values of its items.
+
+A value is an integer whose two low bits are a tag:
+
+* NODE: the rest is the offset of the node record in the array;
+* CONSTANT: the rest is an index in the table of constants, which holds
+  each distinct identifier, string, number, None or bool once;
+* LIST: the rest is the offset of the list record in the array;
+* SHARED: the rest is the type code of a shared instance, like ast.Load.
+
+Records always come after the record that refers to them, the first one
+being the root of the tree.
+"""
+
+import array
+import marshal
+
+from . import ast
+
+
+FORMAT_VERSION = 1
+
+NODE = 0
+CONSTANT = 1
+LIST = 2
+SHARED = 3
+
+
+def _node_classes():
+    classes = []
+    for value in vars(ast).values():
+        if not isinstance(value, type):
+            value = type(value)
+        if issubclass(value, ast.AST) and value not in classes:
+            classes.append(value)
+    return classes
+
+NODE_CLASSES = _node_classes()
+TYPE_CODES = dict((cls, code) for code, cls in enumerate(NODE_CLASSES))
+SHARED_INSTANCES = frozenset(
+    value for value in vars(ast).values()
+    if isinstance(value, ast.AST) and not isinstance(value, type))
+
+
+def node_slots(cls):
+    """Return the names of the fields and attributes of a node class."""
+    names = []
+    for base in reversed(cls.__mro__):
+        names.extend(base.__dict__.get("__slots__", ()))
+    return tuple(names)
+
+SLOTS = [node_slots(cls) for cls in NODE_CLASSES]
+
+
+def type_code(cls):
+    """Return the type code of a node class, or of the node class it is a
+    subclass of, like the lazy functions of lazyfunctions.py."""
+    try:
+        return TYPE_CODES[cls]
+    except KeyError:
+        for base in cls.__mro__:
+            if base in TYPE_CODES:
+                TYPE_CODES[cls] = TYPE_CODES[base]
+                return TYPE_CODES[base]
+        raise
+
+
+def dump(tree):
+    """Serialize the AST `tree` to bytes."""
+    data = array.array("q", [0])
+    constants = []
+    constant_indexes = {}
+    # nodes and lists still to write, with the position of their reference
+    todo = []
+
+    def encode(value, position):
+        if isinstance(value, ast.AST):
+            if value in SHARED_INSTANCES:
+                return TYPE_CODES[type(value)] << 2 | SHARED
+        elif not isinstance(value, list):
+            # type() is part of the key so that 1, 1.0 and True, which are
+            # equal, are kept apart, and so is repr() for 0.0 and -0.0
+            if isinstance(value, (float, complex)):
+                key = (type(value), repr(value))
+            else:
+                key = (type(value), value)
+            index = constant_indexes.get(key, -1)
+            if index < 0:
+                index = len(constants)
+                constant_indexes[key] = index
+                constants.append(value)
+            return index << 2 | CONSTANT
+        todo.append((value, position))
+        return 0
+
+    data[0] = encode(tree, 0)
+    while todo:
+        value, position = todo.pop()
+        start = len(data) + 1
+        if isinstance(value, list):
+            data[position] = (start - 1) << 2 | LIST
+            data.append(-1 - len(value))
+            data.extend([encode(item, start + i)
+                         for i, item in enumerate(value)])
+        else:
+            data[position] = (start - 1) << 2 | NODE
+            code = type_code(type(value))
+            data.append(code)
+            data.extend([encode(getattr(value, name), start + i)
+                         for i, name in enumerate(SLOTS[code])])
+    if -2**31 <= min(data) and max(data) < 2**31:
+        data = array.array("i", data)
+    return marshal.dumps((FORMAT_VERSION, data.typecode, data.tobytes(),
+                          constants))
+
+
+def load(dumped):
+    """Rebuild an AST from the bytes returned by dump()."""
+    version, typecode, data_bytes, constants = marshal.loads(dumped)
+    if version != FORMAT_VERSION:
+        raise ValueError("unsupported AST dump format %r" % (version,))
+    data = array.array(typecode)
+    data.frombytes(data_bytes)
+    shared = [getattr(ast, cls.__name__) for cls in NODE_CLASSES]
+    # create all the nodes and lists, then fill them in
+    objects = {}
+    offset = 1
+    end = len(data)
+    while offset < end:
+        header = data[offset]
+        if header >= 0:
+            cls = NODE_CLASSES[header]
+            objects[offset] = cls.__new__(cls)
+            offset += 1 + len(SLOTS[header])
+        else:
+            length = -1 - header
+            objects[offset] = [None] * length
+            offset += 1 + length
+
+    def decode(value):
+        tag = value & 3
+        if tag == CONSTANT:
+            return constants[value >> 2]
+        if tag == SHARED:
+            return shared[value >> 2]
+        return objects[value >> 2]
+
+    for offset, obj in objects.items():
+        if isinstance(obj, list):
+            obj[:] = [decode(value)
+                      for value in data[offset + 1:offset + 1 + len(obj)]]
+        else:
+            slots = SLOTS[data[offset]]
+            values = data[offset + 1:offset + 1 + len(slots)]
+            for i in range(len(slots)):
+                setattr(obj, slots[i], decode(values[i]))
+    return decode(data[0])
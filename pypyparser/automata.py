@@ -15,67 +15,81 @@ $Id: automata.py,v 1.2 2003/10/02 17:37:17 jriehl Exp $
 
 # PYPY Modification: DEFAULT is a singleton, used only in the pre-RPython
 # dicts (see pytokenize.py).  Then DFA.__init__() turns these dicts into
-# more compact strings.
+# more compact tables.
 DEFAULT = object()
 
 # PYPY Modification : removed all automata functions (any, maybe,
 #                     newArcPair, etc.)
 
-ERROR_STATE = chr(255)
+ERROR_STATE = 255
+
+# Characters above NON_ASCII are looked up as NON_ASCII by DFA.recognize()
+# and as DEFAULT by NonGreedyDFA.recognize().
+NON_ASCII = 0x80
 
 class DFA:
+    """A deterministic automaton over characters.
+
+    The characters which lead to the same state from every state are in
+    the same class.  `class_map` gives the class of the characters up to
+    NON_ASCII, class 0 being the one of the characters without a
+    transition of their own (DEFAULT), and `transitions` holds the next
+    state for every state and class, at `state * num_classes + class`.
+    Python source needs a few dozen classes, instead of a column for each
+    character.
+    """
+
     # ____________________________________________________________
     def __init__(self, states, accepts, start = 0):
         """ NOT_RPYTHON """
         assert len(states) < 255 # no support for huge amounts of states
-        # construct string for looking up state transitions
-        string_states = [] * len(states)
         # compute maximum
-        maximum = 0
+        maximum = NON_ASCII
         for state in states:
             for key in state:
-                if key == DEFAULT:
-                    continue
-                maximum = max(ord(key), maximum)
-        self.max_char = maximum + 1
-
-        defaults = []
-        for i, state in enumerate(states):
-            default = ERROR_STATE
-            if DEFAULT in state:
-                default = chr(state[DEFAULT])
-            defaults.append(default)
-            string_state = [default] * self.max_char
-            for key, value in state.items():
                 if key == DEFAULT:
                     continue
                 assert len(key) == 1
-                assert ord(key) < self.max_char
-                string_state[ord(key)] = chr(value)
-            string_states.extend(string_state)
-        self.states = "".join(string_states)
-        self.defaults = "".join(defaults)
+                maximum = max(ord(key), maximum)
+        defaults = tuple(state.get(DEFAULT, ERROR_STATE) for state in states)
+        # the column of next states of every character, the characters with
+        # the same column make a class
+        columns = {defaults: 0}
+        class_columns = [defaults]
+        class_map = []
+        for code in range(maximum + 1):
+            char = chr(code)
+            column = tuple(state.get(char, default)
+                           for state, default in zip(states, defaults))
+            if column not in columns:
+                columns[column] = len(class_columns)
+                class_columns.append(column)
+            class_map.append(columns[column])
+        assert len(class_columns) <= 256
+        self.num_classes = len(class_columns)
+        self.class_map = bytes(class_map)
+        self.transitions = bytes(column[state]
+                                 for state in range(len(states))
+                                 for column in class_columns)
         self.accepts = accepts
         self.start = start
 
     # ____________________________________________________________
 
-    def _next_state(self, item, crntState):
-        if ord(item) >= self.max_char:
-            return self.defaults[crntState]
-        else:
-            return self.states[crntState * self.max_char + ord(item)]
-
     def recognize(self, inVec, pos = 0):
+        class_map = self.class_map
+        transitions = self.transitions
+        num_classes = self.num_classes
+        accepts = self.accepts
         crntState = self.start
         lastAccept = False
         i = pos
         for i in range(pos, len(inVec)):
-            item = inVec[i]
-            if ord(item) > 0x80:
-                item = "\x80"  # NON_ASCII
-            accept = self.accepts[crntState]
-            crntState = self._next_state(item, crntState)
+            code = ord(inVec[i])
+            if code > NON_ASCII:
+                code = NON_ASCII
+            accept = accepts[crntState]
+            crntState = transitions[crntState * num_classes + class_map[code]]
             if crntState != ERROR_STATE:
                 pass
             elif accept:
@@ -86,10 +100,8 @@ class DFA:
                 return i - 1
             else:
                 return -1
-            crntState = ord(crntState)
             lastAccept = accept
-        # if self.states[crntState][1]:
-        if self.accepts[crntState]:
+        if accepts[crntState]:
             return i + 1
         elif lastAccept:
             return i
@@ -101,19 +113,25 @@ class DFA:
 class NonGreedyDFA (DFA):
 
     def recognize(self, inVec, pos = 0):
+        class_map = self.class_map
+        transitions = self.transitions
+        num_classes = self.num_classes
+        accepts = self.accepts
         crntState = self.start
         i = pos
         for i in range(pos, len(inVec)):
-            item = inVec[i]
-            accept = self.accepts[crntState]
-            if accept:
+            if accepts[crntState]:
                 return i
-            crntState = self._next_state(item, crntState)
+            code = ord(inVec[i])
+            if code > NON_ASCII:
+                char_class = 0
+            else:
+                char_class = class_map[code]
+            crntState = transitions[crntState * num_classes + char_class]
             if crntState == ERROR_STATE:
                 return -1
-            crntState = ord(crntState)
             i += 1
-        if self.accepts[crntState]:
+        if accepts[crntState]:
             return i
         else:
             return -1
@@ -1,5 +1,7 @@
+import itertools
 from . import stdlib___future__ as future
 from .pytoken import Token
+from .pytokenizer import TokenBuffer
 
 
 class FutureFlags:
@@ -39,15 +41,40 @@ FUTURE_FLAGS = {
 
 
 class TokenIterator:
+    """Walk over a stream of tokens, remembering the ones already seen.
+
+    Only the prefix that is actually looked at is kept, so the stream can be
+    a lazy token generator; replay() gives back the complete stream.  A
+    pytokenizer.TokenBuffer is walked by index instead, without copying
+    its tokens.
+    """
+
     def __init__(self, tokens):
-        self.tokens = tokens
-        self.index = 0
+        if isinstance(tokens, TokenBuffer):
+            self.buffer = tokens
+            self.tokens = None
+        else:
+            self.buffer = None
+            self.tokens = iter(tokens)
+        self.index = -1
+        self.seen = []
         self.next()
 
     def next(self):
-        index = self.index
-        self.index = index + 1
-        self.tok = self.tokens[index]
+        self.index += 1
+        if self.buffer is not None:
+            if self.index >= len(self.buffer):
+                raise StopIteration
+            self.tok = self.buffer[self.index]
+        else:
+            self.tok = next(self.tokens)
+            self.seen.append(self.tok)
+
+    def replay(self):
+        """Return an iterator over all the tokens, including the seen ones."""
+        if self.buffer is not None:
+            return iter(self.buffer)
+        return itertools.chain(self.seen, self.tokens)
 
     def skip(self, n):
         if self.tok[0] == n:
@@ -79,7 +106,15 @@ class TokenIterator:
 
 
 def add_future_flags(future_flags, tokens):
-    it = TokenIterator(tokens)
+    """Compute the flags of the __future__ imports at the start of `tokens`.
+
+    `tokens` is either a sequence of tokens or a TokenIterator; pass the
+    latter to keep using a lazy token stream afterwards.
+    """
+    if isinstance(tokens, TokenIterator):
+        it = tokens
+    else:
+        it = TokenIterator(tokens)
     result = 0
     last_position = (0, 0)
     #
@@ -0,0 +1,56 @@
+"""Module gengrammar
+
+Compiles the grammars in the data directory to Python modules, so that
+pygram can load the parser tables without running the parser generator.
+
+To regenerate the tables after changing a grammar, run::
+
+    $ python -m pypyparser.gengrammar
+
+Each generated module records a hash of the grammar it was built from;
+pygram falls back to the parser generator when the hash does not match.
+"""
+
+import os
+import pprint
+
+from . import metaparser, pygram
+
+TABLES = ("symbol_ids", "symbol_to_label", "keyword_ids", "labels",
+          "token_ids", "start", "dfas")
+
+HERE = os.path.dirname(__file__)
+
+
+def output(filename, gram_source):
+    gram = metaparser.ParserGenerator(gram_source).build_grammar(
+        pygram.PythonGrammar)
+    lines = [
+        "# THIS FILE IS AUTOMATICALLY GENERATED BY gengrammar.py\n",
+        "# DO NOT EDIT\n",
+        "# TO REGENERATE THE FILE, RUN:\n",
+        "#     python -m pypyparser.gengrammar\n",
+        "\n",
+        "SOURCE = %r\n" % (filename,),
+        "SOURCE_HASH = %r\n" % (pygram.source_hash(gram_source),),
+    ]
+    for name in TABLES:
+        lines.append("\n%s = %s\n" % (name, pprint.pformat(getattr(gram, name))))
+    return "".join(lines)
+
+
+def main():
+    for filename in sorted(os.listdir(os.path.join(HERE, "data"))):
+        if not filename.startswith("Grammar"):
+            continue
+        with open(os.path.join(HERE, "data", filename)) as fp:
+            gram_source = fp.read()
+        out = os.path.join(HERE, "grammar_generated",
+                           pygram.generated_module_name(filename) + ".py")
+        with open(out, "w") as fp:
+            fp.write(output(filename, gram_source))
+        print("wrote %s" % (out,))
+
+
+if __name__ == "__main__":
+    main()
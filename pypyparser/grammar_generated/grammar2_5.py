@@ -0,0 +1,1283 @@
+# THIS FILE IS AUTOMATICALLY GENERATED BY gengrammar.py
+# DO NOT EDIT
+# TO REGENERATE THE FILE, RUN:
+#     python -m pypyparser.gengrammar
+
+SOURCE = 'Grammar2.5'
+SOURCE_HASH = '8556b9fc49658d1a41b71391517e3df8642ffd73'
+
+symbol_ids = {'and_expr': 257,
+ 'and_test': 258,
+ 'arglist': 259,
+ 'argument': 260,
+ 'arith_expr': 261,
+ 'assert_stmt': 262,
+ 'atom': 263,
+ 'augassign': 264,
+ 'break_stmt': 265,
+ 'classdef': 266,
+ 'comp_op': 267,
+ 'comparison': 268,
+ 'compound_stmt': 269,
+ 'continue_stmt': 270,
+ 'decorator': 271,
+ 'decorators': 272,
+ 'del_stmt': 273,
+ 'dictmaker': 274,
+ 'dotted_as_name': 275,
+ 'dotted_as_names': 276,
+ 'dotted_name': 277,
+ 'encoding_decl': 278,
+ 'eval_input': 279,
+ 'except_clause': 280,
+ 'exec_stmt': 281,
+ 'expr': 282,
+ 'expr_stmt': 283,
+ 'exprlist': 284,
+ 'factor': 285,
+ 'file_input': 286,
+ 'flow_stmt': 287,
+ 'for_stmt': 288,
+ 'fpdef': 289,
+ 'fplist': 290,
+ 'funcdef': 291,
+ 'gen_for': 292,
+ 'gen_if': 293,
+ 'gen_iter': 294,
+ 'global_stmt': 295,
+ 'if_stmt': 296,
+ 'import_as_name': 297,
+ 'import_as_names': 298,
+ 'import_from': 299,
+ 'import_name': 300,
+ 'import_stmt': 301,
+ 'lambdef': 302,
+ 'list_for': 303,
+ 'list_if': 304,
+ 'list_iter': 305,
+ 'listmaker': 306,
+ 'not_test': 307,
+ 'old_lambdef': 308,
+ 'old_test': 309,
+ 'or_test': 310,
+ 'parameters': 311,
+ 'pass_stmt': 312,
+ 'power': 313,
+ 'print_stmt': 314,
+ 'raise_stmt': 315,
+ 'return_stmt': 316,
+ 'shift_expr': 317,
+ 'simple_stmt': 318,
+ 'single_input': 256,
+ 'sliceop': 319,
+ 'small_stmt': 320,
+ 'stmt': 321,
+ 'subscript': 322,
+ 'subscriptlist': 323,
+ 'suite': 324,
+ 'term': 325,
+ 'test': 326,
+ 'testlist': 327,
+ 'testlist1': 328,
+ 'testlist_gexp': 329,
+ 'testlist_safe': 330,
+ 'trailer': 331,
+ 'try_stmt': 332,
+ 'varargslist': 333,
+ 'while_stmt': 334,
+ 'with_stmt': 335,
+ 'with_var': 336,
+ 'xor_expr': 337,
+ 'yield_expr': 338,
+ 'yield_stmt': 339}
+
+symbol_to_label = {'and_expr': 161,
+ 'and_test': 131,
+ 'arglist': 90,
+ 'argument': 41,
+ 'arith_expr': 136,
+ 'assert_stmt': 148,
+ 'atom': 133,
+ 'augassign': 100,
+ 'break_stmt': 104,
+ 'classdef': 88,
+ 'comp_op': 81,
+ 'comparison': 129,
+ 'compound_stmt': 3,
+ 'continue_stmt': 105,
+ 'decorator': 91,
+ 'decorators': 112,
+ 'del_stmt': 142,
+ 'dictmaker': 54,
+ 'dotted_as_name': 94,
+ 'dotted_as_names': 121,
+ 'dotted_name': 89,
+ 'except_clause': 158,
+ 'exec_stmt': 147,
+ 'expr': 80,
+ 'expr_stmt': 140,
+ 'exprlist': 92,
+ 'factor': 102,
+ 'flow_stmt': 144,
+ 'for_stmt': 84,
+ 'fpdef': 111,
+ 'fplist': 110,
+ 'funcdef': 87,
+ 'gen_for': 46,
+ 'gen_if': 117,
+ 'gen_iter': 115,
+ 'global_stmt': 146,
+ 'if_stmt': 82,
+ 'import_as_name': 119,
+ 'import_as_names': 120,
+ 'import_from': 123,
+ 'import_name': 122,
+ 'import_stmt': 145,
+ 'lambdef': 156,
+ 'list_for': 127,
+ 'list_if': 128,
+ 'list_iter': 126,
+ 'listmaker': 52,
+ 'not_test': 39,
+ 'old_lambdef': 130,
+ 'old_test': 116,
+ 'or_test': 114,
+ 'parameters': 113,
+ 'pass_stmt': 143,
+ 'power': 101,
+ 'print_stmt': 141,
+ 'raise_stmt': 107,
+ 'return_stmt': 106,
+ 'shift_expr': 37,
+ 'simple_stmt': 2,
+ 'sliceop': 149,
+ 'small_stmt': 138,
+ 'stmt': 103,
+ 'subscript': 150,
+ 'subscriptlist': 157,
+ 'suite': 71,
+ 'term': 48,
+ 'test': 45,
+ 'testlist': 70,
+ 'testlist1': 56,
+ 'testlist_gexp': 50,
+ 'testlist_safe': 125,
+ 'trailer': 134,
+ 'try_stmt': 85,
+ 'varargslist': 124,
+ 'while_stmt': 83,
+ 'with_stmt': 86,
+ 'with_var': 160,
+ 'xor_expr': 98,
+ 'yield_expr': 49,
+ 'yield_stmt': 108}
+
+keyword_ids = {'and': 40,
+ 'as': 93,
+ 'assert': 10,
+ 'break': 11,
+ 'class': 12,
+ 'continue': 13,
+ 'def': 14,
+ 'del': 15,
+ 'elif': 118,
+ 'else': 109,
+ 'except': 97,
+ 'exec': 16,
+ 'finally': 159,
+ 'for': 17,
+ 'from': 18,
+ 'global': 19,
+ 'if': 20,
+ 'import': 21,
+ 'in': 78,
+ 'is': 79,
+ 'lambda': 22,
+ 'not': 23,
+ 'or': 132,
+ 'pass': 24,
+ 'print': 25,
+ 'raise': 26,
+ 'return': 27,
+ 'try': 28,
+ 'while': 29,
+ 'with': 30,
+ 'yield': 31}
+
+labels = [0,
+ 5,
+ 318,
+ 269,
+ 8,
+ 15,
+ 16,
+ 51,
+ 10,
+ 26,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 27,
+ 33,
+ 2,
+ 3,
+ 4,
+ 317,
+ 20,
+ 307,
+ 2,
+ 260,
+ 17,
+ 37,
+ 13,
+ 326,
+ 292,
+ 23,
+ 325,
+ 338,
+ 329,
+ 9,
+ 306,
+ 11,
+ 274,
+ 28,
+ 328,
+ 38,
+ 39,
+ 40,
+ 41,
+ 42,
+ 43,
+ 44,
+ 45,
+ 46,
+ 47,
+ 48,
+ 50,
+ 12,
+ 327,
+ 324,
+ 21,
+ 22,
+ 29,
+ 32,
+ 31,
+ 30,
+ 2,
+ 2,
+ 282,
+ 267,
+ 296,
+ 334,
+ 288,
+ 332,
+ 335,
+ 291,
+ 266,
+ 277,
+ 259,
+ 271,
+ 284,
+ 2,
+ 275,
+ 24,
+ 1,
+ 2,
+ 337,
+ 19,
+ 264,
+ 313,
+ 285,
+ 321,
+ 265,
+ 270,
+ 316,
+ 315,
+ 339,
+ 2,
+ 290,
+ 289,
+ 272,
+ 311,
+ 310,
+ 294,
+ 309,
+ 293,
+ 2,
+ 297,
+ 298,
+ 276,
+ 300,
+ 299,
+ 333,
+ 330,
+ 305,
+ 303,
+ 304,
+ 268,
+ 308,
+ 258,
+ 2,
+ 263,
+ 331,
+ 36,
+ 261,
+ 35,
+ 320,
+ 14,
+ 283,
+ 314,
+ 273,
+ 312,
+ 287,
+ 301,
+ 295,
+ 281,
+ 262,
+ 319,
+ 322,
+ 6,
+ 7,
+ 18,
+ 25,
+ 49,
+ 302,
+ 323,
+ 280,
+ 2,
+ 336,
+ 257,
+ 34]
+
+token_ids = {1: 96,
+ 2: 34,
+ 3: 35,
+ 4: 36,
+ 5: 1,
+ 6: 151,
+ 7: 152,
+ 8: 4,
+ 9: 51,
+ 10: 8,
+ 11: 53,
+ 12: 69,
+ 13: 44,
+ 14: 139,
+ 15: 5,
+ 16: 6,
+ 17: 42,
+ 18: 153,
+ 19: 99,
+ 20: 38,
+ 21: 72,
+ 22: 73,
+ 23: 47,
+ 24: 95,
+ 25: 154,
+ 26: 9,
+ 27: 32,
+ 28: 55,
+ 29: 74,
+ 30: 77,
+ 31: 76,
+ 32: 75,
+ 33: 33,
+ 34: 162,
+ 35: 137,
+ 36: 135,
+ 37: 43,
+ 38: 57,
+ 39: 58,
+ 40: 59,
+ 41: 60,
+ 42: 61,
+ 43: 62,
+ 44: 63,
+ 45: 64,
+ 46: 65,
+ 47: 66,
+ 48: 67,
+ 49: 155,
+ 50: 68,
+ 51: 7}
+
+start = 256
+
+dfas = [([([(1, 1), (2, 1), (3, 2)], False), ([], True), ([(1, 1)], False)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(37, 1)], False), ([(38, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(39, 1)], False), ([(40, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(41, 1), (42, 2), (43, 3)], False),
+   ([(44, 4)], True),
+   ([(45, 5)], False),
+   ([(45, 6)], False),
+   ([(41, 1), (42, 2), (43, 3)], True),
+   ([(44, 7)], True),
+   ([], True),
+   ([(43, 3)], False)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   42: None,
+   43: None}),
+ ([([(45, 1)], False),
+   ([(46, 2), (47, 3)], True),
+   ([], True),
+   ([(45, 2)], False)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(48, 1)], False), ([(5, 0), (6, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(10, 1)], False),
+   ([(45, 2)], False),
+   ([(44, 3)], True),
+   ([(45, 4)], False),
+   ([], True)],
+  {10: None}),
+ ([([(4, 1), (8, 2), (32, 3), (9, 4), (34, 5), (35, 5), (36, 6)], False),
+   ([(49, 7), (50, 7), (51, 5)], False),
+   ([(52, 8), (53, 5)], False),
+   ([(54, 9), (55, 5)], False),
+   ([(56, 10)], False),
+   ([], True),
+   ([(36, 6)], True),
+   ([(51, 5)], False),
+   ([(53, 5)], False),
+   ([(55, 5)], False),
+   ([(9, 5)], False)],
+  {4: None, 8: None, 9: None, 32: None, 34: None, 35: None, 36: None}),
+ ([([(57, 1),
+     (58, 1),
+     (59, 1),
+     (60, 1),
+     (61, 1),
+     (62, 1),
+     (63, 1),
+     (64, 1),
+     (65, 1),
+     (66, 1),
+     (67, 1),
+     (68, 1)],
+    False),
+   ([], True)],
+  {57: None,
+   58: None,
+   59: None,
+   60: None,
+   61: None,
+   62: None,
+   63: None,
+   64: None,
+   65: None,
+   66: None,
+   67: None,
+   68: None}),
+ ([([(11, 1)], False), ([], True)], {11: None}),
+ ([([(12, 1)], False),
+   ([(34, 2)], False),
+   ([(4, 3), (69, 4)], False),
+   ([(70, 5), (51, 6)], False),
+   ([(71, 7)], False),
+   ([(51, 6)], False),
+   ([(69, 4)], False),
+   ([], True)],
+  {12: None}),
+ ([([(72, 1),
+     (73, 1),
+     (74, 1),
+     (75, 1),
+     (76, 1),
+     (77, 1),
+     (77, 1),
+     (78, 1),
+     (23, 2),
+     (79, 3)],
+    False),
+   ([], True),
+   ([(78, 1)], False),
+   ([(23, 1)], True)],
+  {23: None,
+   72: None,
+   73: None,
+   74: None,
+   75: None,
+   76: None,
+   77: None,
+   78: None,
+   79: None}),
+ ([([(80, 1)], False), ([(81, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(82, 1), (83, 1), (84, 1), (85, 1), (86, 1), (87, 1), (88, 1)], False),
+   ([], True)],
+  {7: None,
+   12: None,
+   14: None,
+   17: None,
+   20: None,
+   28: None,
+   29: None,
+   30: None}),
+ ([([(13, 1)], False), ([], True)], {13: None}),
+ ([([(7, 1)], False),
+   ([(89, 2)], False),
+   ([(4, 3), (1, 4)], False),
+   ([(90, 5), (51, 6)], False),
+   ([], True),
+   ([(51, 6)], False),
+   ([(1, 4)], False)],
+  {7: None}),
+ ([([(91, 1)], False), ([(91, 1)], True)], {7: None}),
+ ([([(15, 1)], False), ([(92, 2)], False), ([], True)], {15: None}),
+ ([([(45, 1)], False),
+   ([(69, 2)], False),
+   ([(45, 3)], False),
+   ([(44, 4)], True),
+   ([(45, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(89, 1)], False),
+   ([(93, 2), (34, 2)], True),
+   ([(34, 3)], False),
+   ([], True)],
+  {34: None}),
+ ([([(94, 1)], False), ([(44, 0)], True)], {34: None}),
+ ([([(34, 1)], False), ([(95, 0)], True)], {34: None}),
+ ([([(34, 1)], False), ([], True)], {34: None}),
+ ([([(70, 1)], False), ([(1, 1), (96, 2)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(97, 1)], False),
+   ([(45, 2)], True),
+   ([(44, 3)], True),
+   ([(45, 4)], False),
+   ([], True)],
+  {97: None}),
+ ([([(16, 1)], False),
+   ([(80, 2)], False),
+   ([(78, 3)], True),
+   ([(45, 4)], False),
+   ([(44, 5)], True),
+   ([(45, 6)], False),
+   ([], True)],
+  {16: None}),
+ ([([(98, 1)], False), ([(99, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(70, 1)], False),
+   ([(100, 2), (47, 3)], True),
+   ([(49, 4), (70, 4)], False),
+   ([(49, 5), (70, 5)], False),
+   ([], True),
+   ([(47, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(80, 1)], False), ([(44, 2)], True), ([(80, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(5, 1), (6, 1), (33, 1), (101, 2)], False),
+   ([(102, 2)], False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(1, 0), (103, 0), (96, 1)], False), ([], True)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   96: None}),
+ ([([(104, 1), (105, 1), (106, 1), (107, 1), (108, 1)], False), ([], True)],
+  {11: None, 13: None, 26: None, 27: None, 31: None}),
+ ([([(17, 1)], False),
+   ([(92, 2)], False),
+   ([(78, 3)], False),
+   ([(70, 4)], False),
+   ([(69, 5)], False),
+   ([(71, 6)], False),
+   ([(109, 7)], True),
+   ([(69, 8)], False),
+   ([(71, 9)], False),
+   ([], True)],
+  {17: None}),
+ ([([(34, 1), (4, 2)], False),
+   ([], True),
+   ([(110, 3)], False),
+   ([(51, 1)], False)],
+  {4: None, 34: None}),
+ ([([(111, 1)], False), ([(44, 2)], True), ([(111, 1)], True)],
+  {4: None, 34: None}),
+ ([([(112, 1), (14, 2)], False),
+   ([(14, 2)], False),
+   ([(34, 3)], False),
+   ([(113, 4)], False),
+   ([(69, 5)], False),
+   ([(71, 6)], False),
+   ([], True)],
+  {7: None, 14: None}),
+ ([([(17, 1)], False),
+   ([(92, 2)], False),
+   ([(78, 3)], False),
+   ([(114, 4)], False),
+   ([(115, 5)], True),
+   ([], True)],
+  {17: None}),
+ ([([(20, 1)], False), ([(116, 2)], False), ([(115, 3)], True), ([], True)],
+  {20: None}),
+ ([([(46, 1), (117, 1)], False), ([], True)], {17: None, 20: None}),
+ ([([(19, 1)], False), ([(34, 2)], False), ([(44, 1)], True)], {19: None}),
+ ([([(20, 1)], False),
+   ([(45, 2)], False),
+   ([(69, 3)], False),
+   ([(71, 4)], False),
+   ([(118, 1), (109, 5)], True),
+   ([(69, 6)], False),
+   ([(71, 7)], False),
+   ([], True)],
+  {20: None}),
+ ([([(34, 1)], False),
+   ([(93, 2), (34, 2)], True),
+   ([(34, 3)], False),
+   ([], True)],
+  {34: None}),
+ ([([(119, 1)], False), ([(44, 2)], True), ([(119, 1)], True)], {34: None}),
+ ([([(18, 1)], False),
+   ([(95, 2), (89, 3)], False),
+   ([(95, 2), (89, 3), (21, 4)], False),
+   ([(21, 4)], False),
+   ([(42, 5), (4, 6), (120, 5)], False),
+   ([], True),
+   ([(120, 7)], False),
+   ([(51, 5)], False)],
+  {18: None}),
+ ([([(21, 1)], False), ([(121, 2)], False), ([], True)], {21: None}),
+ ([([(122, 1), (123, 1)], False), ([], True)], {18: None, 21: None}),
+ ([([(22, 1)], False),
+   ([(124, 2), (69, 3)], False),
+   ([(69, 3)], False),
+   ([(45, 4)], False),
+   ([], True)],
+  {22: None}),
+ ([([(17, 1)], False),
+   ([(92, 2)], False),
+   ([(78, 3)], False),
+   ([(125, 4)], False),
+   ([(126, 5)], True),
+   ([], True)],
+  {17: None}),
+ ([([(20, 1)], False), ([(116, 2)], False), ([(126, 3)], True), ([], True)],
+  {20: None}),
+ ([([(127, 1), (128, 1)], False), ([], True)], {17: None, 20: None}),
+ ([([(45, 1)], False),
+   ([(127, 2), (44, 3)], True),
+   ([], True),
+   ([(45, 4)], True),
+   ([(44, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(23, 1), (129, 2)], False), ([(39, 2)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(22, 1)], False),
+   ([(124, 2), (69, 3)], False),
+   ([(69, 3)], False),
+   ([(116, 4)], False),
+   ([], True)],
+  {22: None}),
+ ([([(114, 1), (130, 1)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(131, 1)], False), ([(132, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(4, 1)], False),
+   ([(124, 2), (51, 3)], False),
+   ([(51, 3)], False),
+   ([], True)],
+  {4: None}),
+ ([([(24, 1)], False), ([], True)], {24: None}),
+ ([([(133, 1)], False),
+   ([(134, 1), (43, 2)], True),
+   ([(102, 3)], False),
+   ([], True)],
+  {4: None, 8: None, 9: None, 32: None, 34: None, 35: None, 36: None}),
+ ([([(25, 1)], False),
+   ([(45, 2), (135, 3)], True),
+   ([(44, 4)], True),
+   ([(45, 5)], False),
+   ([(45, 2)], True),
+   ([(44, 6)], True),
+   ([(45, 7)], False),
+   ([(44, 8)], True),
+   ([(45, 7)], True)],
+  {25: None}),
+ ([([(26, 1)], False),
+   ([(45, 2)], True),
+   ([(44, 3)], True),
+   ([(45, 4)], False),
+   ([(44, 5)], True),
+   ([(45, 6)], False),
+   ([], True)],
+  {26: None}),
+ ([([(27, 1)], False), ([(70, 2)], True), ([], True)], {27: None}),
+ ([([(136, 1)], False), ([(137, 0), (135, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(138, 1)], False),
+   ([(139, 2), (1, 3)], False),
+   ([(138, 1), (1, 3)], False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   13: None,
+   15: None,
+   16: None,
+   18: None,
+   19: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(69, 1)], False), ([(45, 2)], True), ([], True)], {69: None}),
+ ([([(140, 1),
+     (141, 1),
+     (142, 1),
+     (143, 1),
+     (144, 1),
+     (145, 1),
+     (146, 1),
+     (147, 1),
+     (148, 1)],
+    False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   13: None,
+   15: None,
+   16: None,
+   18: None,
+   19: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(2, 1), (3, 1)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(95, 1), (45, 2), (69, 3)], False),
+   ([(95, 4)], False),
+   ([(69, 3)], True),
+   ([(45, 5), (149, 6)], True),
+   ([(95, 6)], False),
+   ([(149, 6)], True),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   69: None,
+   95: None}),
+ ([([(150, 1)], False), ([(44, 2)], True), ([(150, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   69: None,
+   95: None}),
+ ([([(2, 1), (1, 2)], False),
+   ([], True),
+   ([(151, 3)], False),
+   ([(103, 4)], False),
+   ([(103, 4), (152, 1)], False)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   13: None,
+   15: None,
+   16: None,
+   18: None,
+   19: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(102, 1)], False), ([(42, 0), (153, 0), (154, 0), (155, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(114, 1), (156, 2)], False),
+   ([(20, 3)], True),
+   ([], True),
+   ([(114, 4)], False),
+   ([(109, 5)], False),
+   ([(45, 2)], False)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(45, 1)], False), ([(44, 2)], True), ([(45, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(45, 1)], False), ([(44, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(45, 1)], False),
+   ([(46, 2), (44, 3)], True),
+   ([], True),
+   ([(45, 4)], True),
+   ([(44, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(116, 1)], False),
+   ([(44, 2)], True),
+   ([(116, 3)], False),
+   ([(44, 4)], True),
+   ([(116, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(4, 1), (8, 2), (95, 3)], False),
+   ([(90, 4), (51, 5)], False),
+   ([(157, 6)], False),
+   ([(34, 5)], False),
+   ([(51, 5)], False),
+   ([], True),
+   ([(53, 5)], False)],
+  {4: None, 8: None, 95: None}),
+ ([([(28, 1)], False),
+   ([(69, 2)], False),
+   ([(71, 3)], False),
+   ([(158, 4), (159, 5)], False),
+   ([(69, 6)], False),
+   ([(69, 7)], False),
+   ([(71, 8)], False),
+   ([(71, 9)], False),
+   ([(158, 4), (109, 10), (159, 5)], True),
+   ([], True),
+   ([(69, 11)], False),
+   ([(71, 12)], False),
+   ([(159, 5)], True)],
+  {28: None}),
+ ([([(111, 1), (42, 2), (43, 3)], False),
+   ([(47, 4), (44, 5)], True),
+   ([(34, 6)], False),
+   ([(34, 7)], False),
+   ([(45, 8)], False),
+   ([(111, 1), (42, 2), (43, 3)], True),
+   ([(44, 9)], True),
+   ([], True),
+   ([(44, 5)], True),
+   ([(43, 3)], False)],
+  {4: None, 34: None, 42: None, 43: None}),
+ ([([(29, 1)], False),
+   ([(45, 2)], False),
+   ([(69, 3)], False),
+   ([(71, 4)], False),
+   ([(109, 5)], True),
+   ([(69, 6)], False),
+   ([(71, 7)], False),
+   ([], True)],
+  {29: None}),
+ ([([(30, 1)], False),
+   ([(45, 2)], False),
+   ([(160, 3), (69, 4)], False),
+   ([(69, 4)], False),
+   ([(71, 5)], False),
+   ([], True)],
+  {30: None}),
+ ([([(93, 1), (34, 1)], False), ([(80, 2)], False), ([], True)],
+  {34: None, 93: None}),
+ ([([(161, 1)], False), ([(162, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(31, 1)], False), ([(70, 2)], True), ([], True)], {31: None}),
+ ([([(49, 1)], False), ([], True)], {31: None})]
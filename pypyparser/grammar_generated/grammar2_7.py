@@ -0,0 +1,1315 @@
+# THIS FILE IS AUTOMATICALLY GENERATED BY gengrammar.py
+# DO NOT EDIT
+# TO REGENERATE THE FILE, RUN:
+#     python -m pypyparser.gengrammar
+
+SOURCE = 'Grammar2.7'
+SOURCE_HASH = 'd5914074e69f9df00dc91f668a4f5ebf50771ea2'
+
+symbol_ids = {'and_expr': 257,
+ 'and_test': 258,
+ 'arglist': 259,
+ 'argument': 260,
+ 'arith_expr': 261,
+ 'assert_stmt': 262,
+ 'atom': 263,
+ 'augassign': 264,
+ 'break_stmt': 265,
+ 'classdef': 266,
+ 'comp_for': 267,
+ 'comp_if': 268,
+ 'comp_iter': 269,
+ 'comp_op': 270,
+ 'comparison': 271,
+ 'compound_stmt': 272,
+ 'continue_stmt': 273,
+ 'decorated': 274,
+ 'decorator': 275,
+ 'decorators': 276,
+ 'del_stmt': 277,
+ 'dictmaker': 278,
+ 'dictorsetmaker': 279,
+ 'dotted_as_name': 280,
+ 'dotted_as_names': 281,
+ 'dotted_name': 282,
+ 'encoding_decl': 283,
+ 'eval_input': 284,
+ 'except_clause': 285,
+ 'exec_stmt': 286,
+ 'expr': 287,
+ 'expr_stmt': 288,
+ 'exprlist': 289,
+ 'factor': 290,
+ 'file_input': 291,
+ 'flow_stmt': 292,
+ 'for_stmt': 293,
+ 'fpdef': 294,
+ 'fplist': 295,
+ 'funcdef': 296,
+ 'global_stmt': 297,
+ 'if_stmt': 298,
+ 'import_as_name': 299,
+ 'import_as_names': 300,
+ 'import_from': 301,
+ 'import_name': 302,
+ 'import_stmt': 303,
+ 'lambdef': 304,
+ 'list_for': 305,
+ 'list_if': 306,
+ 'list_iter': 307,
+ 'listmaker': 308,
+ 'not_test': 309,
+ 'old_lambdef': 310,
+ 'old_test': 311,
+ 'or_test': 312,
+ 'parameters': 313,
+ 'pass_stmt': 314,
+ 'power': 315,
+ 'print_stmt': 316,
+ 'raise_stmt': 317,
+ 'return_stmt': 318,
+ 'shift_expr': 319,
+ 'simple_stmt': 320,
+ 'single_input': 256,
+ 'sliceop': 321,
+ 'small_stmt': 322,
+ 'stmt': 323,
+ 'subscript': 324,
+ 'subscriptlist': 325,
+ 'suite': 326,
+ 'term': 327,
+ 'test': 328,
+ 'testlist': 329,
+ 'testlist1': 330,
+ 'testlist_comp': 331,
+ 'testlist_safe': 332,
+ 'trailer': 333,
+ 'try_stmt': 334,
+ 'varargslist': 335,
+ 'while_stmt': 336,
+ 'with_item': 337,
+ 'with_stmt': 338,
+ 'xor_expr': 339,
+ 'yield_expr': 340,
+ 'yield_stmt': 341}
+
+symbol_to_label = {'and_expr': 162,
+ 'and_test': 132,
+ 'arglist': 97,
+ 'argument': 41,
+ 'arith_expr': 137,
+ 'assert_stmt': 149,
+ 'atom': 134,
+ 'augassign': 106,
+ 'break_stmt': 110,
+ 'classdef': 93,
+ 'comp_for': 46,
+ 'comp_if': 77,
+ 'comp_iter': 75,
+ 'comp_op': 86,
+ 'comparison': 130,
+ 'compound_stmt': 3,
+ 'continue_stmt': 111,
+ 'decorated': 94,
+ 'decorator': 98,
+ 'decorators': 95,
+ 'del_stmt': 143,
+ 'dictorsetmaker': 54,
+ 'dotted_as_name': 100,
+ 'dotted_as_names': 122,
+ 'dotted_name': 96,
+ 'except_clause': 159,
+ 'exec_stmt': 148,
+ 'expr': 85,
+ 'expr_stmt': 141,
+ 'exprlist': 72,
+ 'factor': 108,
+ 'flow_stmt': 145,
+ 'for_stmt': 89,
+ 'fpdef': 117,
+ 'fplist': 116,
+ 'funcdef': 92,
+ 'global_stmt': 147,
+ 'if_stmt': 87,
+ 'import_as_name': 120,
+ 'import_as_names': 121,
+ 'import_from': 124,
+ 'import_name': 123,
+ 'import_stmt': 146,
+ 'lambdef': 157,
+ 'list_for': 128,
+ 'list_if': 129,
+ 'list_iter': 127,
+ 'listmaker': 52,
+ 'not_test': 39,
+ 'old_lambdef': 131,
+ 'old_test': 76,
+ 'or_test': 74,
+ 'parameters': 118,
+ 'pass_stmt': 144,
+ 'power': 107,
+ 'print_stmt': 142,
+ 'raise_stmt': 113,
+ 'return_stmt': 112,
+ 'shift_expr': 37,
+ 'simple_stmt': 2,
+ 'sliceop': 150,
+ 'small_stmt': 139,
+ 'stmt': 109,
+ 'subscript': 151,
+ 'subscriptlist': 158,
+ 'suite': 71,
+ 'term': 48,
+ 'test': 45,
+ 'testlist': 70,
+ 'testlist1': 56,
+ 'testlist_comp': 50,
+ 'testlist_safe': 126,
+ 'trailer': 135,
+ 'try_stmt': 90,
+ 'varargslist': 125,
+ 'while_stmt': 88,
+ 'with_item': 161,
+ 'with_stmt': 91,
+ 'xor_expr': 104,
+ 'yield_expr': 49,
+ 'yield_stmt': 114}
+
+keyword_ids = {'and': 40,
+ 'as': 99,
+ 'assert': 10,
+ 'break': 11,
+ 'class': 12,
+ 'continue': 13,
+ 'def': 14,
+ 'del': 15,
+ 'elif': 119,
+ 'else': 115,
+ 'except': 103,
+ 'exec': 16,
+ 'finally': 160,
+ 'for': 17,
+ 'from': 18,
+ 'global': 19,
+ 'if': 20,
+ 'import': 21,
+ 'in': 73,
+ 'is': 84,
+ 'lambda': 22,
+ 'not': 23,
+ 'or': 133,
+ 'pass': 24,
+ 'print': 25,
+ 'raise': 26,
+ 'return': 27,
+ 'try': 28,
+ 'while': 29,
+ 'with': 30,
+ 'yield': 31}
+
+labels = [0,
+ 5,
+ 320,
+ 272,
+ 8,
+ 15,
+ 16,
+ 51,
+ 10,
+ 26,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 27,
+ 33,
+ 2,
+ 3,
+ 4,
+ 319,
+ 20,
+ 309,
+ 2,
+ 260,
+ 17,
+ 37,
+ 13,
+ 328,
+ 267,
+ 23,
+ 327,
+ 340,
+ 331,
+ 9,
+ 308,
+ 11,
+ 279,
+ 28,
+ 330,
+ 38,
+ 39,
+ 40,
+ 41,
+ 42,
+ 43,
+ 44,
+ 45,
+ 46,
+ 47,
+ 48,
+ 50,
+ 12,
+ 329,
+ 326,
+ 289,
+ 2,
+ 312,
+ 269,
+ 311,
+ 268,
+ 21,
+ 22,
+ 29,
+ 32,
+ 31,
+ 30,
+ 2,
+ 287,
+ 270,
+ 298,
+ 336,
+ 293,
+ 334,
+ 338,
+ 296,
+ 266,
+ 274,
+ 276,
+ 282,
+ 259,
+ 275,
+ 2,
+ 280,
+ 24,
+ 1,
+ 2,
+ 339,
+ 19,
+ 264,
+ 315,
+ 290,
+ 323,
+ 265,
+ 273,
+ 318,
+ 317,
+ 341,
+ 2,
+ 295,
+ 294,
+ 313,
+ 2,
+ 299,
+ 300,
+ 281,
+ 302,
+ 301,
+ 335,
+ 332,
+ 307,
+ 305,
+ 306,
+ 271,
+ 310,
+ 258,
+ 2,
+ 263,
+ 333,
+ 36,
+ 261,
+ 35,
+ 322,
+ 14,
+ 288,
+ 316,
+ 277,
+ 314,
+ 292,
+ 303,
+ 297,
+ 286,
+ 262,
+ 321,
+ 324,
+ 6,
+ 7,
+ 18,
+ 25,
+ 49,
+ 304,
+ 325,
+ 285,
+ 2,
+ 337,
+ 257,
+ 34]
+
+token_ids = {1: 102,
+ 2: 34,
+ 3: 35,
+ 4: 36,
+ 5: 1,
+ 6: 152,
+ 7: 153,
+ 8: 4,
+ 9: 51,
+ 10: 8,
+ 11: 53,
+ 12: 69,
+ 13: 44,
+ 14: 140,
+ 15: 5,
+ 16: 6,
+ 17: 42,
+ 18: 154,
+ 19: 105,
+ 20: 38,
+ 21: 78,
+ 22: 79,
+ 23: 47,
+ 24: 101,
+ 25: 155,
+ 26: 9,
+ 27: 32,
+ 28: 55,
+ 29: 80,
+ 30: 83,
+ 31: 82,
+ 32: 81,
+ 33: 33,
+ 34: 163,
+ 35: 138,
+ 36: 136,
+ 37: 43,
+ 38: 57,
+ 39: 58,
+ 40: 59,
+ 41: 60,
+ 42: 61,
+ 43: 62,
+ 44: 63,
+ 45: 64,
+ 46: 65,
+ 47: 66,
+ 48: 67,
+ 49: 156,
+ 50: 68,
+ 51: 7}
+
+start = 256
+
+dfas = [([([(1, 1), (2, 1), (3, 2)], False), ([], True), ([(1, 1)], False)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(37, 1)], False), ([(38, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(39, 1)], False), ([(40, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(41, 1), (42, 2), (43, 3)], False),
+   ([(44, 4)], True),
+   ([(45, 5)], False),
+   ([(45, 6)], False),
+   ([(41, 1), (42, 2), (43, 3)], True),
+   ([(44, 7)], True),
+   ([], True),
+   ([(41, 5), (43, 3)], False)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   42: None,
+   43: None}),
+ ([([(45, 1)], False),
+   ([(46, 2), (47, 3)], True),
+   ([], True),
+   ([(45, 2)], False)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(48, 1)], False), ([(5, 0), (6, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(10, 1)], False),
+   ([(45, 2)], False),
+   ([(44, 3)], True),
+   ([(45, 4)], False),
+   ([], True)],
+  {10: None}),
+ ([([(4, 1), (8, 2), (32, 3), (9, 4), (34, 5), (35, 5), (36, 6)], False),
+   ([(49, 7), (50, 7), (51, 5)], False),
+   ([(52, 8), (53, 5)], False),
+   ([(54, 9), (55, 5)], False),
+   ([(56, 10)], False),
+   ([], True),
+   ([(36, 6)], True),
+   ([(51, 5)], False),
+   ([(53, 5)], False),
+   ([(55, 5)], False),
+   ([(9, 5)], False)],
+  {4: None, 8: None, 9: None, 32: None, 34: None, 35: None, 36: None}),
+ ([([(57, 1),
+     (58, 1),
+     (59, 1),
+     (60, 1),
+     (61, 1),
+     (62, 1),
+     (63, 1),
+     (64, 1),
+     (65, 1),
+     (66, 1),
+     (67, 1),
+     (68, 1)],
+    False),
+   ([], True)],
+  {57: None,
+   58: None,
+   59: None,
+   60: None,
+   61: None,
+   62: None,
+   63: None,
+   64: None,
+   65: None,
+   66: None,
+   67: None,
+   68: None}),
+ ([([(11, 1)], False), ([], True)], {11: None}),
+ ([([(12, 1)], False),
+   ([(34, 2)], False),
+   ([(4, 3), (69, 4)], False),
+   ([(70, 5), (51, 6)], False),
+   ([(71, 7)], False),
+   ([(51, 6)], False),
+   ([(69, 4)], False),
+   ([], True)],
+  {12: None}),
+ ([([(17, 1)], False),
+   ([(72, 2)], False),
+   ([(73, 3)], False),
+   ([(74, 4)], False),
+   ([(75, 5)], True),
+   ([], True)],
+  {17: None}),
+ ([([(20, 1)], False), ([(76, 2)], False), ([(75, 3)], True), ([], True)],
+  {20: None}),
+ ([([(46, 1), (77, 1)], False), ([], True)], {17: None, 20: None}),
+ ([([(78, 1),
+     (79, 1),
+     (80, 1),
+     (81, 1),
+     (82, 1),
+     (83, 1),
+     (83, 1),
+     (73, 1),
+     (23, 2),
+     (84, 3)],
+    False),
+   ([], True),
+   ([(73, 1)], False),
+   ([(23, 1)], True)],
+  {23: None,
+   73: None,
+   78: None,
+   79: None,
+   80: None,
+   81: None,
+   82: None,
+   83: None,
+   84: None}),
+ ([([(85, 1)], False), ([(86, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(87, 1), (88, 1), (89, 1), (90, 1), (91, 1), (92, 1), (93, 1), (94, 1)],
+    False),
+   ([], True)],
+  {7: None,
+   12: None,
+   14: None,
+   17: None,
+   20: None,
+   28: None,
+   29: None,
+   30: None}),
+ ([([(13, 1)], False), ([], True)], {13: None}),
+ ([([(95, 1)], False), ([(93, 2), (92, 2)], False), ([], True)], {7: None}),
+ ([([(7, 1)], False),
+   ([(96, 2)], False),
+   ([(4, 3), (1, 4)], False),
+   ([(97, 5), (51, 6)], False),
+   ([], True),
+   ([(51, 6)], False),
+   ([(1, 4)], False)],
+  {7: None}),
+ ([([(98, 1)], False), ([(98, 1)], True)], {7: None}),
+ ([([(15, 1)], False), ([(72, 2)], False), ([], True)], {15: None}),
+ ([([(45, 1)], False),
+   ([(69, 2)], False),
+   ([(45, 3)], False),
+   ([(44, 4)], True),
+   ([(45, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(45, 1)], False),
+   ([(69, 2), (46, 3), (44, 4)], True),
+   ([(45, 5)], False),
+   ([], True),
+   ([(45, 6)], True),
+   ([(46, 3), (44, 7)], True),
+   ([(44, 4)], True),
+   ([(45, 8)], True),
+   ([(69, 9)], False),
+   ([(45, 10)], False),
+   ([(44, 7)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(96, 1)], False), ([(99, 2)], True), ([(34, 3)], False), ([], True)],
+  {34: None}),
+ ([([(100, 1)], False), ([(44, 0)], True)], {34: None}),
+ ([([(34, 1)], False), ([(101, 0)], True)], {34: None}),
+ ([([(34, 1)], False), ([], True)], {34: None}),
+ ([([(70, 1)], False), ([(1, 1), (102, 2)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(103, 1)], False),
+   ([(45, 2)], True),
+   ([(99, 3), (44, 3)], True),
+   ([(45, 4)], False),
+   ([], True)],
+  {103: None}),
+ ([([(16, 1)], False),
+   ([(85, 2)], False),
+   ([(73, 3)], True),
+   ([(45, 4)], False),
+   ([(44, 5)], True),
+   ([(45, 6)], False),
+   ([], True)],
+  {16: None}),
+ ([([(104, 1)], False), ([(105, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(70, 1)], False),
+   ([(106, 2), (47, 3)], True),
+   ([(49, 4), (70, 4)], False),
+   ([(49, 5), (70, 5)], False),
+   ([], True),
+   ([(47, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(85, 1)], False), ([(44, 2)], True), ([(85, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(5, 1), (6, 1), (33, 1), (107, 2)], False),
+   ([(108, 2)], False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(1, 0), (109, 0), (102, 1)], False), ([], True)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   102: None}),
+ ([([(110, 1), (111, 1), (112, 1), (113, 1), (114, 1)], False), ([], True)],
+  {11: None, 13: None, 26: None, 27: None, 31: None}),
+ ([([(17, 1)], False),
+   ([(72, 2)], False),
+   ([(73, 3)], False),
+   ([(70, 4)], False),
+   ([(69, 5)], False),
+   ([(71, 6)], False),
+   ([(115, 7)], True),
+   ([(69, 8)], False),
+   ([(71, 9)], False),
+   ([], True)],
+  {17: None}),
+ ([([(34, 1), (4, 2)], False),
+   ([], True),
+   ([(116, 3)], False),
+   ([(51, 1)], False)],
+  {4: None, 34: None}),
+ ([([(117, 1)], False), ([(44, 2)], True), ([(117, 1)], True)],
+  {4: None, 34: None}),
+ ([([(14, 1)], False),
+   ([(34, 2)], False),
+   ([(118, 3)], False),
+   ([(69, 4)], False),
+   ([(71, 5)], False),
+   ([], True)],
+  {14: None}),
+ ([([(19, 1)], False), ([(34, 2)], False), ([(44, 1)], True)], {19: None}),
+ ([([(20, 1)], False),
+   ([(45, 2)], False),
+   ([(69, 3)], False),
+   ([(71, 4)], False),
+   ([(119, 1), (115, 5)], True),
+   ([(69, 6)], False),
+   ([(71, 7)], False),
+   ([], True)],
+  {20: None}),
+ ([([(34, 1)], False), ([(99, 2)], True), ([(34, 3)], False), ([], True)],
+  {34: None}),
+ ([([(120, 1)], False), ([(44, 2)], True), ([(120, 1)], True)], {34: None}),
+ ([([(18, 1)], False),
+   ([(101, 2), (96, 3)], False),
+   ([(101, 2), (96, 3), (21, 4)], False),
+   ([(21, 4)], False),
+   ([(42, 5), (4, 6), (121, 5)], False),
+   ([], True),
+   ([(121, 7)], False),
+   ([(51, 5)], False)],
+  {18: None}),
+ ([([(21, 1)], False), ([(122, 2)], False), ([], True)], {21: None}),
+ ([([(123, 1), (124, 1)], False), ([], True)], {18: None, 21: None}),
+ ([([(22, 1)], False),
+   ([(125, 2), (69, 3)], False),
+   ([(69, 3)], False),
+   ([(45, 4)], False),
+   ([], True)],
+  {22: None}),
+ ([([(17, 1)], False),
+   ([(72, 2)], False),
+   ([(73, 3)], False),
+   ([(126, 4)], False),
+   ([(127, 5)], True),
+   ([], True)],
+  {17: None}),
+ ([([(20, 1)], False), ([(76, 2)], False), ([(127, 3)], True), ([], True)],
+  {20: None}),
+ ([([(128, 1), (129, 1)], False), ([], True)], {17: None, 20: None}),
+ ([([(45, 1)], False),
+   ([(128, 2), (44, 3)], True),
+   ([], True),
+   ([(45, 4)], True),
+   ([(44, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(23, 1), (130, 2)], False), ([(39, 2)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(22, 1)], False),
+   ([(125, 2), (69, 3)], False),
+   ([(69, 3)], False),
+   ([(76, 4)], False),
+   ([], True)],
+  {22: None}),
+ ([([(74, 1), (131, 1)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(132, 1)], False), ([(133, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(4, 1)], False),
+   ([(125, 2), (51, 3)], False),
+   ([(51, 3)], False),
+   ([], True)],
+  {4: None}),
+ ([([(24, 1)], False), ([], True)], {24: None}),
+ ([([(134, 1)], False),
+   ([(135, 1), (43, 2)], True),
+   ([(108, 3)], False),
+   ([], True)],
+  {4: None, 8: None, 9: None, 32: None, 34: None, 35: None, 36: None}),
+ ([([(25, 1)], False),
+   ([(45, 2), (136, 3)], True),
+   ([(44, 4)], True),
+   ([(45, 5)], False),
+   ([(45, 2)], True),
+   ([(44, 6)], True),
+   ([(45, 7)], False),
+   ([(44, 8)], True),
+   ([(45, 7)], True)],
+  {25: None}),
+ ([([(26, 1)], False),
+   ([(45, 2)], True),
+   ([(44, 3)], True),
+   ([(45, 4)], False),
+   ([(44, 5)], True),
+   ([(45, 6)], False),
+   ([], True)],
+  {26: None}),
+ ([([(27, 1)], False), ([(70, 2)], True), ([], True)], {27: None}),
+ ([([(137, 1)], False), ([(138, 0), (136, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(139, 1)], False),
+   ([(140, 2), (1, 3)], False),
+   ([(139, 1), (1, 3)], False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   13: None,
+   15: None,
+   16: None,
+   18: None,
+   19: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(69, 1)], False), ([(45, 2)], True), ([], True)], {69: None}),
+ ([([(141, 1),
+     (142, 1),
+     (143, 1),
+     (144, 1),
+     (145, 1),
+     (146, 1),
+     (147, 1),
+     (148, 1),
+     (149, 1)],
+    False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   13: None,
+   15: None,
+   16: None,
+   18: None,
+   19: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(2, 1), (3, 1)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(101, 1), (45, 2), (69, 3)], False),
+   ([(101, 4)], False),
+   ([(69, 3)], True),
+   ([(45, 5), (150, 6)], True),
+   ([(101, 6)], False),
+   ([(150, 6)], True),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   69: None,
+   101: None}),
+ ([([(151, 1)], False), ([(44, 2)], True), ([(151, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   69: None,
+   101: None}),
+ ([([(2, 1), (1, 2)], False),
+   ([], True),
+   ([(152, 3)], False),
+   ([(109, 4)], False),
+   ([(109, 4), (153, 1)], False)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   13: None,
+   15: None,
+   16: None,
+   18: None,
+   19: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(108, 1)], False), ([(42, 0), (154, 0), (155, 0), (156, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(74, 1), (157, 2)], False),
+   ([(20, 3)], True),
+   ([], True),
+   ([(74, 4)], False),
+   ([(115, 5)], False),
+   ([(45, 2)], False)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(45, 1)], False), ([(44, 2)], True), ([(45, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(45, 1)], False), ([(44, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(45, 1)], False),
+   ([(46, 2), (44, 3)], True),
+   ([], True),
+   ([(45, 4)], True),
+   ([(44, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(76, 1)], False),
+   ([(44, 2)], True),
+   ([(76, 3)], False),
+   ([(44, 4)], True),
+   ([(76, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(4, 1), (8, 2), (101, 3)], False),
+   ([(97, 4), (51, 5)], False),
+   ([(158, 6)], False),
+   ([(34, 5)], False),
+   ([(51, 5)], False),
+   ([], True),
+   ([(53, 5)], False)],
+  {4: None, 8: None, 101: None}),
+ ([([(28, 1)], False),
+   ([(69, 2)], False),
+   ([(71, 3)], False),
+   ([(159, 4), (160, 5)], False),
+   ([(69, 6)], False),
+   ([(69, 7)], False),
+   ([(71, 8)], False),
+   ([(71, 9)], False),
+   ([(159, 4), (115, 10), (160, 5)], True),
+   ([], True),
+   ([(69, 11)], False),
+   ([(71, 12)], False),
+   ([(160, 5)], True)],
+  {28: None}),
+ ([([(117, 1), (42, 2), (43, 3)], False),
+   ([(47, 4), (44, 5)], True),
+   ([(34, 6)], False),
+   ([(34, 7)], False),
+   ([(45, 8)], False),
+   ([(117, 1), (42, 2), (43, 3)], True),
+   ([(44, 9)], True),
+   ([], True),
+   ([(44, 5)], True),
+   ([(43, 3)], False)],
+  {4: None, 34: None, 42: None, 43: None}),
+ ([([(29, 1)], False),
+   ([(45, 2)], False),
+   ([(69, 3)], False),
+   ([(71, 4)], False),
+   ([(115, 5)], True),
+   ([(69, 6)], False),
+   ([(71, 7)], False),
+   ([], True)],
+  {29: None}),
+ ([([(45, 1)], False), ([(99, 2)], True), ([(85, 3)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   22: None,
+   23: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(30, 1)], False),
+   ([(161, 2)], False),
+   ([(44, 1), (69, 3)], False),
+   ([(71, 4)], False),
+   ([], True)],
+  {30: None}),
+ ([([(162, 1)], False), ([(163, 0)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   8: None,
+   9: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None}),
+ ([([(31, 1)], False), ([(70, 2)], True), ([], True)], {31: None}),
+ ([([(49, 1)], False), ([], True)], {31: None})]
@@ -0,0 +1,1394 @@
+# THIS FILE IS AUTOMATICALLY GENERATED BY gengrammar.py
+# DO NOT EDIT
+# TO REGENERATE THE FILE, RUN:
+#     python -m pypyparser.gengrammar
+
+SOURCE = 'Grammar3.3'
+SOURCE_HASH = 'ef05a4e97b488ba9a9cf5aef7ba979d5814cfad7'
+
+symbol_ids = {'and_expr': 257,
+ 'and_test': 258,
+ 'arglist': 259,
+ 'argument': 260,
+ 'arith_expr': 261,
+ 'assert_stmt': 262,
+ 'atom': 263,
+ 'augassign': 264,
+ 'break_stmt': 265,
+ 'classdef': 266,
+ 'comp_for': 267,
+ 'comp_if': 268,
+ 'comp_iter': 269,
+ 'comp_op': 270,
+ 'comparison': 271,
+ 'compound_stmt': 272,
+ 'continue_stmt': 273,
+ 'decorated': 274,
+ 'decorator': 275,
+ 'decorators': 276,
+ 'del_stmt': 277,
+ 'dictorsetmaker': 278,
+ 'dotted_as_name': 279,
+ 'dotted_as_names': 280,
+ 'dotted_name': 281,
+ 'encoding_decl': 282,
+ 'eval_input': 283,
+ 'except_clause': 284,
+ 'expr': 285,
+ 'expr_stmt': 286,
+ 'exprlist': 287,
+ 'factor': 288,
+ 'file_input': 289,
+ 'flow_stmt': 290,
+ 'for_stmt': 291,
+ 'funcdef': 292,
+ 'global_stmt': 293,
+ 'if_stmt': 294,
+ 'import_as_name': 295,
+ 'import_as_names': 296,
+ 'import_from': 297,
+ 'import_name': 298,
+ 'import_stmt': 299,
+ 'lambdef': 300,
+ 'lambdef_nocond': 301,
+ 'nonlocal_stmt': 302,
+ 'not_test': 303,
+ 'or_test': 304,
+ 'parameters': 305,
+ 'pass_stmt': 306,
+ 'power': 307,
+ 'raise_stmt': 308,
+ 'return_stmt': 309,
+ 'shift_expr': 310,
+ 'simple_stmt': 311,
+ 'single_input': 256,
+ 'sliceop': 312,
+ 'small_stmt': 313,
+ 'star_expr': 314,
+ 'stmt': 315,
+ 'subscript': 316,
+ 'subscriptlist': 317,
+ 'suite': 318,
+ 'term': 319,
+ 'test': 320,
+ 'test_nocond': 321,
+ 'testlist': 322,
+ 'testlist_comp': 323,
+ 'testlist_star_expr': 324,
+ 'tfpdef': 325,
+ 'trailer': 326,
+ 'try_stmt': 327,
+ 'typedargslist': 328,
+ 'varargslist': 329,
+ 'vfpdef': 330,
+ 'while_stmt': 331,
+ 'with_item': 332,
+ 'with_stmt': 333,
+ 'xor_expr': 334,
+ 'yield_arg': 335,
+ 'yield_expr': 336,
+ 'yield_stmt': 337}
+
+symbol_to_label = {'and_expr': 161,
+ 'and_test': 128,
+ 'arglist': 70,
+ 'argument': 44,
+ 'arith_expr': 133,
+ 'assert_stmt': 145,
+ 'atom': 131,
+ 'augassign': 107,
+ 'break_stmt': 112,
+ 'classdef': 93,
+ 'comp_for': 48,
+ 'comp_if': 77,
+ 'comp_iter': 75,
+ 'comp_op': 86,
+ 'comparison': 127,
+ 'compound_stmt': 3,
+ 'continue_stmt': 113,
+ 'decorated': 94,
+ 'decorator': 97,
+ 'decorators': 95,
+ 'del_stmt': 139,
+ 'dictorsetmaker': 55,
+ 'dotted_as_name': 99,
+ 'dotted_as_names': 123,
+ 'dotted_name': 96,
+ 'except_clause': 156,
+ 'expr': 85,
+ 'expr_stmt': 138,
+ 'exprlist': 72,
+ 'factor': 110,
+ 'flow_stmt': 141,
+ 'for_stmt': 89,
+ 'funcdef': 92,
+ 'global_stmt': 143,
+ 'if_stmt': 87,
+ 'import_as_name': 121,
+ 'import_as_names': 122,
+ 'import_from': 125,
+ 'import_name': 124,
+ 'import_stmt': 142,
+ 'lambdef': 153,
+ 'lambdef_nocond': 154,
+ 'nonlocal_stmt': 144,
+ 'not_test': 42,
+ 'or_test': 74,
+ 'parameters': 118,
+ 'pass_stmt': 140,
+ 'power': 109,
+ 'raise_stmt': 115,
+ 'return_stmt': 114,
+ 'shift_expr': 40,
+ 'simple_stmt': 2,
+ 'sliceop': 146,
+ 'small_stmt': 136,
+ 'star_expr': 108,
+ 'stmt': 111,
+ 'subscript': 147,
+ 'subscriptlist': 155,
+ 'suite': 71,
+ 'term': 50,
+ 'test': 47,
+ 'test_nocond': 76,
+ 'testlist': 101,
+ 'testlist_comp': 52,
+ 'testlist_star_expr': 106,
+ 'tfpdef': 158,
+ 'trailer': 132,
+ 'try_stmt': 90,
+ 'typedargslist': 130,
+ 'varargslist': 126,
+ 'vfpdef': 159,
+ 'while_stmt': 88,
+ 'with_item': 160,
+ 'with_stmt': 91,
+ 'xor_expr': 104,
+ 'yield_arg': 163,
+ 'yield_expr': 51,
+ 'yield_stmt': 116}
+
+keyword_ids = {'False': 10,
+ 'None': 11,
+ 'True': 12,
+ 'and': 43,
+ 'as': 98,
+ 'assert': 14,
+ 'break': 15,
+ 'class': 16,
+ 'continue': 17,
+ 'def': 18,
+ 'del': 19,
+ 'elif': 120,
+ 'else': 117,
+ 'except': 103,
+ 'finally': 157,
+ 'for': 20,
+ 'from': 21,
+ 'global': 22,
+ 'if': 23,
+ 'import': 24,
+ 'in': 73,
+ 'is': 84,
+ 'lambda': 25,
+ 'nonlocal': 26,
+ 'not': 27,
+ 'or': 129,
+ 'pass': 28,
+ 'raise': 29,
+ 'return': 30,
+ 'try': 31,
+ 'while': 32,
+ 'with': 33,
+ 'yield': 34}
+
+labels = [0,
+ 5,
+ 311,
+ 272,
+ 8,
+ 17,
+ 15,
+ 16,
+ 54,
+ 51,
+ 2,
+ 2,
+ 2,
+ 10,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 27,
+ 33,
+ 2,
+ 3,
+ 4,
+ 310,
+ 20,
+ 303,
+ 2,
+ 260,
+ 37,
+ 13,
+ 320,
+ 267,
+ 23,
+ 319,
+ 336,
+ 323,
+ 9,
+ 11,
+ 278,
+ 28,
+ 38,
+ 39,
+ 40,
+ 41,
+ 42,
+ 43,
+ 44,
+ 45,
+ 46,
+ 47,
+ 48,
+ 50,
+ 12,
+ 259,
+ 318,
+ 287,
+ 2,
+ 304,
+ 269,
+ 321,
+ 268,
+ 21,
+ 22,
+ 29,
+ 32,
+ 31,
+ 30,
+ 2,
+ 285,
+ 270,
+ 294,
+ 331,
+ 291,
+ 327,
+ 333,
+ 292,
+ 266,
+ 274,
+ 276,
+ 281,
+ 275,
+ 2,
+ 279,
+ 24,
+ 322,
+ 1,
+ 2,
+ 334,
+ 19,
+ 324,
+ 264,
+ 314,
+ 307,
+ 288,
+ 315,
+ 265,
+ 273,
+ 309,
+ 308,
+ 337,
+ 2,
+ 305,
+ 53,
+ 2,
+ 295,
+ 296,
+ 280,
+ 298,
+ 297,
+ 329,
+ 271,
+ 258,
+ 2,
+ 328,
+ 263,
+ 326,
+ 261,
+ 35,
+ 36,
+ 313,
+ 14,
+ 286,
+ 277,
+ 306,
+ 290,
+ 299,
+ 293,
+ 302,
+ 262,
+ 312,
+ 316,
+ 6,
+ 7,
+ 18,
+ 25,
+ 49,
+ 300,
+ 301,
+ 317,
+ 284,
+ 2,
+ 325,
+ 330,
+ 332,
+ 257,
+ 34,
+ 335]
+
+token_ids = {1: 102,
+ 2: 37,
+ 3: 38,
+ 4: 39,
+ 5: 1,
+ 6: 148,
+ 7: 149,
+ 8: 4,
+ 9: 53,
+ 10: 13,
+ 11: 54,
+ 12: 69,
+ 13: 46,
+ 14: 137,
+ 15: 6,
+ 16: 7,
+ 17: 5,
+ 18: 150,
+ 19: 105,
+ 20: 41,
+ 21: 78,
+ 22: 79,
+ 23: 49,
+ 24: 100,
+ 25: 151,
+ 27: 35,
+ 28: 56,
+ 29: 80,
+ 30: 83,
+ 31: 82,
+ 32: 81,
+ 33: 36,
+ 34: 162,
+ 35: 134,
+ 36: 135,
+ 37: 45,
+ 38: 57,
+ 39: 58,
+ 40: 59,
+ 41: 60,
+ 42: 61,
+ 43: 62,
+ 44: 63,
+ 45: 64,
+ 46: 65,
+ 47: 66,
+ 48: 67,
+ 49: 152,
+ 50: 68,
+ 51: 9,
+ 53: 119,
+ 54: 8}
+
+start = 256
+
+dfas = [([([(1, 1), (2, 1), (3, 2)], False), ([], True), ([(1, 1)], False)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(40, 1)], False), ([(41, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(42, 1)], False), ([(43, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(44, 1), (5, 2), (45, 3)], False),
+   ([(46, 4)], True),
+   ([(47, 5)], False),
+   ([(47, 6)], False),
+   ([(44, 1), (5, 2), (45, 3)], True),
+   ([(46, 7)], True),
+   ([], True),
+   ([(44, 5), (45, 3)], False)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None,
+   45: None}),
+ ([([(47, 1)], False),
+   ([(48, 2), (49, 3)], True),
+   ([], True),
+   ([(47, 2)], False)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(50, 1)], False), ([(6, 0), (7, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(14, 1)], False),
+   ([(47, 2)], False),
+   ([(46, 3)], True),
+   ([(47, 4)], False),
+   ([], True)],
+  {14: None}),
+ ([([(4, 1),
+     (13, 2),
+     (35, 3),
+     (37, 4),
+     (38, 4),
+     (39, 5),
+     (8, 4),
+     (11, 4),
+     (12, 4),
+     (10, 4)],
+    False),
+   ([(51, 6), (52, 6), (53, 4)], False),
+   ([(52, 7), (54, 4)], False),
+   ([(55, 8), (56, 4)], False),
+   ([], True),
+   ([(39, 5)], True),
+   ([(53, 4)], False),
+   ([(54, 4)], False),
+   ([(56, 4)], False)],
+  {4: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(57, 1),
+     (58, 1),
+     (59, 1),
+     (60, 1),
+     (61, 1),
+     (62, 1),
+     (63, 1),
+     (64, 1),
+     (65, 1),
+     (66, 1),
+     (67, 1),
+     (68, 1)],
+    False),
+   ([], True)],
+  {57: None,
+   58: None,
+   59: None,
+   60: None,
+   61: None,
+   62: None,
+   63: None,
+   64: None,
+   65: None,
+   66: None,
+   67: None,
+   68: None}),
+ ([([(15, 1)], False), ([], True)], {15: None}),
+ ([([(16, 1)], False),
+   ([(37, 2)], False),
+   ([(4, 3), (69, 4)], False),
+   ([(70, 5), (53, 6)], False),
+   ([(71, 7)], False),
+   ([(53, 6)], False),
+   ([(69, 4)], False),
+   ([], True)],
+  {16: None}),
+ ([([(20, 1)], False),
+   ([(72, 2)], False),
+   ([(73, 3)], False),
+   ([(74, 4)], False),
+   ([(75, 5)], True),
+   ([], True)],
+  {20: None}),
+ ([([(23, 1)], False), ([(76, 2)], False), ([(75, 3)], True), ([], True)],
+  {23: None}),
+ ([([(48, 1), (77, 1)], False), ([], True)], {20: None, 23: None}),
+ ([([(78, 1),
+     (79, 1),
+     (80, 1),
+     (81, 1),
+     (82, 1),
+     (83, 1),
+     (83, 1),
+     (73, 1),
+     (27, 2),
+     (84, 3)],
+    False),
+   ([], True),
+   ([(73, 1)], False),
+   ([(27, 1)], True)],
+  {27: None,
+   73: None,
+   78: None,
+   79: None,
+   80: None,
+   81: None,
+   82: None,
+   83: None,
+   84: None}),
+ ([([(85, 1)], False), ([(86, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(87, 1), (88, 1), (89, 1), (90, 1), (91, 1), (92, 1), (93, 1), (94, 1)],
+    False),
+   ([], True)],
+  {9: None,
+   16: None,
+   18: None,
+   20: None,
+   23: None,
+   31: None,
+   32: None,
+   33: None}),
+ ([([(17, 1)], False), ([], True)], {17: None}),
+ ([([(95, 1)], False), ([(93, 2), (92, 2)], False), ([], True)], {9: None}),
+ ([([(9, 1)], False),
+   ([(96, 2)], False),
+   ([(4, 3), (1, 4)], False),
+   ([(70, 5), (53, 6)], False),
+   ([], True),
+   ([(53, 6)], False),
+   ([(1, 4)], False)],
+  {9: None}),
+ ([([(97, 1)], False), ([(97, 1)], True)], {9: None}),
+ ([([(19, 1)], False), ([(72, 2)], False), ([], True)], {19: None}),
+ ([([(47, 1)], False),
+   ([(69, 2), (48, 3), (46, 4)], True),
+   ([(47, 5)], False),
+   ([], True),
+   ([(47, 6)], True),
+   ([(48, 3), (46, 7)], True),
+   ([(46, 4)], True),
+   ([(47, 8)], True),
+   ([(69, 9)], False),
+   ([(47, 10)], False),
+   ([(46, 7)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(96, 1)], False), ([(98, 2)], True), ([(37, 3)], False), ([], True)],
+  {37: None}),
+ ([([(99, 1)], False), ([(46, 0)], True)], {37: None}),
+ ([([(37, 1)], False), ([(100, 0)], True)], {37: None}),
+ ([([(37, 1)], False), ([], True)], {37: None}),
+ ([([(101, 1)], False), ([(1, 1), (102, 2)], False), ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(103, 1)], False),
+   ([(47, 2)], True),
+   ([(98, 3)], True),
+   ([(37, 4)], False),
+   ([], True)],
+  {103: None}),
+ ([([(104, 1)], False), ([(105, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(106, 1)], False),
+   ([(107, 2), (49, 3)], True),
+   ([(51, 4), (101, 4)], False),
+   ([(51, 5), (106, 5)], False),
+   ([], True),
+   ([(49, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(85, 1), (108, 1)], False),
+   ([(46, 2)], True),
+   ([(85, 1), (108, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(6, 1), (7, 1), (36, 1), (109, 2)], False),
+   ([(110, 2)], False),
+   ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(1, 0), (111, 0), (102, 1)], False), ([], True)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None,
+   102: None}),
+ ([([(112, 1), (113, 1), (114, 1), (115, 1), (116, 1)], False), ([], True)],
+  {15: None, 17: None, 29: None, 30: None, 34: None}),
+ ([([(20, 1)], False),
+   ([(72, 2)], False),
+   ([(73, 3)], False),
+   ([(101, 4)], False),
+   ([(69, 5)], False),
+   ([(71, 6)], False),
+   ([(117, 7)], True),
+   ([(69, 8)], False),
+   ([(71, 9)], False),
+   ([], True)],
+  {20: None}),
+ ([([(18, 1)], False),
+   ([(37, 2)], False),
+   ([(118, 3)], False),
+   ([(119, 4), (69, 5)], False),
+   ([(47, 6)], False),
+   ([(71, 7)], False),
+   ([(69, 5)], False),
+   ([], True)],
+  {18: None}),
+ ([([(22, 1)], False), ([(37, 2)], False), ([(46, 1)], True)], {22: None}),
+ ([([(23, 1)], False),
+   ([(47, 2)], False),
+   ([(69, 3)], False),
+   ([(71, 4)], False),
+   ([(120, 1), (117, 5)], True),
+   ([(69, 6)], False),
+   ([(71, 7)], False),
+   ([], True)],
+  {23: None}),
+ ([([(37, 1)], False), ([(98, 2)], True), ([(37, 3)], False), ([], True)],
+  {37: None}),
+ ([([(121, 1)], False), ([(46, 2)], True), ([(121, 1)], True)], {37: None}),
+ ([([(21, 1)], False),
+   ([(100, 2), (8, 2), (96, 3)], False),
+   ([(100, 2), (8, 2), (96, 3), (24, 4)], False),
+   ([(24, 4)], False),
+   ([(5, 5), (4, 6), (122, 5)], False),
+   ([], True),
+   ([(122, 7)], False),
+   ([(53, 5)], False)],
+  {21: None}),
+ ([([(24, 1)], False), ([(123, 2)], False), ([], True)], {24: None}),
+ ([([(124, 1), (125, 1)], False), ([], True)], {21: None, 24: None}),
+ ([([(25, 1)], False),
+   ([(126, 2), (69, 3)], False),
+   ([(69, 3)], False),
+   ([(47, 4)], False),
+   ([], True)],
+  {25: None}),
+ ([([(25, 1)], False),
+   ([(126, 2), (69, 3)], False),
+   ([(69, 3)], False),
+   ([(76, 4)], False),
+   ([], True)],
+  {25: None}),
+ ([([(26, 1)], False), ([(37, 2)], False), ([(46, 1)], True)], {26: None}),
+ ([([(27, 1), (127, 2)], False), ([(42, 2)], False), ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(128, 1)], False), ([(129, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(4, 1)], False),
+   ([(130, 2), (53, 3)], False),
+   ([(53, 3)], False),
+   ([], True)],
+  {4: None}),
+ ([([(28, 1)], False), ([], True)], {28: None}),
+ ([([(131, 1)], False),
+   ([(132, 1), (45, 2)], True),
+   ([(110, 3)], False),
+   ([], True)],
+  {4: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(29, 1)], False),
+   ([(47, 2)], True),
+   ([(21, 3)], True),
+   ([(47, 4)], False),
+   ([], True)],
+  {29: None}),
+ ([([(30, 1)], False), ([(101, 2)], True), ([], True)], {30: None}),
+ ([([(133, 1)], False), ([(134, 0), (135, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(136, 1)], False),
+   ([(137, 2), (1, 3)], False),
+   ([(136, 1), (1, 3)], False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   17: None,
+   19: None,
+   21: None,
+   22: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   34: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(69, 1)], False), ([(47, 2)], True), ([], True)], {69: None}),
+ ([([(138, 1),
+     (139, 1),
+     (140, 1),
+     (141, 1),
+     (142, 1),
+     (143, 1),
+     (144, 1),
+     (145, 1)],
+    False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   17: None,
+   19: None,
+   21: None,
+   22: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   34: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(5, 1)], False), ([(85, 2)], False), ([], True)], {5: None}),
+ ([([(2, 1), (3, 1)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(47, 1), (69, 2)], False),
+   ([(69, 2)], True),
+   ([(47, 3), (146, 4)], True),
+   ([(146, 4)], True),
+   ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None,
+   69: None}),
+ ([([(147, 1)], False), ([(46, 2)], True), ([(147, 1)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None,
+   69: None}),
+ ([([(2, 1), (1, 2)], False),
+   ([], True),
+   ([(148, 3)], False),
+   ([(111, 4)], False),
+   ([(111, 4), (149, 1)], False)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   17: None,
+   19: None,
+   21: None,
+   22: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   34: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(110, 1)], False), ([(5, 0), (150, 0), (151, 0), (152, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(74, 1), (153, 2)], False),
+   ([(23, 3)], True),
+   ([], True),
+   ([(74, 4)], False),
+   ([(117, 5)], False),
+   ([(47, 2)], False)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(74, 1), (154, 1)], False), ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(47, 1)], False), ([(46, 2)], True), ([(47, 1)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(47, 1), (108, 1)], False),
+   ([(48, 2), (46, 3)], True),
+   ([], True),
+   ([(47, 4), (108, 4)], True),
+   ([(46, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(47, 1), (108, 1)], False),
+   ([(46, 2)], True),
+   ([(47, 1), (108, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(37, 1)], False), ([(69, 2)], True), ([(47, 3)], False), ([], True)],
+  {37: None}),
+ ([([(4, 1), (13, 2), (100, 3)], False),
+   ([(70, 4), (53, 5)], False),
+   ([(155, 6)], False),
+   ([(37, 5)], False),
+   ([(53, 5)], False),
+   ([], True),
+   ([(54, 5)], False)],
+  {4: None, 13: None, 100: None}),
+ ([([(31, 1)], False),
+   ([(69, 2)], False),
+   ([(71, 3)], False),
+   ([(156, 4), (157, 5)], False),
+   ([(69, 6)], False),
+   ([(69, 7)], False),
+   ([(71, 8)], False),
+   ([(71, 9)], False),
+   ([(156, 4), (117, 10), (157, 5)], True),
+   ([], True),
+   ([(69, 11)], False),
+   ([(71, 12)], False),
+   ([(157, 5)], True)],
+  {31: None}),
+ ([([(158, 1), (5, 2), (45, 3)], False),
+   ([(49, 4), (46, 5)], True),
+   ([(158, 6), (46, 7)], True),
+   ([(158, 8)], False),
+   ([(47, 9)], False),
+   ([(158, 1), (5, 10), (45, 3)], True),
+   ([(46, 7)], True),
+   ([(158, 11), (45, 3)], False),
+   ([], True),
+   ([(46, 5)], True),
+   ([(158, 12), (46, 13)], True),
+   ([(46, 7), (49, 14)], True),
+   ([(46, 13)], True),
+   ([(158, 15), (45, 3)], False),
+   ([(47, 6)], False),
+   ([(46, 13), (49, 16)], True),
+   ([(47, 12)], False)],
+  {5: None, 37: None, 45: None}),
+ ([([(159, 1), (5, 2), (45, 3)], False),
+   ([(49, 4), (46, 5)], True),
+   ([(159, 6), (46, 7)], True),
+   ([(159, 8)], False),
+   ([(47, 9)], False),
+   ([(159, 1), (5, 10), (45, 3)], True),
+   ([(46, 7)], True),
+   ([(159, 11), (45, 3)], False),
+   ([], True),
+   ([(46, 5)], True),
+   ([(159, 12), (46, 13)], True),
+   ([(46, 7), (49, 14)], True),
+   ([(46, 13)], True),
+   ([(159, 15), (45, 3)], False),
+   ([(47, 6)], False),
+   ([(46, 13), (49, 16)], True),
+   ([(47, 12)], False)],
+  {5: None, 37: None, 45: None}),
+ ([([(37, 1)], False), ([], True)], {37: None}),
+ ([([(32, 1)], False),
+   ([(47, 2)], False),
+   ([(69, 3)], False),
+   ([(71, 4)], False),
+   ([(117, 5)], True),
+   ([(69, 6)], False),
+   ([(71, 7)], False),
+   ([], True)],
+  {32: None}),
+ ([([(47, 1)], False), ([(98, 2)], True), ([(85, 3)], False), ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(33, 1)], False),
+   ([(160, 2)], False),
+   ([(46, 1), (69, 3)], False),
+   ([(71, 4)], False),
+   ([], True)],
+  {33: None}),
+ ([([(161, 1)], False), ([(162, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(21, 1), (101, 2)], False), ([(47, 2)], False), ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   21: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None}),
+ ([([(34, 1)], False), ([(163, 2)], True), ([], True)], {34: None}),
+ ([([(51, 1)], False), ([], True)], {34: None})]
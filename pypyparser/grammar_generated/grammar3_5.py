@@ -0,0 +1,1469 @@
+# THIS FILE IS AUTOMATICALLY GENERATED BY gengrammar.py
+# DO NOT EDIT
+# TO REGENERATE THE FILE, RUN:
+#     python -m pypyparser.gengrammar
+
+SOURCE = 'Grammar3.5'
+SOURCE_HASH = 'cb824be9367defbc70e27b10743d0c701ae08495'
+
+symbol_ids = {'and_expr': 257,
+ 'and_test': 258,
+ 'arglist': 259,
+ 'argument': 260,
+ 'arith_expr': 261,
+ 'assert_stmt': 262,
+ 'async_funcdef': 263,
+ 'async_stmt': 264,
+ 'atom': 265,
+ 'atom_expr': 266,
+ 'augassign': 267,
+ 'break_stmt': 268,
+ 'classdef': 269,
+ 'comp_for': 270,
+ 'comp_if': 271,
+ 'comp_iter': 272,
+ 'comp_op': 273,
+ 'comparison': 274,
+ 'compound_stmt': 275,
+ 'continue_stmt': 276,
+ 'decorated': 277,
+ 'decorator': 278,
+ 'decorators': 279,
+ 'del_stmt': 280,
+ 'dictorsetmaker': 281,
+ 'dotted_as_name': 282,
+ 'dotted_as_names': 283,
+ 'dotted_name': 284,
+ 'encoding_decl': 285,
+ 'eval_input': 286,
+ 'except_clause': 287,
+ 'expr': 288,
+ 'expr_stmt': 289,
+ 'exprlist': 290,
+ 'factor': 291,
+ 'file_input': 292,
+ 'flow_stmt': 293,
+ 'for_stmt': 294,
+ 'funcdef': 295,
+ 'global_stmt': 296,
+ 'if_stmt': 297,
+ 'import_as_name': 298,
+ 'import_as_names': 299,
+ 'import_from': 300,
+ 'import_name': 301,
+ 'import_stmt': 302,
+ 'lambdef': 303,
+ 'lambdef_nocond': 304,
+ 'nonlocal_stmt': 305,
+ 'not_test': 306,
+ 'or_test': 307,
+ 'parameters': 308,
+ 'pass_stmt': 309,
+ 'power': 310,
+ 'raise_stmt': 311,
+ 'return_stmt': 312,
+ 'shift_expr': 313,
+ 'simple_stmt': 314,
+ 'single_input': 256,
+ 'sliceop': 315,
+ 'small_stmt': 316,
+ 'star_expr': 317,
+ 'stmt': 318,
+ 'subscript': 319,
+ 'subscriptlist': 320,
+ 'suite': 321,
+ 'term': 322,
+ 'test': 323,
+ 'test_nocond': 324,
+ 'testlist': 325,
+ 'testlist_comp': 326,
+ 'testlist_star_expr': 327,
+ 'tfpdef': 328,
+ 'trailer': 329,
+ 'try_stmt': 330,
+ 'typedargslist': 331,
+ 'varargslist': 332,
+ 'vfpdef': 333,
+ 'while_stmt': 334,
+ 'with_item': 335,
+ 'with_stmt': 336,
+ 'xor_expr': 337,
+ 'yield_arg': 338,
+ 'yield_expr': 339,
+ 'yield_stmt': 340}
+
+symbol_to_label = {'and_expr': 167,
+ 'and_test': 135,
+ 'arglist': 78,
+ 'argument': 46,
+ 'arith_expr': 139,
+ 'assert_stmt': 151,
+ 'async_funcdef': 102,
+ 'async_stmt': 100,
+ 'atom': 62,
+ 'atom_expr': 138,
+ 'augassign': 115,
+ 'break_stmt': 119,
+ 'classdef': 98,
+ 'comp_for': 50,
+ 'comp_if': 85,
+ 'comp_iter': 83,
+ 'comp_op': 94,
+ 'comparison': 134,
+ 'compound_stmt': 3,
+ 'continue_stmt': 120,
+ 'decorated': 99,
+ 'decorator': 104,
+ 'decorators': 101,
+ 'del_stmt': 145,
+ 'dictorsetmaker': 60,
+ 'dotted_as_name': 107,
+ 'dotted_as_names': 130,
+ 'dotted_name': 103,
+ 'except_clause': 162,
+ 'expr': 93,
+ 'expr_stmt': 144,
+ 'exprlist': 80,
+ 'factor': 117,
+ 'flow_stmt': 147,
+ 'for_stmt': 55,
+ 'funcdef': 53,
+ 'global_stmt': 149,
+ 'if_stmt': 95,
+ 'import_as_name': 128,
+ 'import_as_names': 129,
+ 'import_from': 132,
+ 'import_name': 131,
+ 'import_stmt': 148,
+ 'lambdef': 159,
+ 'lambdef_nocond': 160,
+ 'nonlocal_stmt': 150,
+ 'not_test': 44,
+ 'or_test': 82,
+ 'parameters': 125,
+ 'pass_stmt': 146,
+ 'power': 116,
+ 'raise_stmt': 122,
+ 'return_stmt': 121,
+ 'shift_expr': 42,
+ 'simple_stmt': 2,
+ 'sliceop': 152,
+ 'small_stmt': 142,
+ 'star_expr': 105,
+ 'stmt': 118,
+ 'subscript': 153,
+ 'subscriptlist': 161,
+ 'suite': 79,
+ 'term': 52,
+ 'test': 49,
+ 'test_nocond': 84,
+ 'testlist': 109,
+ 'testlist_comp': 57,
+ 'testlist_star_expr': 114,
+ 'tfpdef': 164,
+ 'trailer': 63,
+ 'try_stmt': 97,
+ 'typedargslist': 137,
+ 'varargslist': 133,
+ 'vfpdef': 165,
+ 'while_stmt': 96,
+ 'with_item': 166,
+ 'with_stmt': 54,
+ 'xor_expr': 112,
+ 'yield_arg': 169,
+ 'yield_expr': 56,
+ 'yield_stmt': 123}
+
+keyword_ids = {'False': 10,
+ 'None': 11,
+ 'True': 12,
+ 'and': 45,
+ 'as': 106,
+ 'assert': 14,
+ 'break': 15,
+ 'class': 16,
+ 'continue': 17,
+ 'def': 18,
+ 'del': 19,
+ 'elif': 127,
+ 'else': 124,
+ 'except': 111,
+ 'finally': 163,
+ 'for': 20,
+ 'from': 21,
+ 'global': 22,
+ 'if': 23,
+ 'import': 24,
+ 'in': 81,
+ 'is': 92,
+ 'lambda': 25,
+ 'nonlocal': 26,
+ 'not': 27,
+ 'or': 136,
+ 'pass': 28,
+ 'raise': 29,
+ 'return': 30,
+ 'try': 31,
+ 'while': 32,
+ 'with': 33,
+ 'yield': 34}
+
+labels = [0,
+ 5,
+ 314,
+ 275,
+ 8,
+ 17,
+ 15,
+ 16,
+ 54,
+ 51,
+ 2,
+ 2,
+ 2,
+ 10,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 27,
+ 33,
+ 56,
+ 57,
+ 2,
+ 3,
+ 4,
+ 313,
+ 20,
+ 306,
+ 2,
+ 260,
+ 13,
+ 37,
+ 323,
+ 270,
+ 23,
+ 322,
+ 295,
+ 336,
+ 294,
+ 339,
+ 326,
+ 9,
+ 11,
+ 281,
+ 28,
+ 265,
+ 329,
+ 38,
+ 39,
+ 40,
+ 52,
+ 41,
+ 42,
+ 43,
+ 44,
+ 45,
+ 46,
+ 47,
+ 48,
+ 50,
+ 12,
+ 259,
+ 321,
+ 290,
+ 2,
+ 307,
+ 272,
+ 324,
+ 271,
+ 21,
+ 22,
+ 29,
+ 32,
+ 31,
+ 30,
+ 2,
+ 288,
+ 273,
+ 297,
+ 334,
+ 330,
+ 269,
+ 277,
+ 264,
+ 279,
+ 263,
+ 284,
+ 278,
+ 317,
+ 2,
+ 282,
+ 24,
+ 325,
+ 1,
+ 2,
+ 337,
+ 19,
+ 327,
+ 267,
+ 310,
+ 291,
+ 318,
+ 268,
+ 276,
+ 312,
+ 311,
+ 340,
+ 2,
+ 308,
+ 53,
+ 2,
+ 298,
+ 299,
+ 283,
+ 301,
+ 300,
+ 332,
+ 274,
+ 258,
+ 2,
+ 331,
+ 266,
+ 261,
+ 35,
+ 36,
+ 316,
+ 14,
+ 289,
+ 280,
+ 309,
+ 293,
+ 302,
+ 296,
+ 305,
+ 262,
+ 315,
+ 319,
+ 6,
+ 7,
+ 18,
+ 25,
+ 49,
+ 303,
+ 304,
+ 320,
+ 287,
+ 2,
+ 328,
+ 333,
+ 335,
+ 257,
+ 34,
+ 338]
+
+token_ids = {1: 110,
+ 2: 39,
+ 3: 40,
+ 4: 41,
+ 5: 1,
+ 6: 154,
+ 7: 155,
+ 8: 4,
+ 9: 58,
+ 10: 13,
+ 11: 59,
+ 12: 77,
+ 13: 47,
+ 14: 143,
+ 15: 6,
+ 16: 7,
+ 17: 5,
+ 18: 156,
+ 19: 113,
+ 20: 43,
+ 21: 86,
+ 22: 87,
+ 23: 51,
+ 24: 108,
+ 25: 157,
+ 27: 35,
+ 28: 61,
+ 29: 88,
+ 30: 91,
+ 31: 90,
+ 32: 89,
+ 33: 36,
+ 34: 168,
+ 35: 140,
+ 36: 141,
+ 37: 48,
+ 38: 64,
+ 39: 65,
+ 40: 66,
+ 41: 68,
+ 42: 69,
+ 43: 70,
+ 44: 71,
+ 45: 72,
+ 46: 73,
+ 47: 74,
+ 48: 75,
+ 49: 158,
+ 50: 76,
+ 51: 9,
+ 52: 67,
+ 53: 126,
+ 54: 8,
+ 56: 37,
+ 57: 38}
+
+start = 256
+
+dfas = [([([(1, 1), (2, 1), (3, 2)], False), ([], True), ([(1, 1)], False)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(42, 1)], False), ([(43, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(44, 1)], False), ([(45, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(46, 1)], False), ([(47, 2)], True), ([(46, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None,
+   48: None}),
+ ([([(49, 1), (48, 2), (5, 2)], False),
+   ([(50, 3), (51, 2)], True),
+   ([(49, 3)], False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None,
+   48: None}),
+ ([([(52, 1)], False), ([(6, 0), (7, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(14, 1)], False),
+   ([(49, 2)], False),
+   ([(47, 3)], True),
+   ([(49, 4)], False),
+   ([], True)],
+  {14: None}),
+ ([([(37, 1)], False), ([(53, 2)], False), ([], True)], {37: None}),
+ ([([(37, 1)], False), ([(53, 2), (54, 2), (55, 2)], False), ([], True)],
+  {37: None}),
+ ([([(4, 1),
+     (13, 2),
+     (35, 3),
+     (39, 4),
+     (40, 4),
+     (41, 5),
+     (8, 4),
+     (11, 4),
+     (12, 4),
+     (10, 4)],
+    False),
+   ([(56, 6), (57, 6), (58, 4)], False),
+   ([(57, 7), (59, 4)], False),
+   ([(60, 8), (61, 4)], False),
+   ([], True),
+   ([(41, 5)], True),
+   ([(58, 4)], False),
+   ([(59, 4)], False),
+   ([(61, 4)], False)],
+  {4: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(38, 1), (62, 2)], False), ([(62, 2)], False), ([(63, 2)], True)],
+  {4: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(64, 1),
+     (65, 1),
+     (66, 1),
+     (67, 1),
+     (68, 1),
+     (69, 1),
+     (70, 1),
+     (71, 1),
+     (72, 1),
+     (73, 1),
+     (74, 1),
+     (75, 1),
+     (76, 1)],
+    False),
+   ([], True)],
+  {64: None,
+   65: None,
+   66: None,
+   67: None,
+   68: None,
+   69: None,
+   70: None,
+   71: None,
+   72: None,
+   73: None,
+   74: None,
+   75: None,
+   76: None}),
+ ([([(15, 1)], False), ([], True)], {15: None}),
+ ([([(16, 1)], False),
+   ([(39, 2)], False),
+   ([(4, 3), (77, 4)], False),
+   ([(78, 5), (58, 6)], False),
+   ([(79, 7)], False),
+   ([(58, 6)], False),
+   ([(77, 4)], False),
+   ([], True)],
+  {16: None}),
+ ([([(20, 1)], False),
+   ([(80, 2)], False),
+   ([(81, 3)], False),
+   ([(82, 4)], False),
+   ([(83, 5)], True),
+   ([], True)],
+  {20: None}),
+ ([([(23, 1)], False), ([(84, 2)], False), ([(83, 3)], True), ([], True)],
+  {23: None}),
+ ([([(50, 1), (85, 1)], False), ([], True)], {20: None, 23: None}),
+ ([([(86, 1),
+     (87, 1),
+     (88, 1),
+     (89, 1),
+     (90, 1),
+     (91, 1),
+     (91, 1),
+     (81, 1),
+     (27, 2),
+     (92, 3)],
+    False),
+   ([], True),
+   ([(81, 1)], False),
+   ([(27, 1)], True)],
+  {27: None,
+   81: None,
+   86: None,
+   87: None,
+   88: None,
+   89: None,
+   90: None,
+   91: None,
+   92: None}),
+ ([([(93, 1)], False), ([(94, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(95, 1),
+     (96, 1),
+     (55, 1),
+     (97, 1),
+     (54, 1),
+     (53, 1),
+     (98, 1),
+     (99, 1),
+     (100, 1)],
+    False),
+   ([], True)],
+  {9: None,
+   16: None,
+   18: None,
+   20: None,
+   23: None,
+   31: None,
+   32: None,
+   33: None,
+   37: None}),
+ ([([(17, 1)], False), ([], True)], {17: None}),
+ ([([(101, 1)], False), ([(98, 2), (53, 2), (102, 2)], False), ([], True)],
+  {9: None}),
+ ([([(9, 1)], False),
+   ([(103, 2)], False),
+   ([(4, 3), (1, 4)], False),
+   ([(78, 5), (58, 6)], False),
+   ([], True),
+   ([(58, 6)], False),
+   ([(1, 4)], False)],
+  {9: None}),
+ ([([(104, 1)], False), ([(104, 1)], True)], {9: None}),
+ ([([(19, 1)], False), ([(80, 2)], False), ([], True)], {19: None}),
+ ([([(49, 1), (48, 2), (105, 3)], False),
+   ([(77, 4), (50, 5), (47, 6)], True),
+   ([(93, 7)], False),
+   ([(50, 5), (47, 6)], True),
+   ([(49, 7)], False),
+   ([], True),
+   ([(49, 8), (105, 8)], True),
+   ([(50, 5), (47, 9)], True),
+   ([(47, 6)], True),
+   ([(49, 10), (48, 11)], True),
+   ([(77, 12)], False),
+   ([(93, 13)], False),
+   ([(49, 13)], False),
+   ([(47, 9)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None,
+   48: None}),
+ ([([(103, 1)], False), ([(106, 2)], True), ([(39, 3)], False), ([], True)],
+  {39: None}),
+ ([([(107, 1)], False), ([(47, 0)], True)], {39: None}),
+ ([([(39, 1)], False), ([(108, 0)], True)], {39: None}),
+ ([([(39, 1)], False), ([], True)], {39: None}),
+ ([([(109, 1)], False), ([(1, 1), (110, 2)], False), ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(111, 1)], False),
+   ([(49, 2)], True),
+   ([(106, 3)], True),
+   ([(39, 4)], False),
+   ([], True)],
+  {111: None}),
+ ([([(112, 1)], False), ([(113, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(114, 1)], False),
+   ([(115, 2), (51, 3)], True),
+   ([(56, 4), (109, 4)], False),
+   ([(56, 5), (114, 5)], False),
+   ([], True),
+   ([(51, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(93, 1), (105, 1)], False),
+   ([(47, 2)], True),
+   ([(93, 1), (105, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(6, 1), (7, 1), (36, 1), (116, 2)], False),
+   ([(117, 2)], False),
+   ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(1, 0), (118, 0), (110, 1)], False), ([], True)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None,
+   110: None}),
+ ([([(119, 1), (120, 1), (121, 1), (122, 1), (123, 1)], False), ([], True)],
+  {15: None, 17: None, 29: None, 30: None, 34: None}),
+ ([([(20, 1)], False),
+   ([(80, 2)], False),
+   ([(81, 3)], False),
+   ([(109, 4)], False),
+   ([(77, 5)], False),
+   ([(79, 6)], False),
+   ([(124, 7)], True),
+   ([(77, 8)], False),
+   ([(79, 9)], False),
+   ([], True)],
+  {20: None}),
+ ([([(18, 1)], False),
+   ([(39, 2)], False),
+   ([(125, 3)], False),
+   ([(126, 4), (77, 5)], False),
+   ([(49, 6)], False),
+   ([(79, 7)], False),
+   ([(77, 5)], False),
+   ([], True)],
+  {18: None}),
+ ([([(22, 1)], False), ([(39, 2)], False), ([(47, 1)], True)], {22: None}),
+ ([([(23, 1)], False),
+   ([(49, 2)], False),
+   ([(77, 3)], False),
+   ([(79, 4)], False),
+   ([(127, 1), (124, 5)], True),
+   ([(77, 6)], False),
+   ([(79, 7)], False),
+   ([], True)],
+  {23: None}),
+ ([([(39, 1)], False), ([(106, 2)], True), ([(39, 3)], False), ([], True)],
+  {39: None}),
+ ([([(128, 1)], False), ([(47, 2)], True), ([(128, 1)], True)], {39: None}),
+ ([([(21, 1)], False),
+   ([(108, 2), (8, 2), (103, 3)], False),
+   ([(108, 2), (8, 2), (103, 3), (24, 4)], False),
+   ([(24, 4)], False),
+   ([(5, 5), (4, 6), (129, 5)], False),
+   ([], True),
+   ([(129, 7)], False),
+   ([(58, 5)], False)],
+  {21: None}),
+ ([([(24, 1)], False), ([(130, 2)], False), ([], True)], {24: None}),
+ ([([(131, 1), (132, 1)], False), ([], True)], {21: None, 24: None}),
+ ([([(25, 1)], False),
+   ([(133, 2), (77, 3)], False),
+   ([(77, 3)], False),
+   ([(49, 4)], False),
+   ([], True)],
+  {25: None}),
+ ([([(25, 1)], False),
+   ([(133, 2), (77, 3)], False),
+   ([(77, 3)], False),
+   ([(84, 4)], False),
+   ([], True)],
+  {25: None}),
+ ([([(26, 1)], False), ([(39, 2)], False), ([(47, 1)], True)], {26: None}),
+ ([([(27, 1), (134, 2)], False), ([(44, 2)], False), ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(135, 1)], False), ([(136, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(4, 1)], False),
+   ([(137, 2), (58, 3)], False),
+   ([(58, 3)], False),
+   ([], True)],
+  {4: None}),
+ ([([(28, 1)], False), ([], True)], {28: None}),
+ ([([(138, 1)], False), ([(48, 2)], True), ([(117, 3)], False), ([], True)],
+  {4: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(29, 1)], False),
+   ([(49, 2)], True),
+   ([(21, 3)], True),
+   ([(49, 4)], False),
+   ([], True)],
+  {29: None}),
+ ([([(30, 1)], False), ([(109, 2)], True), ([], True)], {30: None}),
+ ([([(139, 1)], False), ([(140, 0), (141, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(142, 1)], False),
+   ([(143, 2), (1, 3)], False),
+   ([(142, 1), (1, 3)], False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   17: None,
+   19: None,
+   21: None,
+   22: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   34: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(77, 1)], False), ([(49, 2)], True), ([], True)], {77: None}),
+ ([([(144, 1),
+     (145, 1),
+     (146, 1),
+     (147, 1),
+     (148, 1),
+     (149, 1),
+     (150, 1),
+     (151, 1)],
+    False),
+   ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   17: None,
+   19: None,
+   21: None,
+   22: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   34: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(5, 1)], False), ([(93, 2)], False), ([], True)], {5: None}),
+ ([([(2, 1), (3, 1)], False), ([], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   9: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   16: None,
+   17: None,
+   18: None,
+   19: None,
+   20: None,
+   21: None,
+   22: None,
+   23: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   31: None,
+   32: None,
+   33: None,
+   34: None,
+   35: None,
+   36: None,
+   37: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(49, 1), (77, 2)], False),
+   ([(77, 2)], True),
+   ([(49, 3), (152, 4)], True),
+   ([(152, 4)], True),
+   ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None,
+   77: None}),
+ ([([(153, 1)], False), ([(47, 2)], True), ([(153, 1)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None,
+   77: None}),
+ ([([(2, 1), (1, 2)], False),
+   ([], True),
+   ([(154, 3)], False),
+   ([(118, 4)], False),
+   ([(118, 4), (155, 1)], False)],
+  {1: None,
+   4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   14: None,
+   15: None,
+   17: None,
+   19: None,
+   21: None,
+   22: None,
+   24: None,
+   25: None,
+   26: None,
+   27: None,
+   28: None,
+   29: None,
+   30: None,
+   34: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(117, 1)], False), ([(5, 0), (9, 0), (156, 0), (157, 0), (158, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(82, 1), (159, 2)], False),
+   ([(23, 3)], True),
+   ([], True),
+   ([(82, 4)], False),
+   ([(124, 5)], False),
+   ([(49, 2)], False)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(82, 1), (160, 1)], False), ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(49, 1)], False), ([(47, 2)], True), ([(49, 1)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(49, 1), (105, 1)], False),
+   ([(50, 2), (47, 3)], True),
+   ([], True),
+   ([(49, 4), (105, 4)], True),
+   ([(47, 3)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(49, 1), (105, 1)], False),
+   ([(47, 2)], True),
+   ([(49, 1), (105, 1)], True)],
+  {4: None,
+   5: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(39, 1)], False), ([(77, 2)], True), ([(49, 3)], False), ([], True)],
+  {39: None}),
+ ([([(4, 1), (13, 2), (108, 3)], False),
+   ([(78, 4), (58, 5)], False),
+   ([(161, 6)], False),
+   ([(39, 5)], False),
+   ([(58, 5)], False),
+   ([], True),
+   ([(59, 5)], False)],
+  {4: None, 13: None, 108: None}),
+ ([([(31, 1)], False),
+   ([(77, 2)], False),
+   ([(79, 3)], False),
+   ([(162, 4), (163, 5)], False),
+   ([(77, 6)], False),
+   ([(77, 7)], False),
+   ([(79, 8)], False),
+   ([(79, 9)], False),
+   ([(162, 4), (124, 10), (163, 5)], True),
+   ([], True),
+   ([(77, 11)], False),
+   ([(79, 12)], False),
+   ([(163, 5)], True)],
+  {31: None}),
+ ([([(164, 1), (5, 2), (48, 3)], False),
+   ([(51, 4), (47, 5)], True),
+   ([(164, 6), (47, 7)], True),
+   ([(164, 8)], False),
+   ([(49, 9)], False),
+   ([(164, 1), (5, 10), (48, 3)], True),
+   ([(47, 7)], True),
+   ([(164, 11), (48, 3)], False),
+   ([], True),
+   ([(47, 5)], True),
+   ([(164, 12), (47, 13)], True),
+   ([(47, 7), (51, 14)], True),
+   ([(47, 13)], True),
+   ([(164, 15), (48, 3)], False),
+   ([(49, 6)], False),
+   ([(47, 13), (51, 16)], True),
+   ([(49, 12)], False)],
+  {5: None, 39: None, 48: None}),
+ ([([(165, 1), (5, 2), (48, 3)], False),
+   ([(51, 4), (47, 5)], True),
+   ([(165, 6), (47, 7)], True),
+   ([(165, 8)], False),
+   ([(49, 9)], False),
+   ([(165, 1), (5, 10), (48, 3)], True),
+   ([(47, 7)], True),
+   ([(165, 11), (48, 3)], False),
+   ([], True),
+   ([(47, 5)], True),
+   ([(165, 12), (47, 13)], True),
+   ([(47, 7), (51, 14)], True),
+   ([(47, 13)], True),
+   ([(165, 15), (48, 3)], False),
+   ([(49, 6)], False),
+   ([(47, 13), (51, 16)], True),
+   ([(49, 12)], False)],
+  {5: None, 39: None, 48: None}),
+ ([([(39, 1)], False), ([], True)], {39: None}),
+ ([([(32, 1)], False),
+   ([(49, 2)], False),
+   ([(77, 3)], False),
+   ([(79, 4)], False),
+   ([(124, 5)], True),
+   ([(77, 6)], False),
+   ([(79, 7)], False),
+   ([], True)],
+  {32: None}),
+ ([([(49, 1)], False), ([(106, 2)], True), ([(93, 3)], False), ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(33, 1)], False),
+   ([(166, 2)], False),
+   ([(47, 1), (77, 3)], False),
+   ([(79, 4)], False),
+   ([], True)],
+  {33: None}),
+ ([([(167, 1)], False), ([(168, 0)], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(21, 1), (109, 2)], False), ([(49, 2)], False), ([], True)],
+  {4: None,
+   6: None,
+   7: None,
+   8: None,
+   10: None,
+   11: None,
+   12: None,
+   13: None,
+   21: None,
+   25: None,
+   27: None,
+   35: None,
+   36: None,
+   38: None,
+   39: None,
+   40: None,
+   41: None}),
+ ([([(34, 1)], False), ([(169, 2)], True), ([], True)], {34: None}),
+ ([([(56, 1)], False), ([], True)], {34: None})]
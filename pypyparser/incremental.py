@@ -0,0 +1,274 @@
+"""Incremental reparsing of edited sources.
+
+IncrementalParser keeps the AST of a module together with the lines of its
+source and the position of its top-level statements.  After an edit, only
+the top-level statements around the edited lines are parsed again:
+
+* reparsing starts at the top-level statement before the one containing the
+  start of the edit, because an indented line inserted at the start of a
+  statement belongs to the block of the previous one.  The tokenizer is in
+  a known state there: no open parenthesis or string, no continuation line
+  and an empty stack of indents;
+
+* it stops at the first top-level statement which starts after the end of
+  the edit.  That statement is unchanged and starts at column 0, so the
+  tokenizer is back to the same state there unless the reparsed lines end
+  inside a parenthesis, string or continuation line, which they can only do
+  with an error.
+
+The ASTs of the other statements are reused.  When the reparsed lines do
+not parse on their own, the whole module is parsed again, to report the
+same error as a full parse or to find that the statements around the edit
+have changed more than expected.
+
+An edit which changes the number of lines moves all the statements after
+it, so nothing about them is updated then:
+
+* the first lines of the statements before the last edit are kept as line
+  numbers and those of the statements after it as offsets from the end of
+  the source, which do not change.  The next edit only converts the
+  entries between the two edits, like the gap buffer of a text editor;
+
+* the line numbers in the AST of a statement are moved when it is read
+  from the body of the module, which is a StatementList.  The first line
+  of the statement when its AST was last moved is kept for that.
+"""
+
+import bisect
+
+from . import pyparse, ast, error
+
+# the characters ending lines for str.splitlines()
+LINE_ENDS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+class IncrementalParser:
+    """Parser keeping the AST of a source up to date with its edits.
+
+    The source is a str.  `module` holds the AST of the current source, or
+    None if it has a syntax error, which is then kept in `error`.  Edits
+    update `module` in place: the ASTs of the statements which are not
+    reparsed are kept in its body, and their line numbers are moved when
+    they are read from there.
+    """
+
+    def __init__(self, version, source, filename="<unknown>", flags=0):
+        self.parser = pyparse.PythonParser(version)
+        self.filename = filename
+        self.base_flags = flags
+        self.flags = flags
+        self.lines = source.splitlines(True)
+        # one entry per top-level AST statement.  `starts` has its first
+        # line: a line number before the index `gap`, an offset from the end
+        # of the source from there.  `ast_starts` has the first line it had
+        # when the line numbers of its AST were last set.
+        self.starts = []
+        self.ast_starts = []
+        self.gap = 0
+        self.body = StatementList(None)
+        self.module = None
+        self.error = None
+        try:
+            self._parse_all()
+        except error.SyntaxError:
+            pass
+
+    def get_source(self):
+        return "".join(self.lines)
+
+    def _parse_all(self):
+        self.body.detach()
+        self.module = None
+        self.starts = []
+        self.ast_starts = []
+        self.gap = 0
+        self.body = StatementList(None)
+        info = pyparse.CompileInfo(self.filename, "exec", self.base_flags)
+        try:
+            statements = self.parser.parse_statements(self.get_source(), info)
+        except error.SyntaxError as e:
+            self.error = e
+            raise
+        self.flags = info.flags
+        self.error = None
+        self.body.parser = self
+        self._set_statements(0, 0, statements)
+        self.module = ast.Module(self.body)
+
+    def _set_statements(self, start, stop, statements):
+        starts = []
+        stmts = []
+        for lineno, linestmts in statements:
+            starts.extend([lineno] * len(linestmts))
+            stmts.extend(linestmts)
+        # the gap is at `stop`, so the entries replaced are line numbers
+        self.starts[start:stop] = starts
+        self.ast_starts[start:stop] = starts
+        list.__setitem__(self.body, slice(start, stop), stmts)
+        self.gap = start + len(starts)
+
+    def _start(self, index):
+        """Return the first line of the statement of entry `index`."""
+        if index < self.gap:
+            return self.starts[index]
+        return self.starts[index] + len(self.lines)
+
+    def _bisect(self, lineno):
+        """Return the number of statements starting at or before line
+        `lineno`."""
+        index = bisect.bisect_right(self.starts, lineno, 0, self.gap)
+        if index == self.gap:
+            index = bisect.bisect_right(self.starts,
+                                        lineno - len(self.lines), index)
+        return index
+
+    def _move_gap(self, index):
+        gap = self.gap
+        n = len(self.lines)
+        if gap < index:
+            self.starts[gap:index] = [start + n
+                                      for start in self.starts[gap:index]]
+        elif index < gap:
+            self.starts[index:gap] = [start - n
+                                      for start in self.starts[index:gap]]
+        self.gap = index
+
+    def _move_statement(self, index):
+        """Move the line numbers of the AST of entry `index` to where its
+        statement is now."""
+        start = self._start(index)
+        delta = start - self.ast_starts[index]
+        if delta:
+            move_lines([list.__getitem__(self.body, index)], delta)
+            self.ast_starts[index] = start
+
+    def edit(self, start, end, replacement):
+        """Replace the text between two positions and return the new AST.
+
+        `start` and `end` are (lineno, column) positions, with lines counted
+        from 1 and columns from 0.  Raises SyntaxError if the new source
+        does not parse.
+        """
+        first = start[0] - 1
+        last = end[0] - 1
+        text = (self._line(first)[:start[1]] + replacement +
+                self._line(last)[end[1]:])
+        # split the edited lines the way the whole source would be split
+        if (first > 0 and text[:1] == "\n" and
+                self.lines[first - 1][-1] == "\r"):
+            first -= 1
+            text = self.lines[first] + text
+        while text and last + 1 < len(self.lines):
+            if text[-1] == "\r":
+                if self.lines[last + 1][0] != "\n":
+                    break
+            elif text[-1] in LINE_ENDS:
+                break
+            last += 1
+            text += self.lines[last]
+        new_lines = text.splitlines(True)
+        old_stop = min(last + 1, len(self.lines))
+        if self.module is None:
+            self.lines[first:old_stop] = new_lines
+            self._parse_all()
+            return self.module
+
+        # top-level statements to reparse, start included and stop excluded.
+        # The statements separated by semicolons have an entry each, so
+        # this finds the first entry of the line of the containing statement,
+        # then the first entry of the line of the statement before it.
+        stmt_start = self._bisect(first + 1)
+        if stmt_start:
+            stmt_start = self._bisect(self._start(stmt_start - 1) - 1)
+        if stmt_start:
+            stmt_start = self._bisect(self._start(stmt_start - 1) - 1)
+        stmt_stop = self._bisect(last + 1)
+        # the statements after the gap move with the end of the source
+        self._move_gap(stmt_stop)
+        self.lines[first:old_stop] = new_lines
+        if stmt_start == 0:
+            first_lineno = 1
+            flags = self.base_flags
+        else:
+            first_lineno = self._start(stmt_start)
+            flags = self.flags
+        if stmt_stop < len(self.starts):
+            stop_lineno = self._start(stmt_stop)
+        else:
+            stop_lineno = len(self.lines) + 1
+        source = "".join(self.lines[first_lineno - 1:stop_lineno - 1])
+        info = pyparse.CompileInfo(self.filename, "exec", flags)
+        try:
+            statements = self.parser.parse_statements(source, info,
+                                                      first_lineno)
+        except error.SyntaxError:
+            self._parse_all()
+            return self.module
+        if stmt_start == 0:
+            self.flags = info.flags
+        elif info.flags != flags:
+            # a __future__ import moved to the start of the reparsed lines,
+            # which is not the start of the module
+            self._parse_all()
+            return self.module
+        self._set_statements(stmt_start, stmt_stop, statements)
+        return self.module
+
+    def _line(self, index):
+        if index < len(self.lines):
+            return self.lines[index]
+        return ""
+
+
+class StatementList(list):
+    """The body of the module of an IncrementalParser.
+
+    Reading a statement from it moves its line numbers to where it is in
+    the current source.  detach() moves those of all the statements, and
+    the list is then a plain list of statements.
+    """
+
+    def __init__(self, parser):
+        list.__init__(self)
+        self.parser = parser
+
+    def __getitem__(self, index):
+        if self.parser is not None:
+            if isinstance(index, slice):
+                return [self[i] for i in range(*index.indices(len(self)))]
+            item = list.__getitem__(self, index)
+            if index < 0:
+                index += len(self)
+            self.parser._move_statement(index)
+            return item
+        return list.__getitem__(self, index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reversed__(self):
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
+
+    def detach(self):
+        if self.parser is not None:
+            for i in range(len(self)):
+                self.parser._move_statement(i)
+            self.parser = None
+
+
+def move_lines(nodes, delta):
+    """Add delta to the line numbers of the trees in the list `nodes`."""
+    todo = list(nodes)
+    while todo:
+        node = todo.pop()
+        if isinstance(node, list):
+            todo.extend(node)
+        elif isinstance(node, ast.AST):
+            if isinstance(node, LINENO_CLASSES):
+                node.lineno += delta
+            for name in node._fields:
+                todo.append(getattr(node, name))
+
+LINENO_CLASSES = (ast.stmt, ast.expr, ast.excepthandler, ast.arg)
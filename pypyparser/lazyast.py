@@ -0,0 +1,97 @@
+"""Lazy ASTs, built from the parse tree as they are read.
+
+LazyASTBuilder is used like ASTBuilder::
+
+    tree = parser.parse_source(source, compile_info)
+    module = LazyASTBuilder(tree, compile_info, parser.syms).build_ast()
+
+but the statements of the module are LazyStmt objects, which keep the node
+of the parse tree of their statement.  The AST of a statement is built by
+the usual handle_*() methods the first time one of its fields is read, and
+kept.  The statements in its body, its `else` clause, its `except` clauses
+and so on are LazyStmt objects in turn, so that reading the name of a class
+does not build its methods, and reading the names of its methods does not
+build their bodies.  Expressions are built with their statement.
+
+The syntax errors found while building the AST, like an assignment to a
+literal, are raised when the statement is read.  materialize() builds
+what is left of a lazy AST and returns an AST of ast.py nodes only.
+"""
+
+from . import astbuilder, ast
+
+
+class LazyStmt:
+    """A statement of a lazy AST.
+
+    Reading an attribute other than `builder`, `cst`, `node` and the
+    special `__*__` names builds the AST node of the statement and reads
+    it from there; `node` is None until then.
+    """
+
+    __slots__ = ("builder", "cst", "node")
+
+    def __init__(self, builder, cst):
+        self.builder = builder
+        self.cst = cst
+        self.node = None
+
+    def __repr__(self):
+        return "<LazyStmt at line %d>" % (self.cst.get_lineno(),)
+
+    def get_node(self):
+        """Return the AST node of the statement, building it if needed.
+
+        The statements of its bodies are LazyStmt objects.
+        """
+        node = self.node
+        if node is None:
+            node = astbuilder.ASTBuilder.handle_stmt(self.builder, self.cst)
+            self.node = node
+        return node
+
+    def __getattr__(self, name):
+        # An unset slot or a special name is not a field of the node: with
+        # copy.copy() or pickle, the slots are still unset when these are
+        # looked up, and get_node() would look up `node` again.
+        if name in LazyStmt.__slots__ or (name.startswith("__") and
+                                          name.endswith("__")):
+            raise AttributeError(name)
+        return getattr(self.get_node(), name)
+
+    def __setattr__(self, name, value):
+        if name in LazyStmt.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.get_node(), name, value)
+
+
+class LazyASTBuilder(astbuilder.ASTBuilder):
+    """ASTBuilder making a LazyStmt of every statement."""
+
+    def handle_stmt(self, stmt):
+        return LazyStmt(self, stmt)
+
+
+def materialize(tree):
+    """Build all the statements of a lazy AST and return its AST.
+
+    The lists of statements of `tree` are updated in place, so the
+    LazyStmt objects which were read before keep their node.
+    """
+    if isinstance(tree, LazyStmt):
+        tree = tree.get_node()
+    todo = [tree]
+    while todo:
+        node = todo.pop()
+        for name in node._fields:
+            value = getattr(node, name)
+            if not isinstance(value, list):
+                continue
+            for i in range(len(value)):
+                item = value[i]
+                if isinstance(item, LazyStmt):
+                    item = value[i] = item.get_node()
+                if isinstance(item, (ast.stmt, ast.excepthandler)):
+                    todo.append(item)
+    return tree
@@ -0,0 +1,230 @@
+"""Lazy parsing of function bodies.
+
+LazyParser parses a module like PythonParser.parse(), except for the
+blocks of its functions.  The source is tokenized into a TokenBuffer, and
+when the parser has shifted the colon of a `def` followed by NEWLINE and
+INDENT, the tokens up to the matching DEDENT are skipped: the parser is
+given a `pass` statement instead.  The functions of the AST are then
+LazyFunctionDef and LazyAsyncFunctionDef nodes, which remember the range of
+tokens of their block and parse it the first time their `body` is read,
+the functions nested in it being lazy in turn.
+
+Tools which only look at the declarations of a module, like indexers,
+skip most of the parsing and AST building this way.  The whole source is
+still tokenized, so the errors of the tokenizer are raised by parse(), but
+the syntax errors inside a function block are only raised when its body is
+read.  Functions whose body is on the line of their `def` are parsed right
+away.
+"""
+
+from . import pyparse, pytokenizer, astbuilder, ast, future, error
+from .parser import ParseError
+from .pytoken import Token
+
+INDENT = bytes([Token.INDENT])
+DEDENT = bytes([Token.DEDENT])
+
+
+def _lazy_body(cls):
+    """Return the `body` property of a lazy subclass of node class `cls`."""
+    body_slot = cls.body
+
+    def get_body(self):
+        lazy_body = self.lazy_body
+        if lazy_body is not None:
+            body = lazy_body.parse()
+            body_slot.__set__(self, body)
+            self.lazy_body = None
+        return body_slot.__get__(self, cls)
+
+    def set_body(self, body):
+        self.lazy_body = None
+        body_slot.__set__(self, body)
+
+    return property(get_body, set_body)
+
+
+class LazyFunctionDef(ast.FunctionDef):
+    """FunctionDef whose body is parsed when it is first read."""
+    __slots__ = ("lazy_body",)
+    body = _lazy_body(ast.FunctionDef)
+
+
+class LazyAsyncFunctionDef(ast.AsyncFunctionDef):
+    """AsyncFunctionDef whose body is parsed when it is first read."""
+    __slots__ = ("lazy_body",)
+    body = _lazy_body(ast.AsyncFunctionDef)
+
+
+class LazyBody:
+    """The tokens of a function block, between its INDENT and DEDENT."""
+
+    def __init__(self, parser, tokens, token_types, start, end,
+                 compile_info):
+        self.parser = parser
+        self.tokens = tokens
+        self.token_types = token_types
+        self.start = start
+        self.end = end
+        self.compile_info = compile_info
+
+    def parse(self):
+        """Return the AST statements of the block."""
+        return self.parser._parse_block(self.tokens, self.token_types,
+                                        self.start, self.end,
+                                        self.compile_info)
+
+
+class LazyASTBuilder(astbuilder.ASTBuilder):
+    """ASTBuilder making lazy functions of the blocks skipped by the parser.
+
+    `bodies` maps the line of the INDENT of every skipped block to its
+    LazyBody.
+    """
+
+    def __init__(self, n, compile_info, syms, bodies):
+        astbuilder.ASTBuilder.__init__(self, n, compile_info, syms)
+        self.bodies = bodies
+
+    def handle_funcdef_impl(self, funcdef_node, is_async, decorators=None):
+        node = astbuilder.ASTBuilder.handle_funcdef_impl(
+            self, funcdef_node, is_async, decorators)
+        suite = funcdef_node.get_child(funcdef_node.num_children() - 1)
+        if suite.num_children() == 1:
+            return node
+        if is_async:
+            cls = LazyAsyncFunctionDef
+        else:
+            cls = LazyFunctionDef
+        lazy = cls(node.name, node.args, None, node.decorator_list,
+                   node.returns, node.lineno, node.col_offset)
+        lazy.lazy_body = self.bodies[suite.get_child(1).get_lineno()]
+        return lazy
+
+
+class TokenTypes:
+    """The types of the tokens of a TokenBuffer, as bytes.
+
+    Used to find the DEDENT matching an INDENT with bytes.find(), which
+    only stops at the INDENT and DEDENT tokens in between.
+    """
+
+    def __init__(self, tokens):
+        self.types = bytes(tokens.types.tolist())
+
+    def matching_dedent(self, indent):
+        types = self.types
+        depth = 1
+        pos = indent + 1
+        next_indent = types.find(INDENT, pos)
+        while True:
+            next_dedent = types.find(DEDENT, pos)
+            if 0 <= next_indent < next_dedent:
+                depth += 1
+                pos = next_indent + 1
+                next_indent = types.find(INDENT, pos)
+            else:
+                depth -= 1
+                if depth == 0:
+                    return next_dedent
+                pos = next_dedent + 1
+
+
+class LazyParser:
+    """Parser leaving the function bodies of a module to be parsed later.
+
+    parse() returns the same AST as PythonParser.parse(), see the module
+    docstring for the functions.  Modes other than 'exec' are parsed
+    normally.
+    """
+
+    def __init__(self, version):
+        self.parser = pyparse.PythonParser(version)
+
+    def parse(self, bytessrc, compile_info):
+        """Parse a source, leaving its function bodies for later."""
+        parser = self.parser
+        if compile_info.mode != 'exec':
+            return parser.parse(bytessrc, compile_info)
+        source_lines, flags, enc = parser.decode_source(bytessrc,
+                                                        compile_info)
+        try:
+            tokens = pytokenizer.tokenize_buffer(source_lines, flags,
+                                                 tokenizer=parser.tokenizer)
+        except (error.TokenError, error.TokenIndentationError) as e:
+            e.filename = compile_info.filename
+            raise
+        newflags, last_future_import = future.add_future_flags(
+            parser.future_flags, future.TokenIterator(tokens))
+        compile_info.last_future_import = last_future_import
+        compile_info.flags |= newflags
+        stmts = self._parse_block(tokens, TokenTypes(tokens), 0, len(tokens),
+                                  compile_info)
+        if enc is not None:
+            compile_info.encoding = enc
+        return ast.Module(stmts)
+
+    def _parse_block(self, tokens, token_types, start, end, compile_info):
+        """Parse the statements of tokens[start:end] into AST statements.
+
+        When `end` is not the end of the tokens, the block is followed by
+        an ENDMARKER to make a module of it.
+        """
+        parser = self.parser
+        syms = parser.syms
+        types = tokens.types
+        linenos = tokens.linenos
+        columns = tokens.columns
+        bodies = {}
+        state = parser.new_state(syms.file_input)
+        i = start
+        tp = 0
+        last_value_seen = None
+        next_value_seen = None
+        try:
+            while i < end:
+                tp = types[i]
+                value = tokens.get_value(i)
+                next_value_seen = value
+                state.add_token(tp, value, linenos[i], columns[i], None)
+                last_value_seen = value
+                i += 1
+                if (tp == Token.COLON and i + 1 < end and
+                        types[i] == Token.NEWLINE and
+                        types[i + 1] == Token.INDENT and
+                        state.stack[-1][0] == syms.funcdef):
+                    indent = i + 1
+                    dedent = token_types.matching_dedent(indent)
+                    bodies[linenos[indent]] = LazyBody(
+                        self, tokens, token_types, indent + 1, dedent,
+                        compile_info)
+                    i = self._skip_block(state, tokens, i, dedent)
+            if end < len(tokens):
+                tp = Token.ENDMARKER
+                state.add_token(tp, "", linenos[end], columns[end], None)
+        except ParseError as e:
+            if i < len(tokens):
+                e.line = tokens.get_line(i)
+            raise pyparse.convert_parse_error(e, tp, last_value_seen,
+                                              next_value_seen,
+                                              compile_info.filename)
+        builder = LazyASTBuilder(state.root, compile_info, syms, bodies)
+        return builder.build_ast().body
+
+    def _skip_block(self, state, tokens, newline, dedent):
+        """Give the parse `state` a `pass` block instead of the block after
+        the NEWLINE at index `newline`, and return the index after its
+        DEDENT.
+        """
+        add_token = state.add_token
+        lineno = tokens.linenos[newline + 1]
+        column = tokens.columns[newline + 1]
+        add_token(Token.NEWLINE, tokens.get_value(newline),
+                  tokens.linenos[newline], tokens.columns[newline], None)
+        add_token(Token.INDENT, tokens.get_value(newline + 1), lineno, 0,
+                  None)
+        add_token(Token.NAME, "pass", lineno, column, None)
+        add_token(Token.NEWLINE, "", lineno, column, None)
+        add_token(Token.DEDENT, "", tokens.linenos[dedent],
+                  tokens.columns[dedent], None)
+        return dedent + 1
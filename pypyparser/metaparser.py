@@ -5,6 +5,7 @@ Inspired by Guido van Rossum's pgen2.
 """
 
 from io import StringIO
+import itertools
 import tokenize
 import token
 
@@ -20,8 +21,13 @@ class PgenError(Exception):
 
 class NFA:
 
+    # Numbers the states in creation order, so that they can be visited in a
+    # deterministic order and the generated tables are reproducible.
+    _counter = itertools.count()
+
     def __init__(self):
         self.arcs = []
+        self.number = next(NFA._counter)
 
     def arc(self, to_state, label=None):
         self.arcs.append((label, to_state))
@@ -85,7 +91,7 @@ def nfa_to_dfa(start, end):
     state_stack = [DFA(base_nfas, end)]
     for state in state_stack:
         arcs = {}
-        for nfa in state.nfas:
+        for nfa in sorted(state.nfas, key=lambda nfa: nfa.number):
             for label, sub_nfa in nfa.arcs:
                 if label is not None:
                     sub_nfa.find_unlabeled_states(arcs.setdefault(label, set()))
@@ -150,6 +156,7 @@ class ParserGenerator:
             gram.dfas.append((states, self.make_first(gram, name)))
             assert len(gram.dfas) - 1 == gram.symbol_ids[name] - 256
         gram.start = gram.symbol_ids[self.start_symbol]
+        gram.dispatch = parser.make_dispatch(gram)
         return gram
 
     def make_label(self, gram, label):
@@ -199,7 +206,7 @@ class ParserGenerator:
     def make_first(self, gram, name):
         original_firsts = self.first[name]
         firsts = dict()
-        for label in original_firsts:
+        for label in sorted(original_firsts):
             firsts[self.make_label(gram, label)] = None
         return firsts
 
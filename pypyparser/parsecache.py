@@ -0,0 +1,168 @@
+"""On-disk cache of parsed modules.
+
+ParseCache wraps PythonParser.parse(): the AST of every source it parses is
+saved in a directory, serialized with astdump, in a file named after the
+hash of everything the AST depends on:
+
+* the source itself, and whether it was given as str or bytes, which are
+  decoded differently;
+* the grammar version;
+* the mode and flags of the CompileInfo;
+* CACHE_VERSION and the astdump format, for changes of the parser or of the
+  AST classes.
+
+Parsing the same source again loads the file instead.  Files which cannot
+be read back, for instance because they were truncated, are treated as
+missing.  When the files take more than `max_size` bytes, the ones which
+were least recently used are removed.
+"""
+
+import hashlib
+import marshal
+import os
+import tempfile
+
+from . import pyparse, astdump
+
+
+# Change this when the ASTs built from the same source change.
+CACHE_VERSION = 1
+
+SUFFIX = ".ast"
+
+
+class ParseCache:
+    """Parser caching the ASTs of the sources it parses in `directory`.
+
+    `hits` and `misses` count the calls to parse() which could and could
+    not use the cache, and `evictions` the files removed to keep the cache
+    under `max_size` bytes.
+    """
+
+    def __init__(self, directory, version, max_size=256 * 1024 * 1024):
+        self.directory = directory
+        self.version = version
+        self.max_size = max_size
+        self.parser = pyparse.PythonParser(version)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(size for path, size, mtime in self._entries())
+
+    def key(self, source, compile_info):
+        """Return the name of the cache file for a source."""
+        # a str is not decoded with its coding cookie, unlike its bytes
+        kind = "str" if isinstance(source, str) else "bytes"
+        if kind == "str":
+            source = source.encode("utf-8", "surrogatepass")
+        h = hashlib.sha1()
+        h.update(("%d %d %s %s %d %s\0" % (
+            CACHE_VERSION, astdump.FORMAT_VERSION, self.version,
+            compile_info.mode, compile_info.flags, kind)).encode())
+        h.update(source)
+        return h.hexdigest()
+
+    def parse(self, source, compile_info):
+        """Return the AST of a source, like PythonParser.parse()."""
+        key = self.key(source, compile_info)
+        path = self._path(key)
+        tree = self._load(path, key, compile_info)
+        if tree is not None:
+            self.hits += 1
+            return tree
+        self.misses += 1
+        flags = compile_info.flags
+        tree = self.parser.parse(source, compile_info)
+        # compile_info.flags gained the __future__ flags of the source
+        entry = marshal.dumps((CACHE_VERSION, key, compile_info.encoding,
+                               compile_info.flags & ~flags,
+                               compile_info.last_future_import,
+                               astdump.dump(tree)))
+        self._store(path, entry)
+        return tree
+
+    def clear(self):
+        """Remove all the files of the cache."""
+        for path, size, mtime in self._entries():
+            self._remove(path, size)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key[2:] + SUFFIX)
+
+    def _load(self, path, key, compile_info):
+        try:
+            with open(path, "rb") as f:
+                entry = f.read()
+        except OSError:
+            return None
+        try:
+            (version, entry_key, encoding, future_flags, last_future_import,
+             dumped) = marshal.loads(entry)
+            if version != CACHE_VERSION or entry_key != key:
+                raise ValueError("stale cache entry")
+            tree = astdump.load(dumped)
+        except (ValueError, TypeError, EOFError, IndexError, KeyError):
+            self._remove(path, len(entry))
+            return None
+        compile_info.encoding = encoding
+        compile_info.flags |= future_flags
+        compile_info.last_future_import = last_future_import
+        try:
+            # the modification time records when the entry was last used
+            os.utime(path)
+        except OSError:
+            pass
+        return tree
+
+    def _store(self, path, entry):
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(entry)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        self.size += len(entry)
+        if self.size > self.max_size:
+            self._evict()
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        self.size = sum(size for path, size, mtime in entries)
+        for path, size, mtime in entries:
+            if self.size <= self.max_size:
+                break
+            self._remove(path, size)
+            self.evictions += 1
+
+    def _remove(self, path, size):
+        try:
+            os.unlink(path)
+        except OSError:
+            return
+        self.size -= size
+
+    def _entries(self):
+        """Return (path, size, mtime) for every file of the cache."""
+        entries = []
+        for subdir in os.listdir(self.directory):
+            subdir = os.path.join(self.directory, subdir)
+            if not os.path.isdir(subdir):
+                continue
+            for name in os.listdir(subdir):
+                if not name.endswith(SUFFIX):
+                    continue
+                path = os.path.join(subdir, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, st.st_size, st.st_mtime_ns))
+        return entries
@@ -17,6 +17,7 @@ class Grammar:
         self.symbol_to_label = {}
         self.keyword_ids = {}
         self.dfas = []
+        self.dispatch = []
         self.labels = [0]
         self.token_ids = {}
         self.start = -1
@@ -24,11 +25,13 @@ class Grammar:
     def shared_copy(self):
         new = self.__class__()
         new.symbol_ids = self.symbol_ids
-        new.symbols_names = self.symbol_names
+        new.symbol_names = self.symbol_names
         new.keyword_ids = self.keyword_ids
         new.dfas = self.dfas
+        new.dispatch = self.dispatch
         new.labels = self.labels
         new.token_ids = self.token_ids
+        new.start = self.start
         return new
 
     def _freeze_(self):
@@ -42,6 +45,46 @@ class Grammar:
         return True
 
 
+def make_dispatch(gram):
+    """Compute the parser actions of every DFA state of a grammar.
+
+    For each state, this is a dict mapping the label of every token that can
+    be accepted in that state to a (next_state, pushes) pair: `pushes` is the
+    chain of (return_state, symbol_id) nonterminals to push before the token
+    can be shifted, and `next_state` is the state reached by the shift.  A
+    label missing from the dict means that the current node must be popped
+    if the state is accepting, and is a syntax error otherwise.
+    """
+    dispatch = [None] * len(gram.dfas)
+
+    def state_actions(dfa_index, state_index):
+        states = gram.dfas[dfa_index][0]
+        if dispatch[dfa_index] is None:
+            dispatch[dfa_index] = [None] * len(states)
+        actions = dispatch[dfa_index][state_index]
+        if actions is not None:
+            return actions
+        actions = {}
+        for label, next_state in states[state_index][0]:
+            sym_id = gram.labels[label]
+            if sym_id < 256:
+                actions.setdefault(label, (next_state, ()))
+            else:
+                sub_actions = state_actions(sym_id - 256, 0)
+                for sub_label in gram.dfas[sym_id - 256][1]:
+                    shift_state, pushes = sub_actions[sub_label]
+                    actions.setdefault(
+                        sub_label,
+                        (shift_state, ((next_state, sym_id),) + pushes))
+        dispatch[dfa_index][state_index] = actions
+        return actions
+
+    for dfa_index, (states, first) in enumerate(gram.dfas):
+        for state_index in range(len(states)):
+            state_actions(dfa_index, state_index)
+    return dispatch
+
+
 class Node:
 
     __slots__ = ("type", )
@@ -182,71 +225,158 @@ class ParseError(Exception):
 
 
 class Parser:
+    """Parse a stream of tokens into a tree of Nodes.
+
+    In the default mode, every nonterminal of the grammar gets a node.  If
+    `collapsible` is given, it is a set of symbol ids of pass-through
+    nonterminals: when one of these ends up with a single child, no node is
+    created for it and the child takes its place in the tree.
+
+    The state of a parse is kept in the ParseState returned by new_state(),
+    so that a Parser, which only holds its grammar, can run several parses
+    at once, in several threads or nested in each other.  prepare() and
+    add_token(), or prepare_check() and check_token(), run one parse at a
+    time instead, with its state in the `state` attribute.
+    """
 
-    def __init__(self, grammar):
+    def __init__(self, grammar, collapsible=frozenset()):
         self.grammar = grammar
-        self.root = None
-        self.stack = None
+        self.collapsible = collapsible
+        # Maps symbol ids to functions called with each completed node of
+        # that type, for the parses started by prepare(); see ParseState.
+        self.reducers = {}
+        self.state = None
+
+    def new_state(self, start=-1, reducers=None):
+        """Return a new ParseState for a parse from the symbol `start`."""
+        if start == -1:
+            start = self.grammar.start
+        if reducers is None:
+            reducers = {}
+        return ParseState(self.grammar, self.collapsible, start, reducers)
+
+    def new_check_state(self, start=-1):
+        """Return a new CheckState for a parse from the symbol `start`."""
+        if start == -1:
+            start = self.grammar.start
+        return CheckState(self.grammar, start)
+
+    @property
+    def root(self):
+        if self.state is None:
+            return None
+        return self.state.root
+
+    @property
+    def stack(self):
+        if self.state is None:
+            return None
+        return self.state.stack
 
     def prepare(self, start=-1):
         """Setup the parser for parsing.
 
         Takes the starting symbol as an argument.
         """
-        if start == -1:
-            start = self.grammar.start
+        self.state = self.new_state(start, self.reducers)
+
+    def add_token(self, token_type, value, lineno, column, line):
+        return self.state.add_token(token_type, value, lineno, column, line)
+
+    def add_tokens(self, tokens, start=0):
+        return self.state.add_tokens(tokens, start)
+
+    def prepare_check(self, start=-1):
+        """Setup the parser for check_token() instead of add_token()."""
+        self.state = self.new_check_state(start)
+
+    def check_token(self, token_type, value, lineno, column, line):
+        return self.state.check_token(token_type, value, lineno, column,
+                                      line)
+
+
+class ParseState:
+    """The state of one parse: its stack, and its tree once it is done.
+
+    `reducers` maps symbol ids to functions called with each completed node
+    of that type; they return the node to add to its parent, or None to
+    leave it out of the tree.
+    """
+
+    def __init__(self, grammar, collapsible, start, reducers):
+        self.grammar = grammar
+        self.collapsible = collapsible
+        self.reducers = reducers
         self.root = None
         current_node = Nonterminal(start, [])
-        self.stack = []
-        self.stack.append((self.grammar.dfas[start - 256], 0, current_node))
+        # The stack holds (symbol id, DFA state, node) entries.
+        self.stack = [(start, 0, current_node)]
 
     def add_token(self, token_type, value, lineno, column, line):
         label_index = self.classify(token_type, value, lineno, column, line)
-        sym_id = 0 # for the annotator
+        grammar = self.grammar
         while True:
-            dfa, state_index, node = self.stack[-1]
-            states, first = dfa
-            arcs, is_accepting = states[state_index]
-            for i, next_state in arcs:
-                sym_id = self.grammar.labels[i]
-                if label_index == i:
-                    # We matched a non-terminal.
-                    self.shift(next_state, token_type, value, lineno, column)
-                    state = states[next_state]
-                    # While the only possible action is to accept, pop nodes off
-                    # the stack.
-                    while state[1] and not state[0]:
-                        self.pop()
-                        if not self.stack:
-                            # Parsing is done.
-                            return True
-                        dfa, state_index, node = self.stack[-1]
-                        state = dfa[0][state_index]
-                    return False
-                elif sym_id >= 256:
-                    sub_node_dfa = self.grammar.dfas[sym_id - 256]
-                    # Check if this token can start a child node.
-                    if label_index in sub_node_dfa[1]:
-                        self.push(sub_node_dfa, next_state, sym_id, lineno,
-                                  column)
-                        break
-            else:
-                # We failed to find any arcs to another state, so unless this
-                # state is accepting, it's invalid input.
-                if is_accepting:
+            node_type, state_index, node = self.stack[-1]
+            action = grammar.dispatch[node_type - 256][state_index].get(
+                label_index)
+            if action is not None:
+                next_state, pushes = action
+                # Push the chain of non-terminals leading to the token.
+                for return_state, sym_id in pushes:
+                    self.push(return_state, sym_id, lineno, column)
+                # We matched a terminal.
+                self.shift(next_state, token_type, value, lineno, column)
+                node_type, state_index, node = self.stack[-1]
+                state = grammar.dfas[node_type - 256][0][state_index]
+                # While the only possible action is to accept, pop nodes off
+                # the stack.
+                while state[1] and not state[0]:
                     self.pop()
                     if not self.stack:
-                        raise ParseError("too much input", token_type, value,
-                                         lineno, column, line)
+                        # Parsing is done.
+                        return True
+                    node_type, state_index, node = self.stack[-1]
+                    state = grammar.dfas[node_type - 256][0][state_index]
+                return False
+            arcs, is_accepting = grammar.dfas[node_type - 256][0][state_index]
+            # We failed to find any arcs to another state, so unless this
+            # state is accepting, it's invalid input.
+            if is_accepting:
+                self.pop()
+                if not self.stack:
+                    raise ParseError("too much input", token_type, value,
+                                     lineno, column, line)
+            else:
+                # If only one possible input would satisfy, attach it to the
+                # error.
+                if len(arcs) == 1:
+                    expected = grammar.labels[arcs[0][0]]
                 else:
-                    # If only one possible input would satisfy, attach it to the
-                    # error.
-                    if len(arcs) == 1:
-                        expected = sym_id
-                    else:
-                        expected = -1
-                    raise ParseError("bad input", token_type, value, lineno,
-                                     column, line, expected)
+                    expected = -1
+                raise ParseError("bad input", token_type, value, lineno,
+                                 column, line, expected)
+
+    def add_tokens(self, tokens, start=0):
+        """Feed the tokens of a pytokenizer.TokenBuffer from index `start`.
+
+        Returns the index of the token which ended the parse, as add_token()
+        returns True for it, or -1 if the tokens ran out first.  The string
+        of each token is only created when it is fed, and its line only if
+        it is needed for an error.
+        """
+        types = tokens.types
+        linenos = tokens.linenos
+        columns = tokens.columns
+        for i in range(start, len(types)):
+            try:
+                done = self.add_token(types[i], tokens.get_value(i),
+                                      linenos[i], columns[i], None)
+            except ParseError as e:
+                e.line = tokens.get_line(i)
+                raise
+            if done:
+                return i
+        return -1
 
     def classify(self, token_type, value, lineno, column, line):
         """Find the label for a token."""
@@ -262,26 +392,106 @@ class Parser:
 
     def shift(self, next_state, token_type, value, lineno, column):
         """Shift a non-terminal and prepare for the next state."""
-        dfa, state, node = self.stack[-1]
-        new_node = Terminal(token_type, value, lineno, column)
-        node.append_child(new_node)
-        self.stack[-1] = (dfa, next_state, node)
+        node_type, state, node = self.stack[-1]
+        self.stack[-1] = (node_type, next_state, node)
+        self.append_child(Terminal(token_type, value, lineno, column))
 
-    def push(self, next_dfa, next_state, node_type, lineno, column):
+    def push(self, next_state, node_type, lineno, column):
         """Push a terminal and adjust the current state."""
-        dfa, state, node = self.stack[-1]
-        new_node = Nonterminal(node_type, [])
-        self.stack[-1] = (dfa, next_state, node)
-        self.stack.append((next_dfa, 0, new_node))
+        parent_type, state, node = self.stack[-1]
+        if node_type in self.collapsible:
+            # Only created once it gets a second child, see append_child().
+            new_node = None
+        else:
+            new_node = Nonterminal(node_type, [])
+        self.stack[-1] = (parent_type, next_state, node)
+        self.stack.append((node_type, 0, new_node))
+
+    def append_child(self, child):
+        """Add a child to the node on top of the stack."""
+        node_type, state, node = self.stack[-1]
+        if node is None:
+            # A collapsible node without children: keep the child in its
+            # place, it is the whole node as long as it is the only one.
+            self.stack[-1] = (node_type, state, child)
+        elif node.type != node_type:
+            # A collapsible node getting a second child, create it for real.
+            self.stack[-1] = (node_type, state,
+                              Nonterminal(node_type, [node, child]))
+        else:
+            node.append_child(child)
 
     def pop(self):
         """Pop an entry off the stack and make its node a child of the last."""
-        dfa, state, node = self.stack.pop()
+        node_type, state, node = self.stack.pop()
         if self.stack:
             # we are now done with node, so we can store it more efficiently if
-            # it has just one child
-            if node.num_children() == 1:
-                node = Nonterminal1(node.type, node.get_child(0))
-            self.stack[-1][2].append_child(node)
+            # it has just one child (unless it was collapsed into that child)
+            if node.type == node_type and node.num_children() == 1:
+                node = Nonterminal1(node_type, node.get_child(0))
+            if self.reducers:
+                reducer = self.reducers.get(node_type, None)
+                if reducer is not None:
+                    node = reducer(node)
+                    if node is None:
+                        return
+            self.append_child(node)
         else:
             self.root = node
+
+
+class CheckState(ParseState):
+    """The state of a parse which only checks the tokens, see check_token().
+
+    No tree is built: `root` stays None.
+    """
+
+    def __init__(self, grammar, start):
+        self.grammar = grammar
+        self.root = None
+        # Only the DFA states are kept, as a flat list of symbol id and
+        # state pairs, so that checking allocates nothing per token.
+        self.stack = [start, 0]
+
+    def check_token(self, token_type, value, lineno, column, line):
+        """Like add_token(), but only check that the token is accepted.
+
+        No node is built and the reducers are not called, the parser only
+        walks the DFAs of the grammar.  The ParseErrors are the same.
+        """
+        label_index = self.classify(token_type, value, lineno, column, line)
+        grammar = self.grammar
+        dispatch = grammar.dispatch
+        dfas = grammar.dfas
+        stack = self.stack
+        while True:
+            node_type = stack[-2]
+            state_index = stack[-1]
+            action = dispatch[node_type - 256][state_index].get(label_index)
+            if action is not None:
+                next_state, pushes = action
+                for return_state, sym_id in pushes:
+                    stack[-1] = return_state
+                    stack.append(sym_id)
+                    stack.append(0)
+                stack[-1] = next_state
+                state = dfas[stack[-2] - 256][0][next_state]
+                while state[1] and not state[0]:
+                    del stack[-2:]
+                    if not stack:
+                        return True
+                    state = dfas[stack[-2] - 256][0][stack[-1]]
+                return False
+            arcs, is_accepting = dfas[node_type - 256][0][state_index]
+            if is_accepting:
+                del stack[-2:]
+                if not stack:
+                    raise ParseError("too much input", token_type, value,
+                                     lineno, column, line)
+            else:
+                if len(arcs) == 1:
+                    expected = grammar.labels[arcs[0][0]]
+                else:
+                    expected = -1
+                raise ParseError("bad input", token_type, value, lineno,
+                                 column, line, expected)
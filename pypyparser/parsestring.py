@@ -109,55 +109,62 @@ OCTAL_CHARS = '01234567'
 HEX_CHARS = '0123456789ABCDEFabcdef'
 
 def decode_unicode_escape(s):
+    pos = s.find('\\')
+    if pos < 0:
+        return s
     buf = io.StringIO()
+    start = 0
+    end = len(s)
 
-    while True:
-        r = s.split('\\', 1)
-        buf.write(r[0])
-        if len(r) == 1:
-            break
-
-        s = r[1]
-        if not s:
+    while pos >= 0:
+        buf.write(s[start:pos])
+        pos += 1
+        if pos == end:
             raise ValueError(r"Trailing \ in string")
 
-        c = UNICODE_ESCAPE.get(s[0], None)
+        ch = s[pos]
+        c = UNICODE_ESCAPE.get(ch, None)
         if c is not None:
             buf.write(c)
-            s = s[1:]
-        elif s[0] == 'x': # x
-            if len(s) < 3 or s[1] not in HEX_CHARS or s[2] not in HEX_CHARS:
+            pos += 1
+        elif ch == 'x':
+            if (pos + 2 >= end or s[pos + 1] not in HEX_CHARS or
+                    s[pos + 2] not in HEX_CHARS):
                 raise ValueError(r"invalid \x escape")
-            buf.write(chr(int(s[1:3], 16)))
-            s = s[3:]
-        elif s[0] in OCTAL_CHARS:
-            if len(s) > 1 and s[1] in OCTAL_CHARS:
-                if len(s) > 2 and s[2] in OCTAL_CHARS:
-                    buf.write(chr(int(s[:3], 8) & 0xFF))
-                    s = s[3:]
+            buf.write(chr(int(s[pos + 1:pos + 3], 16)))
+            pos += 3
+        elif ch in OCTAL_CHARS:
+            if pos + 1 < end and s[pos + 1] in OCTAL_CHARS:
+                if pos + 2 < end and s[pos + 2] in OCTAL_CHARS:
+                    buf.write(chr(int(s[pos:pos + 3], 8) & 0xFF))
+                    pos += 3
                 else:
-                    buf.write(chr(int(s[:2], 8)))
-                    s = s[2:]
+                    buf.write(chr(int(s[pos:pos + 2], 8)))
+                    pos += 2
             else:
-                buf.write(chr(int(s[:1], 8)))
-                s = s[1:]
-        elif s[0] == 'u':
-            if len(s) < 5 or any(c not in HEX_CHARS for c in s[1:5]):
+                buf.write(chr(int(ch, 8)))
+                pos += 1
+        elif ch == 'u':
+            if pos + 4 >= end or any(c not in HEX_CHARS
+                                     for c in s[pos + 1:pos + 5]):
                 raise ValueError(r"invalid \u escape")
-            buf.write(chr(int(s[1:5], 16)))
-            s = s[5:]
-
-        elif s[0] == 'U':
-            if len(s) < 9 or any(c not in HEX_CHARS for c in s[1:9]):
+            buf.write(chr(int(s[pos + 1:pos + 5], 16)))
+            pos += 5
+        elif ch == 'U':
+            if pos + 8 >= end or any(c not in HEX_CHARS
+                                     for c in s[pos + 1:pos + 9]):
                 raise ValueError(r"invalid \U escape")
-            u = int(s[1:9], 16)
+            u = int(s[pos + 1:pos + 9], 16)
             if u > 0x10FFFF:
                 raise UnicodeError("illegal Unicode character")
             buf.write(chr(u))
-            s = s[9:]
+            pos += 9
         else:
             buf.write('\\')
+        start = pos
+        pos = s.find('\\', start)
 
+    buf.write(s[start:])
     return buf.getvalue()
 
 
@@ -179,39 +186,45 @@ OCTAL_BYTES = frozenset(b'01234567')
 HEX_BYTES = frozenset(b'0123456789ABCDEFabcdef')
 
 def decode_bytes_escape(s):
+    pos = s.find(b'\\')
+    if pos < 0:
+        return s
     buf = io.BytesIO()
+    start = 0
+    end = len(s)
 
-    while True:
-        r = s.split(b'\\', 1)
-        buf.write(r[0])
-        if len(r) == 1:
-            break
-
-        s = r[1]
-        if not s:
+    while pos >= 0:
+        buf.write(s[start:pos])
+        pos += 1
+        if pos == end:
             raise ValueError(r"Trailing \ in string")
 
-        c = BYTES_ESCAPE.get(s[0], None)
+        ch = s[pos]
+        c = BYTES_ESCAPE.get(ch, None)
         if c is not None:
             buf.write(c)
-            s = s[1:]
-        elif s[0] == 0x78: # x
-            if len(s) < 3 or s[1] not in HEX_BYTES or s[2] not in HEX_BYTES:
+            pos += 1
+        elif ch == 0x78: # x
+            if (pos + 2 >= end or s[pos + 1] not in HEX_BYTES or
+                    s[pos + 2] not in HEX_BYTES):
                 raise ValueError(r"invalid \x escape")
-            buf.write(bytes([int(s[1:3], 16)]))
-            s = s[3:]
-        elif s[0] in OCTAL_BYTES:
-            if len(s) > 1 and s[1] in OCTAL_BYTES:
-                if len(s) > 2 and s[2] in OCTAL_BYTES:
-                    buf.write(bytes([int(s[:3], 8) & 0xFF]))
-                    s = s[3:]
+            buf.write(bytes([int(s[pos + 1:pos + 3], 16)]))
+            pos += 3
+        elif ch in OCTAL_BYTES:
+            if pos + 1 < end and s[pos + 1] in OCTAL_BYTES:
+                if pos + 2 < end and s[pos + 2] in OCTAL_BYTES:
+                    buf.write(bytes([int(s[pos:pos + 3], 8) & 0xFF]))
+                    pos += 3
                 else:
-                    buf.write(bytes([int(s[:2], 8)]))
-                    s = s[2:]
+                    buf.write(bytes([int(s[pos:pos + 2], 8)]))
+                    pos += 2
             else:
-                buf.write(bytes([int(s[:1], 8)]))
-                s = s[1:]
+                buf.write(bytes([ch - 0x30]))
+                pos += 1
         else:
             buf.write(b'\\')
+        start = pos
+        pos = s.find(b'\\', start)
 
+    buf.write(s[start:])
     return buf.getvalue()
@@ -1,5 +1,9 @@
 import os
-from . import parser, pytoken, metaparser
+import hashlib
+import importlib
+import threading
+import warnings
+from . import parser, pytoken
 
 
 class PythonGrammar(parser.Grammar):
@@ -8,14 +12,62 @@ class PythonGrammar(parser.Grammar):
     OPERATOR_MAP = pytoken.OPMAP
 
 
+def source_hash(gram_source):
+    return hashlib.sha1(gram_source.encode("utf-8")).hexdigest()
+
+
+def generated_module_name(filename):
+    """Name of the module holding the compiled tables of a grammar file."""
+    return filename.replace(".", "_").lower()
+
+
+def load_generated_grammar(filename, gram_source):
+    """Build a grammar from the tables written by gengrammar.py.
+
+    Returns None if there are no tables for this grammar or if they were not
+    generated from `gram_source`.
+    """
+    try:
+        tables = importlib.import_module(
+            ".grammar_generated." + generated_module_name(filename),
+            __package__)
+    except ImportError:
+        return None
+    if tables.SOURCE_HASH != source_hash(gram_source):
+        warnings.warn("the parser tables of %s are out of date, regenerate "
+                      "them with 'python -m pypyparser.gengrammar'"
+                      % (filename,))
+        return None
+    gram = PythonGrammar()
+    gram.symbol_ids = tables.symbol_ids
+    gram.symbol_names = {i: name for name, i in tables.symbol_ids.items()}
+    gram.symbol_to_label = tables.symbol_to_label
+    gram.keyword_ids = tables.keyword_ids
+    gram.labels = tables.labels
+    gram.token_ids = tables.token_ids
+    gram.start = tables.start
+    gram.dfas = tables.dfas
+    gram.dispatch = parser.make_dispatch(gram)
+    return gram
+
+
+# Held while a grammar is loaded, so that parsers created in several
+# threads at once share the same grammar.
+_grammar_lock = threading.Lock()
+
 def get_python_grammar(filename, cache={}):
-    if filename not in cache:
-        here = os.path.dirname(__file__)
-        with open(os.path.join(here, "data", filename)) as fp:
-            gram_source = fp.read()
-        pgen = metaparser.ParserGenerator(gram_source)
-        cache[filename] = pgen.build_grammar(PythonGrammar)
-    return cache[filename]
+    with _grammar_lock:
+        if filename not in cache:
+            here = os.path.dirname(__file__)
+            with open(os.path.join(here, "data", filename)) as fp:
+                gram_source = fp.read()
+            gram = load_generated_grammar(filename, gram_source)
+            if gram is None:
+                from . import metaparser
+                pgen = metaparser.ParserGenerator(gram_source)
+                gram = pgen.build_grammar(PythonGrammar)
+            cache[filename] = gram
+        return cache[filename]
 
 
 def get_symbols(grammar):
@@ -1,6 +1,9 @@
+import os
+
 from .pytoken import Token
-from .parser import Parser, ParseError
-from . import future, pytokenizer, pygram, error, consts, astbuilder
+from .parser import Parser, ParseError, CheckState
+from . import future, pytokenizer, pygram, error, consts, astbuilder, ast
+from . import astdump
 
 
 def _normalize_encoding(encoding):
@@ -48,6 +51,29 @@ def _check_line_for_encoding(line):
     return pytokenizer.match_encoding_declaration(line[i:]), True
 
 
+def convert_parse_error(e, tp, last_value_seen, next_value_seen, filename):
+    """Return the SyntaxError to raise for the ParseError `e`.
+
+    `tp` is the type of the token which was rejected, `next_value_seen` its
+    string and `last_value_seen` the string of the token before it.
+    """
+    new_err = error.IndentationError
+    if tp == Token.INDENT:
+        msg = "unexpected indent"
+    elif e.expected == Token.INDENT:
+        msg = "expected an indented block"
+    else:
+        new_err = error.SyntaxError
+        if (last_value_seen in ('print', 'exec') and
+                bool(next_value_seen) and
+                next_value_seen != '('):
+            msg = "Missing parentheses in call to '%s'" % (
+                last_value_seen,)
+        else:
+            msg = "invalid syntax"
+    return new_err(msg, e.lineno, e.column, e.line, filename)
+
+
 class CompileInfo:
     """Stores information about the source being compiled.
 
@@ -77,9 +103,41 @@ class CompileInfo:
         self.hidden_applevel = hidden_applevel
 
 
+# Expression nonterminals that only pass their child through when they have
+# a single one; see the compact mode of PythonParser.
+PASS_THROUGH_SYMBOLS = (
+    "test", "test_nocond", "or_test", "and_test", "not_test", "comparison",
+    "expr", "xor_expr", "and_expr", "shift_expr", "arith_expr", "term",
+    "factor", "power", "atom_expr",
+)
+
+
+OPENING_BRACKETS = frozenset([Token.LPAR, Token.LSQB, Token.LBRACE])
+CLOSING_BRACKETS = frozenset([Token.RPAR, Token.RSQB, Token.RBRACE])
+STATEMENT_SEPARATORS = frozenset([Token.NEWLINE, Token.INDENT, Token.DEDENT,
+                                  Token.SEMI, Token.COLON])
+
+
 class PythonParser(Parser):
+    """Parser for the given version of the Python grammar.
+
+    With `compact=True`, the pass-through expression nonterminals with a
+    single child are left out of the parse tree, e.g. the name in `x = y`
+    is an atom right under the expr_stmt instead of the bottom of a chain of
+    fifteen nodes.  ASTBuilder accepts both kinds of trees.
+
+    `tokenizer` selects how the tokenizer matches tokens, see
+    pytokenizer.TOKENIZERS; "regex" is faster than the default "dfa".
 
-    def __init__(self, version):
+    The parse methods keep their state in a new ParseState for each call,
+    and the grammar, the symbols and the future flags are only read, so
+    one PythonParser can parse sources in several threads at once.
+    """
+
+    def __init__(self, version, compact=False, tokenizer="dfa"):
+        if tokenizer not in pytokenizer.TOKENIZERS:
+            raise ValueError("unknown tokenizer %r" % (tokenizer,))
+        self.tokenizer = tokenizer
         self.grammar = pygram.get_python_grammar("Grammar{}".format(version))
         self.syms = pygram.get_symbols(self.grammar)
         self.future_flags = future.FUTURE_FLAGS[version]
@@ -90,16 +148,40 @@ class PythonParser(Parser):
             'exec':   self.syms.file_input,
         }
 
-        super().__init__(self.grammar)
+        collapsible = frozenset()
+        if compact:
+            collapsible = frozenset(self.grammar.symbol_ids[name]
+                                    for name in PASS_THROUGH_SYMBOLS
+                                    if name in self.grammar.symbol_ids)
+        super().__init__(self.grammar, collapsible)
 
 
-    def parse_source(self, bytessrc, compile_info):
+    def parse_source(self, bytessrc, compile_info, first_lineno=1):
         """Main entry point for parsing Python source.
 
         Everything from decoding the source to tokenizing to building the parse
-        tree is handled here.
+        tree is handled here.  The lines of the source are numbered from
+        `first_lineno`.
+        """
+        state = self.new_state(self._targets[compile_info.mode])
+        return self._parse_source(bytessrc, compile_info, first_lineno, state)
+
+    def check_syntax(self, bytessrc, compile_info):
+        """Check that a source parses, without building its parse tree.
+
+        This raises the same SyntaxErrors as parse_source() and updates
+        `compile_info` the same way, but the parser only keeps the states
+        of its DFAs, see CheckState.check_token().
         """
+        state = self.new_check_state(self._targets[compile_info.mode])
+        self._parse_source(bytessrc, compile_info, 1, state)
+
+    def decode_source(self, bytessrc, compile_info, first_lineno=1):
+        """Decode a source and return its lines for the tokenizer.
 
+        Returns the SourceText of the source, the flags to pass to the
+        tokenizer and the encoding of the source, or None.
+        """
         # Detect source encoding.
         explicit_encoding = False
         enc = None
@@ -122,107 +204,287 @@ class PythonParser(Parser):
                 if enc is None:
                     enc = 'utf-8'
 
-        if not isinstance(bytessrc, str):
+        if isinstance(bytessrc, str):
+            textsrc = bytessrc
+        elif enc is None or enc == 'utf-8':
+            # UTF-8 sources are decoded line by line by the tokenizer
+            textsrc = bytessrc
+        else:
             try:
-                textsrc = bytessrc.decode(enc) if enc is not None else bytessrc.decode()
+                textsrc = bytessrc.decode(enc)
             except LookupError:
                 raise error.SyntaxError("Unknown encoding: %s" % enc,
                                         filename=compile_info.filename)
             except UnicodeDecodeError as e:
                 raise error.SyntaxError(str(e))
-        else:
-            textsrc = bytessrc
 
 
         flags = compile_info.flags
         if explicit_encoding:
             flags |= consts.PyCF_FOUND_ENCODING
 
-        # The tokenizer is very picky about how it wants its input.
-        source_lines = textsrc.splitlines(True)
-        if source_lines and not source_lines[-1].endswith("\n"):
-            source_lines[-1] += '\n'
-        if textsrc and textsrc[-1] == "\n":
+        # The tokenizer is very picky about how it wants its input, and
+        # SourceText gives it the lines it wants one at a time.
+        if isinstance(textsrc, str):
+            source_lines = pytokenizer.SourceText(textsrc, first_lineno)
+            ends_with_newline = textsrc[-1:] == "\n"
+        else:
+            source_lines = pytokenizer.Utf8SourceText(textsrc, first_lineno)
+            ends_with_newline = textsrc[-1:] == b"\n"
+        if ends_with_newline:
             flags &= ~consts.PyCF_DONT_IMPLY_DEDENT
+        return source_lines, flags, enc
+
+    def _parse_source(self, bytessrc, compile_info, first_lineno, state):
+        """Parse a source with the ParseState or CheckState `state`, and
+        return its tree."""
+        source_lines, flags, enc = self.decode_source(bytessrc, compile_info,
+                                                      first_lineno)
 
-        self.prepare(self._targets[compile_info.mode])
+        if isinstance(state, CheckState):
+            add_token = state.check_token
+        else:
+            add_token = state.add_token
         tp = 0
+        last_value_seen = None
+        next_value_seen = None
         try:
+            # Note: we no longer pass the CO_FUTURE_* to the tokenizer,
+            # which is expected to work independently of them.  It's
+            # certainly the case for all futures in Python <= 2.7.
+            # Tokens are generated lazily: only the prefix needed to
+            # find the __future__ imports is buffered, the rest is
+            # tokenized while being fed to the parser.
+            tokens = future.TokenIterator(
+                pytokenizer.iter_tokens(source_lines, flags, first_lineno,
+                                        self.tokenizer))
+
+            newflags, last_future_import = (
+                future.add_future_flags(self.future_flags, tokens))
+            compile_info.last_future_import = last_future_import
+            compile_info.flags |= newflags
+            tokens_stream = tokens.replay()
+
+            for tp, value, lineno, column, line in tokens_stream:
+                next_value_seen = value
+                if add_token(tp, value, lineno, column, line):
+                    break
+                last_value_seen = value
             last_value_seen = None
             next_value_seen = None
-            try:
-                # Note: we no longer pass the CO_FUTURE_* to the tokenizer,
-                # which is expected to work independently of them.  It's
-                # certainly the case for all futures in Python <= 2.7.
-                tokens = pytokenizer.generate_tokens(source_lines, flags)
-
-                newflags, last_future_import = (
-                    future.add_future_flags(self.future_flags, tokens))
-                compile_info.last_future_import = last_future_import
-                compile_info.flags |= newflags
-                tokens_stream = iter(tokens)
 
+            if compile_info.mode == 'single':
                 for tp, value, lineno, column, line in tokens_stream:
-                    next_value_seen = value
-                    if self.add_token(tp, value, lineno, column, line):
+                    if tp == Token.ENDMARKER:
                         break
-                    last_value_seen = value
-                last_value_seen = None
-                next_value_seen = None
-
-                if compile_info.mode == 'single':
-                    for tp, value, lineno, column, line in tokens_stream:
-                        if tp == Token.ENDMARKER:
-                            break
-                        if tp == Token.NEWLINE:
-                            continue
-
-                        if tp == Token.COMMENT:
-                            for tp, _, _, _, _ in tokens_stream:
-                                if tp == Token.NEWLINE:
-                                    break
-                        else:
-                            new_err = error.SyntaxError
-                            msg = ("multiple statements found while "
-                                   "compiling a single statement")
-                            raise new_err(msg, lineno, column,
-                                          line, compile_info.filename)
-
-            except error.TokenError as e:
-                e.filename = compile_info.filename
-                raise
-            except error.TokenIndentationError as e:
-                e.filename = compile_info.filename
-                raise
-            except ParseError as e:
-                # Catch parse errors, pretty them up and reraise them as a
-                # SyntaxError.
-                new_err = error.IndentationError
-                if tp == Token.INDENT:
-                    msg = "unexpected indent"
-                elif e.expected == Token.INDENT:
-                    msg = "expected an indented block"
-                else:
-                    new_err = error.SyntaxError
-                    if (last_value_seen in ('print', 'exec') and
-                            bool(next_value_seen) and
-                            next_value_seen != '('):
-                        msg = "Missing parentheses in call to '%s'" % (
-                            last_value_seen,)
+                    if tp == Token.NEWLINE:
+                        continue
+
+                    if tp == Token.COMMENT:
+                        for tp, _, _, _, _ in tokens_stream:
+                            if tp == Token.NEWLINE:
+                                break
                     else:
-                        msg = "invalid syntax"
-                raise new_err(msg, e.lineno, e.column, e.line,
-                              compile_info.filename)
-            else:
-                tree = self.root
-        finally:
-            # Avoid hanging onto the tree.
-            self.root = None
+                        new_err = error.SyntaxError
+                        msg = ("multiple statements found while "
+                               "compiling a single statement")
+                        raise new_err(msg, lineno, column,
+                                      line, compile_info.filename)
+
+        except error.TokenError as e:
+            e.filename = compile_info.filename
+            raise
+        except error.TokenIndentationError as e:
+            e.filename = compile_info.filename
+            raise
+        except ParseError as e:
+            # Catch parse errors, pretty them up and reraise them as a
+            # SyntaxError.
+            raise convert_parse_error(e, tp, last_value_seen,
+                                      next_value_seen,
+                                      compile_info.filename)
         if enc is not None:
             compile_info.encoding = enc
-        return tree
+        return state.root
+
 
+    def parse(self, bytessrc, compile_info, single_pass=False):
+        """Parse Python source and return its AST.
 
-    def parse(self, bytessrc, compile_info):
-        node = self.parse_source(bytessrc, compile_info)
-        return astbuilder.ASTBuilder(node, compile_info, self.syms).build_ast()
+        With `single_pass=True` and in 'exec' mode, the top-level statements
+        are converted to AST as soon as the parser completes them, and their
+        parse trees are dropped right away instead of keeping the tree of
+        the whole module.  Syntax errors found while building the AST of a
+        statement are then raised before the rest of the source is parsed.
+        """
+        if not single_pass or compile_info.mode != 'exec':
+            node = self.parse_source(bytessrc, compile_info)
+            return astbuilder.ASTBuilder(node, compile_info, self.syms).build_ast()
+        stmts = []
+        for lineno, stmt_asts in self.parse_statements(bytessrc, compile_info):
+            stmts.extend(stmt_asts)
+        return ast.Module(stmts)
+
+    def parse_statements(self, bytessrc, compile_info, first_lineno=1):
+        """Parse a module in a single pass and return its statements.
+
+        This returns a list of (lineno, stmts) pairs, one per top-level
+        statement of the source: `lineno` is the line of its first token
+        and `stmts` the list of its AST statements, of which there are
+        several for simple statements separated by semicolons.
+        """
+        builder = astbuilder.ASTBuilder(None, compile_info, self.syms)
+        statements = []
+
+        def reduce_stmt(node):
+            if len(state.stack) > 1:
+                # a statement nested in a compound statement
+                return node
+            stmts = []
+            builder.add_statements(node, stmts)
+            statements.append((node.get_lineno(), stmts))
+            return None
+
+        state = self.new_state(self._targets[compile_info.mode],
+                               {self.syms.stmt: reduce_stmt})
+        self._parse_source(bytessrc, compile_info, first_lineno, state)
+        return statements
+
+    def parse_imports(self, bytessrc, compile_info):
+        """Return the Import and ImportFrom statements of a module.
+
+        The statements are found at any depth, in function bodies and try
+        blocks too, and returned in source order.  Only they are parsed:
+        the rest of the source is tokenized but not given to the parser, so
+        its syntax errors are not raised, only those of the tokenizer and
+        of the import statements.
+        """
+        source_lines, flags, enc = self.decode_source(bytessrc, compile_info)
+        syms = self.syms
+        builder = astbuilder.ASTBuilder(None, compile_info, syms)
+        imports = []
+        statement = None
+        at_start = True
+        depth = 0
+        try:
+            for tok in pytokenizer.iter_tokens(source_lines, flags,
+                                               tokenizer=self.tokenizer):
+                tp = tok[0]
+                if statement is not None:
+                    if tp != Token.NEWLINE and tp != Token.SEMI:
+                        statement.append(tok)
+                        continue
+                    imports.append(self._parse_import(statement, tok,
+                                                      builder, compile_info))
+                    statement = None
+                elif (at_start and tp == Token.NAME and
+                        (tok[1] == "import" or tok[1] == "from")):
+                    statement = [tok]
+                    continue
+                if tp in OPENING_BRACKETS:
+                    depth += 1
+                elif tp in CLOSING_BRACKETS:
+                    depth -= 1
+                # an import can only start a statement, which comes at the
+                # start of a line or after a semicolon or a colon
+                at_start = depth == 0 and tp in STATEMENT_SEPARATORS
+        except (error.TokenError, error.TokenIndentationError) as e:
+            e.filename = compile_info.filename
+            raise
+        if enc is not None:
+            compile_info.encoding = enc
+        return imports
+
+    def _parse_import(self, tokens, end, builder, compile_info):
+        """Parse the tokens of an import statement, ended by the token
+        `end`, and return its AST."""
+        state = self.new_state(self.syms.simple_stmt)
+        tp = 0
+        last_value_seen = None
+        next_value_seen = None
+        try:
+            for tp, value, lineno, column, line in tokens:
+                next_value_seen = value
+                state.add_token(tp, value, lineno, column, line)
+                last_value_seen = value
+            tp = Token.NEWLINE
+            next_value_seen = ""
+            state.add_token(Token.NEWLINE, "", end[2], end[3], end[4])
+        except ParseError as e:
+            raise convert_parse_error(e, tp, last_value_seen,
+                                      next_value_seen, compile_info.filename)
+        small_stmt = state.root.get_child(0)
+        return builder.handle_import_stmt(small_stmt.get_child(0))
+
+
+# The parser of a parse_files() worker process, created once per process.
+_worker_parser = None
+
+
+def _init_worker(version):
+    global _worker_parser
+    _worker_parser = PythonParser(version)
+
+
+def _parse_file(path):
+    try:
+        with open(path, "rb") as f:
+            source = f.read()
+        tree = _worker_parser.parse(source, CompileInfo(path, "exec"))
+    except Exception as e:
+        # raised in the parent, it would end the stream of every file
+        return path, e
+    # unlike pickle, astdump has no trouble with deeply nested trees
+    return path, astdump.dump(tree)
+
+
+def _parse_file_imports(path):
+    try:
+        with open(path, "rb") as f:
+            source = f.read()
+        return path, _worker_parser.parse_imports(source,
+                                                  CompileInfo(path, "exec"))
+    except Exception as e:
+        # raised in the parent, it would end the walk of the whole tree
+        return path, e
+
+
+def _python_files(directory):
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(".py"):
+                yield os.path.join(dirpath, filename)
+
+
+def parse_tree_imports(directory, version, workers=None, chunksize=8):
+    """Return the imports of every .py file under `directory`.
+
+    The files are read with PythonParser.parse_imports() in a pool of
+    `workers` processes, like parse_files().  Yields `(path, result)` pairs
+    in the order in which the files are done, where `result` is the list of
+    Import and ImportFrom statements of the file, or the exception, such as
+    an OSError or a SyntaxError, raised while reading them.
+    """
+    import multiprocessing
+    with multiprocessing.Pool(workers, _init_worker, (version,)) as pool:
+        yield from pool.imap_unordered(_parse_file_imports,
+                                       _python_files(directory), chunksize)
+
+
+def parse_files(paths, version, workers=None, chunksize=8):
+    """Parse many files in a pool of `workers` processes.
+
+    Yields `(path, result)` pairs in the order in which the files are done,
+    where `result` is the AST of the module, or the exception raised while
+    reading or parsing it: an OSError, a SyntaxError, or a RecursionError
+    for a source nested too deeply.  Each worker loads the grammar and
+    creates its parser once.  `workers` defaults to the number of CPUs.
+    """
+    import multiprocessing
+    with multiprocessing.Pool(workers, _init_worker, (version,)) as pool:
+        for path, result in pool.imap_unordered(_parse_file, paths,
+                                                chunksize):
+            if not isinstance(result, Exception):
+                result = astdump.load(result)
+            yield path, result
@@ -0,0 +1,122 @@
+"""Module pytokenize_re
+
+Regular expressions matching the same pieces of lines as pseudoDFA and
+whiteSpaceDFA of pytokenize.py, for the "regex" tokenizer of
+pytokenizer.iter_tokens().
+The expressions follow the construction of the DFAs in gendfa.py, with
+the alternatives ordered so that the first match is the one the DFAs
+find.  The DFAs are walked character by character in Python, while a
+compiled pattern is matched in C.
+
+pseudoDFA cannot back up more than one character: on malformed numbers,
+like `0777` or `1e+x`, it finds no token at all where the pattern finds
+a shorter number.  PseudoMatcher gives up these matches the same way.
+"""
+
+import re
+
+
+class RegexMatcher:
+    """Match a compiled pattern with the interface of automata.DFA."""
+
+    def __init__(self, pattern):
+        self.pattern = re.compile(pattern, re.DOTALL)
+        self.match = self.pattern.match
+
+    def recognize(self, inVec, pos = 0):
+        """Return the end of the match at `pos`, or -1."""
+        match = self.match(inVec, pos)
+        if match is None:
+            return -1
+        return match.end()
+
+
+class PseudoMatcher(RegexMatcher):
+    """Match PseudoToken, giving up numbers the way pseudoDFA does.
+
+    pseudoDFA reads a number as long as it can still become a longer
+    number, then backs up at most one character to the end of the last
+    number it has read.  `prefix` matches the longest such start of a
+    number.
+    """
+
+    def __init__(self, pattern, prefix):
+        RegexMatcher.__init__(self, pattern)
+        self.prefix_match = re.compile(prefix).match
+
+    def recognize(self, inVec, pos = 0):
+        """Return the end of the match at `pos`, or -1."""
+        match = self.match(inVec, pos)
+        if match is None:
+            return -1
+        end = match.end()
+        start = match.end(1)
+        if start < end and inVec[start] in NUMBER_START:
+            prefix = self.prefix_match(inVec, start)
+            if prefix is not None and prefix.end() > end + 1:
+                return -1
+        return end
+
+
+def group(*choices):
+    return "(?:" + "|".join(choices) + ")"
+
+def maybe(*choices):
+    return group(*choices) + "?"
+
+def any(*choices):
+    return group(*choices) + "*"
+
+
+EOL = r"(?:\n|\r\n?)"
+Whitespace = r"[ \f\t]*"
+Comment = r"#[^\r\n]*"
+LineCont = r"\\" + EOL
+Name = r"[a-zA-Z_\x80-\U0010ffff][a-zA-Z0-9_\x80-\U0010ffff]*"
+
+Hexnumber = r"0[xX][0-9a-fA-F]+"
+Octnumber = r"0[oO][0-7]+"
+Binnumber = r"0[bB][01]+"
+Decnumber = r"[1-9][0-9]*"
+Zero = r"0+"
+Intnumber = group(Hexnumber, Octnumber, Binnumber, Decnumber, Zero)
+Exponent = r"[eE][-+]?[0-9]+"
+Pointfloat = group(r"[0-9]+\.[0-9]*", r"\.[0-9]+") + maybe(Exponent)
+Expfloat = r"[0-9]+" + Exponent
+Floatnumber = group(Pointfloat, Expfloat)
+Imagnumber = group(r"[0-9]+[jJ]", Floatnumber + r"[jJ]")
+Number = group(Imagnumber, Floatnumber, Intnumber)
+NUMBER_START = frozenset("0123456789.")
+# The longest start of a number, which pseudoDFA reads before backing up.
+NumberPrefix = group(r"0[xX][0-9a-fA-F]*", r"0[oO][0-7]*", r"0[bB][01]*",
+                     group(r"[0-9]+(?:\.[0-9]*)?", r"\.[0-9]+") +
+                     maybe(r"[jJ]", r"[eE]" + maybe(r"[-+]?[0-9]+[jJ]?",
+                                                    r"[-+]")))
+
+Operator = group(r"\*\*=?", r">>=?", r"<<=?", r"<>", r"!=", r"->", r"//=?",
+                 r"[-+*/%&|^=<>@]=?", r"~")
+Bracket = r"[][(){}]"
+Special = group(EOL, r"\.\.\.", r"[@:;.,`]")
+Funny = group(Operator, Bracket, Special)
+
+StrPrefix = group(r"[rR]?[bBfF]?", r"[bBfF]?[rR]?", r"[uU]?")
+ContStr = group(StrPrefix + r"'[^\r\n'\\]*(?:\\.[^\r\n'\\]*)*" +
+                group("'", LineCont),
+                StrPrefix + r'"[^\r\n"\\]*(?:\\.[^\r\n"\\]*)*' +
+                group('"', LineCont))
+Triple = StrPrefix + group("'''", '"""')
+PseudoExtras = group(LineCont, Comment, Triple)
+# The empty alternative comes last, the DFA only matches nothing after
+# the whitespace when nothing else matches.  A string which is not closed
+# on its line is not matched at all, like the DFA does, instead of
+# matching its prefix as a name; but the DFA backs up one character, so
+# a quote at the very end of the input is left out of the match.
+# The whitespace is matched in a lookahead, which is never backtracked
+# into, so that giving up a space cannot make NotStr succeed.
+NotStr = r"(?!" + StrPrefix + r"['\"].)"
+PseudoToken = (r"(?=(" + Whitespace + r"))\1" +
+               group(PseudoExtras, Number, Funny, ContStr,
+                     NotStr + group(Name, "")))
+
+pseudoMatcher = PseudoMatcher(PseudoToken, NumberPrefix)
+whiteSpaceMatcher = RegexMatcher(Whitespace)
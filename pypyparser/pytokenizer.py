@@ -1,9 +1,13 @@
-from . import automata
+import array
+import bisect
+import itertools
+import re
 from .pytoken import Token, OPMAP
 from .error import TokenError, TokenIndentationError, TabError
 from .pytokenize import tabsize, alttabsize, whiteSpaceDFA, \
-    triple_quoted, endDFAs, single_quoted, pseudoDFA
-from . import consts
+    triple_quoted, endDFAs, single_quoted, pseudoDFA, singleDFA, doubleDFA, \
+    single3DFA, double3DFA
+from . import consts, pytokenize_re
 
 NAMECHARS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_'
 NUMCHARS = '0123456789'
@@ -49,19 +53,370 @@ def verify_identifier(token):
     return True
 
 
-DUMMY_DFA = automata.DFA([], [])
+class QuoteFinder:
+    """Find the end of a string with str.find(), like the DFAs of endDFAs.
 
-def generate_tokens(lines, flags):
+    recognize() returns the position after the first `quote` which is not
+    escaped by a backslash, or -1.  The characters up to the next quote are
+    skipped in C by str.find(); when there is a backslash before it, the
+    compiled `escaped` pattern is matched instead, which steps over the
+    escapes in C too.
     """
-    This is a rewrite of pypy.module.parser.pytokenize.generate_tokens since
-    the original function is not RPYTHON (uses yield)
-    It was also slightly modified to generate Token instances instead
-    of the original 5-tuples -- it's now a 4-tuple of
 
-    * the Token instance
-    * the whole line as a string
+    def __init__(self, quote, escaped):
+        self.quote = quote
+        self.escaped = re.compile(escaped, re.DOTALL)
+
+    def recognize(self, inVec, pos = 0):
+        end = inVec.find(self.quote, pos)
+        if end < 0:
+            return -1
+        if inVec.find("\\", pos, end) < 0:
+            return end + len(self.quote)
+        match = self.escaped.match(inVec, pos)
+        if match is None:
+            return -1
+        return match.end()
+
+
+DUMMY_FINDER = QuoteFinder("", "")
+
+_quote_finders = {
+    "'": QuoteFinder("'", r"[^'\\]*(?:\\.[^'\\]*)*'"),
+    '"': QuoteFinder('"', r'[^"\\]*(?:\\.[^"\\]*)*"'),
+    "'''": QuoteFinder("'''", r"[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*'''"),
+    '"""': QuoteFinder('"""', r'[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*"""'),
+}
+_end_quotes = {singleDFA: "'", doubleDFA: '"',
+               single3DFA: "'''", double3DFA: '"""'}
+# the QuoteFinder of each key of endDFAs, or None
+endFinders = dict((key, _quote_finders[_end_quotes[dfa]]
+                        if dfa is not None else None)
+                  for key, dfa in endDFAs.items())
+
+# the prefixes of string literals, and the characters starting them
+STRING_PREFIXES = frozenset(t[:-1] for t in single_quoted)
+STRING_INITIALS = frozenset(t[0] for t in single_quoted)
+
+def find_string_end(line, start):
+    """Return the end of the string literal at `start`, or -1.
+
+    Only strings which end on the same line and are not triple-quoted are
+    found; the others are left to the pseudo-token automaton.
+    """
+    quote_pos = start
+    while line[quote_pos] not in "'\"":
+        quote_pos += 1
+        if quote_pos - start > 2 or quote_pos == len(line):
+            return -1
+    quote = line[quote_pos]
+    if (line[start:quote_pos] not in STRING_PREFIXES or
+            line.startswith(quote * 3, quote_pos)):
+        return -1
+    end = _quote_finders[quote].recognize(line, quote_pos + 1)
+    if (end < 0 or line.find("\n", quote_pos, end) >= 0 or
+            line.find("\r", quote_pos, end) >= 0):
+        return -1
+    return end
+
+def find_comment_end(line, start):
+    """Return the end of the comment at `start`."""
+    end = line.find("\n", start)
+    if end < 0:
+        end = len(line)
+    cr = line.find("\r", start, end)
+    if cr >= 0:
+        return cr
+    return end
+
+
+# The automata matching the pseudo-tokens and the whitespace, for each
+# kind of tokenizer.  "dfa" walks the DFAs of pytokenize.py in Python,
+# "regex" matches the compiled patterns of pytokenize_re.py, which give the
+# same tokens.  With both, comments, the strings which end on their line
+# and the ends of the other strings are found with str.find() instead.
+TOKENIZERS = {
+    "dfa": (pseudoDFA, whiteSpaceDFA),
+    "regex": (pytokenize_re.pseudoMatcher, pytokenize_re.whiteSpaceMatcher),
+}
+
+# Yielded by iter_tokens() when it runs out of lines for now.
+PAUSE = "pause"
+PAUSE_IN_STATEMENT = "pause in statement"
+
+def generate_tokens(lines, flags, tokenizer="dfa"):
+    """Tokenize `lines` and return the whole list of tokens.
+
+    See iter_tokens() for the format of the tokens.  On errors, the tokens
+    produced so far are attached to the exception.
+    """
+    token_list = []
+    try:
+        for tok in iter_tokens(lines, flags, tokenizer=tokenizer):
+            token_list.append(tok)
+    except (TokenError, TokenIndentationError) as e:
+        e.tokens = token_list
+        raise
+    return token_list
+
+
+def tokenize_buffer(lines, flags, first_lineno=1, tokenizer="dfa"):
+    """Tokenize `lines` and return the tokens in a TokenBuffer.
+
+    The tokens of iter_tokens() are appended one at a time, see TokenBuffer
+    for the memory this saves.  Like generate_tokens(), the TokenBuffer
+    filled so far is attached to the exception on errors.
+    """
+    lines = list(lines)
+    buffer = TokenBuffer(lines, first_lineno)
+    try:
+        for tok in iter_tokens(lines, flags, first_lineno, tokenizer):
+            buffer.append(*tok)
+    except (TokenError, TokenIndentationError) as e:
+        e.tokens = buffer
+        raise
+    return buffer
+
+
+class TokenBuffer:
+    """Tokens of a source, stored column-wise in arrays of integers.
+
+    Token i has the type types[i], the line number linenos[i] and the column
+    columns[i]; its string is text[starts[i]:ends[i]], where `text` is the
+    source with its newlines normalized like the tokenizer does, and its
+    line is the line of `text` holding the end of the token.  The few tokens
+    whose string or line is not such a slice, like the NEWLINE tokens which
+    carry a comment and the tokens added at the end of the source, keep
+    them in `extra_values` and `extra_lines`.
+
+    The strings are only created when get_value() and get_line() are
+    called.  Indexing the buffer or iterating over it gives the tokens as
+    the 5-tuples of iter_tokens().
+
+    Only the memory kept for the tokens is reduced: tokenize_buffer() fills
+    the buffer from iter_tokens(), which still makes a 5-tuple and a string
+    for every token while tokenizing, and these are freed right after
+    append().
+    """
+
+    def __init__(self, lines, first_lineno=1):
+        lines = [universal_newline(line) for line in lines]
+        self.text = "".join(lines)
+        self.first_lineno = first_lineno
+        # offset of the start of every line, plus the end of the text
+        self.line_starts = array.array("i", [0])
+        offset = 0
+        for line in lines:
+            offset += len(line)
+            self.line_starts.append(offset)
+        self.types = array.array("i")
+        self.linenos = array.array("i")
+        self.columns = array.array("i")
+        self.starts = array.array("i")
+        self.ends = array.array("i")
+        self.extra_values = {}
+        self.extra_lines = {}
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self.types)
+        return (self.types[i], self.get_value(i), self.linenos[i],
+                self.columns[i], self.get_line(i))
+
+    def __iter__(self):
+        for i in range(len(self.types)):
+            yield self[i]
+
+    def append(self, type, value, lineno, column, line):
+        """Add a token given like the ones of iter_tokens()."""
+        index = len(self.types)
+        text = self.text
+        line_starts = self.line_starts
+        line_index = lineno - self.first_lineno
+        if 0 <= line_index < len(line_starts) - 1:
+            start = line_starts[line_index] + column
+        else:
+            line_index = len(line_starts) - 1
+            start = len(text)
+        end = start + len(value)
+        if not text.startswith(value, start):
+            self.extra_values[index] = value
+            end = start
+        elif start < len(text) and end > line_starts[line_index + 1]:
+            # a string spanning several lines
+            line_index = self._line_index(start, end)
+        if (line_index == len(line_starts) - 1 or
+                line_starts[line_index + 1] - line_starts[line_index] !=
+                len(line) or
+                not text.startswith(line, line_starts[line_index])):
+            self.extra_lines[index] = line
+        self.types.append(type)
+        self.linenos.append(lineno)
+        self.columns.append(column)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def get_value(self, i):
+        """Return the string of token i."""
+        if i in self.extra_values:
+            return self.extra_values[i]
+        return self.text[self.starts[i]:self.ends[i]]
+
+    def get_line(self, i):
+        """Return the line of token i."""
+        if i in self.extra_lines:
+            return self.extra_lines[i]
+        line_index = self._line_index(self.starts[i], self.ends[i])
+        return self.text[self.line_starts[line_index]:
+                         self.line_starts[line_index + 1]]
+
+    def _line_index(self, start, end):
+        # the line holding the last character of the token, or its start
+        # for empty tokens
+        return bisect.bisect_right(self.line_starts, max(start, end - 1)) - 1
+
+
+# the line ends of str.splitlines()
+LINE_END = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+class SourceText:
+    """A source string and the offsets where its lines start.
+
+    Iterating over a SourceText gives the lines the tokenizer expects: the
+    lines of str.splitlines(True), ending with "\n" instead of "\r\n" or
+    "\r", and with a "\n" added to the last line if it has none.  They are
+    sliced out of the source one at a time, so that no list of all the
+    lines is made.  The lines are numbered from `first_lineno`.
+    """
+
+    line_end = LINE_END
+
+    def __init__(self, text, first_lineno=1):
+        self.text = text
+        self.first_lineno = first_lineno
+        # offset of the start of every line, plus the end of the text
+        starts = array.array("i", [0])
+        starts.extend([match.end() for match in self.line_end.finditer(text)])
+        if starts[-1] != len(text):
+            starts.append(len(text))
+        self.line_starts = starts
+
+    def __len__(self):
+        return len(self.line_starts) - 1
+
+    def __iter__(self):
+        text = self.text
+        starts = self.line_starts
+        for i in range(len(starts) - 1):
+            yield self._line(text, starts[i], starts[i + 1])
+
+    def get_line(self, lineno):
+        """Return the line `lineno` as the tokenizer sees it."""
+        i = lineno - self.first_lineno
+        if not 0 <= i < len(self.line_starts) - 1:
+            raise IndexError("line number out of range")
+        return self._line(self.text, self.line_starts[i],
+                          self.line_starts[i + 1])
+
+    def offset_to_position(self, offset):
+        """Return the (lineno, column) of an offset in the text."""
+        if not 0 <= offset <= len(self.text):
+            raise IndexError("offset out of range")
+        i = bisect.bisect_right(self.line_starts, offset) - 1
+        if (i == len(self.line_starts) - 1 and i > 0 and
+                not self.line_end.match(self.text, offset - 1)):
+            # the end of a last line without a line end
+            i -= 1
+        return i + self.first_lineno, offset - self.line_starts[i]
+
+    def position_to_offset(self, lineno, column):
+        """Return the offset in the text of a (lineno, column) position.
+
+        The end of a text ending with a line end is at column 0 of the line
+        after the last one.
+        """
+        i = lineno - self.first_lineno
+        if not 0 <= i < len(self.line_starts):
+            raise IndexError("line number out of range")
+        return self.line_starts[i] + column
+
+    def _line(self, text, start, end):
+        if text[end - 1] == "\n":
+            if end - start >= 2 and text[end - 2] == "\r":
+                return text[start:end - 2] + "\n"
+            return text[start:end]
+        if text[end - 1] == "\r":
+            return text[start:end - 1] + "\n"
+        if end == len(text):
+            return text[start:end] + "\n"
+        return text[start:end]
+
+
+# the UTF-8 encoding of the line ends of str.splitlines()
+UTF8_LINE_END = re.compile(
+    b"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+class Utf8SourceText(SourceText):
+    """A SourceText over UTF-8 bytes, decoded one line at a time.
+
+    The whole source is never decoded: each line is decoded when the
+    tokenizer gets to it, and a line which is not valid UTF-8 raises a
+    TokenError then.  Offsets count bytes, columns count characters like
+    the columns of the tokens.
+    """
+
+    line_end = UTF8_LINE_END
+
+    def offset_to_position(self, offset):
+        lineno, column = SourceText.offset_to_position(self, offset)
+        start = self.line_starts[lineno - self.first_lineno]
+        column = len(self.text[start:offset].decode("utf-8", "replace"))
+        return lineno, column
+
+    def position_to_offset(self, lineno, column):
+        offset = SourceText.position_to_offset(self, lineno, column)
+        if column == 0:
+            return offset
+        line = self.get_line(lineno)
+        return offset - column + len(line[:column].encode("utf-8"))
+
+    def _line(self, text, start, end):
+        try:
+            line = text[start:end].decode("utf-8")
+        except UnicodeDecodeError as e:
+            lineno = bisect.bisect_right(self.line_starts, start) - 1
+            raise TokenError(str(e), None, lineno + self.first_lineno,
+                             e.start + 1, None)
+        line = universal_newline(line)
+        if end == len(text) and line[-1:] != "\n":
+            line += "\n"
+        return line
+
+
+def iter_tokens(lines, flags, first_lineno=1, tokenizer="dfa"):
+    """
+    This is a rewrite of pypy.module.parser.pytokenize.generate_tokens.
+    It was slightly modified to generate 5-tuples of
+
+    * the token type
+    * the token string
     * the line number (the real one, counting continuation lines)
-    * the position on the line of the end of the token.
+    * the position on the line of the start of the token
+    * the whole line as a string
+
+    Tokens are produced lazily, one at a time, so that the parser can consume
+    them while the rest of the source is still untokenized.  `lines` can be
+    any iterable of lines, numbered from `first_lineno`.  `tokenizer` is a
+    key of TOKENIZERS.
+
+    `lines` can also give None when the next line is not available yet, for
+    an interactive input typed line by line.  iter_tokens() then yields
+    PAUSE, or PAUSE_IN_STATEMENT if the lines so far end inside a string,
+    parentheses or a continuation line, and goes on with the next line when
+    it is resumed.
 
     Original docstring ::
 
@@ -77,12 +432,14 @@ def generate_tokens(lines, flags):
         and the line on which the token was found. The line passed is the
         logical line; continuation lines are included.
     """
-    token_list = []
-    lnum = parenlev = continued = 0
+    pseudoDFA, whiteSpaceDFA = TOKENIZERS[tokenizer]
+    tok = None
+    lnum = first_lineno - 1
+    parenlev = continued = 0
     namechars = NAMECHARS
     numchars = NUMCHARS
-    contstr, needcont = '', 0
-    contline = None
+    # the lines of a string continued on the next lines
+    contstr, needcont = [], 0
     indents = [0]
     altindents = [0]
     last_comment = ''
@@ -92,13 +449,18 @@ def generate_tokens(lines, flags):
     async_def_indent = 0
 
     # make the annotator happy
-    endDFA = DUMMY_DFA
+    endFinder = DUMMY_FINDER
     # make the annotator happy
     line = ''
     pos = 0
-    lines.append("")
     strstart = (0, 0, "")
-    for line in lines:
+    for line in itertools.chain(lines, [""]):
+        if line is None:
+            if contstr or parenlev > 0 or continued:
+                yield PAUSE_IN_STATEMENT
+            else:
+                yield PAUSE
+            continue
         lnum = lnum + 1
         line = universal_newline(line)
         pos, max = 0, len(line)
@@ -108,28 +470,27 @@ def generate_tokens(lines, flags):
                 raise TokenError(
                     "EOF while scanning triple-quoted string literal",
                     strstart[2], strstart[0], strstart[1]+1,
-                    token_list, lnum-1)
-            endmatch = endDFA.recognize(line)
+                    None, lnum-1)
+            endmatch = endFinder.recognize(line)
             if endmatch >= 0:
                 pos = end = endmatch
-                tok = (Token.STRING, contstr + line[:end], strstart[0],
+                contstr.append(line[:end])
+                tok = (Token.STRING, "".join(contstr), strstart[0],
                        strstart[1], line)
-                token_list.append(tok)
+                yield tok
                 last_comment = ''
-                contstr, needcont = '', 0
-                contline = None
+                contstr, needcont = [], 0
             elif (needcont and not line.endswith('\\\n') and
                                not line.endswith('\\\r\n')):
-                tok = (Token.ERRORTOKEN, contstr + line, strstart[0],
+                contstr.append(line)
+                tok = (Token.ERRORTOKEN, "".join(contstr), strstart[0],
                        strstart[1], line)
-                token_list.append(tok)
+                yield tok
                 last_comment = ''
-                contstr = ''
-                contline = None
+                contstr = []
                 continue
             else:
-                contstr = contstr + line
-                contline = contline + line
+                contstr.append(line)
                 continue
 
         elif parenlev == 0 and not continued:  # new statement
@@ -164,17 +525,19 @@ def generate_tokens(lines, flags):
                     raise TabError(lnum, pos, line)
                 indents.append(column)
                 altindents.append(altcolumn)
-                token_list.append((Token.INDENT, line[:pos], lnum, 0, line))
+                tok = (Token.INDENT, line[:pos], lnum, 0, line)
+                yield tok
                 last_comment = ''
             else:
                 while column < indents[-1]:
                     indents = indents[:-1]
                     altindents = altindents[:-1]
-                    token_list.append((Token.DEDENT, '', lnum, pos, line))
+                    tok = (Token.DEDENT, '', lnum, pos, line)
+                    yield tok
                     last_comment = ''
                 if column != indents[-1]:
                     err = "unindent does not match any outer indentation level"
-                    raise TokenIndentationError(err, line, lnum, 0, token_list)
+                    raise TokenIndentationError(err, line, lnum, 0, None)
                 if altcolumn != altindents[-1]:
                     raise TabError(lnum, pos, line)
             if async_def_nl and async_def_indent >= indents[-1]:
@@ -187,81 +550,97 @@ def generate_tokens(lines, flags):
                 if parenlev > 0:
                     lnum1, start1, line1 = parenlevstart
                     raise TokenError("parenthesis is never closed", line1,
-                                     lnum1, start1 + 1, token_list, lnum)
+                                     lnum1, start1 + 1, None, lnum)
                 raise TokenError("EOF in multi-line statement", line,
-                                 lnum, 0, token_list)
+                                 lnum, 0, None)
             continued = 0
 
         while pos < max:
+            start = whiteSpaceDFA.recognize(line, pos)
+            if start < 0:
+                start = pos
+            if start < max:
+                # skip over comments and strings with str.find()
+                initial = line[start]
+                if initial == '#':
+                    pos = find_comment_end(line, start)
+                    last_comment = line[start:pos]
+                    continue
+                if initial in STRING_INITIALS:
+                    end = find_string_end(line, start)
+                    if end >= 0:
+                        pos = end
+                        tok = (Token.STRING, line[start:end], lnum, start,
+                               line)
+                        yield tok
+                        last_comment = ''
+                        continue
             pseudomatch = pseudoDFA.recognize(line, pos)
             if pseudomatch >= 0:                            # scan for tokens
-                # JDR: Modified
-                start = whiteSpaceDFA.recognize(line, pos)
-                if start < 0:
-                    start = pos
                 end = pseudomatch
 
                 if start == end:
                     raise TokenError("Unknown character", line,
-                                     lnum, start + 1, token_list)
+                                     lnum, start + 1, None)
 
                 pos = end
                 token, initial = line[start:end], line[start]
                 if (initial in numchars or \
                    (initial == '.' and token != '.' and token != '...')):
                     # ordinary number
-                    token_list.append((Token.NUMBER, token, lnum, start, line))
+                    tok = (Token.NUMBER, token, lnum, start, line)
+                    yield tok
                     last_comment = ''
                 elif initial in '\r\n':
                     if parenlev <= 0:
                         if async_def:
                             async_def_nl = True
                         tok = (Token.NEWLINE, last_comment, lnum, start, line)
-                        token_list.append(tok)
+                        yield tok
                     last_comment = ''
-                elif initial == '#':
-                    last_comment = token
                 elif token in triple_quoted:
-                    endDFA = endDFAs[token]
-                    endmatch = endDFA.recognize(line, pos)
+                    endFinder = endFinders[token]
+                    endmatch = endFinder.recognize(line, pos)
                     if endmatch >= 0:                     # all on one line
                         pos = endmatch
                         token = line[start:pos]
                         tok = (Token.STRING, token, lnum, start, line)
-                        token_list.append(tok)
+                        yield tok
                         last_comment = ''
                     else:
                         strstart = (lnum, start, line)
-                        contstr = line[start:]
-                        contline = line
+                        contstr = [line[start:]]
                         break
                 elif initial in single_quoted or \
                     token[:2] in single_quoted or \
                     token[:3] in single_quoted:
                     if token[-1] == '\n':                  # continued string
                         strstart = (lnum, start, line)
-                        endDFA = (endDFAs[initial] or endDFAs[token[1]] or
-                                   endDFAs[token[2]])
-                        contstr, needcont = line[start:], 1
-                        contline = line
+                        endFinder = (endFinders[initial] or
+                                     endFinders[token[1]] or
+                                     endFinders[token[2]])
+                        contstr, needcont = [line[start:]], 1
                         break
                     else:                                  # ordinary string
                         tok = (Token.STRING, token, lnum, start, line)
-                        token_list.append(tok)
+                        yield tok
                         last_comment = ''
                 elif (initial in namechars or              # ordinary name
                       ord(initial) >= 0x80):               # unicode identifier
                     if not verify_identifier(token):
                         raise TokenError("invalid character in identifier",
-                                         line, lnum, start + 1, token_list)
+                                         line, lnum, start + 1, None)
 
                     if async_def:                          # inside 'async def' function
                         if token == 'async':
-                            token_list.append((Token.ASYNC, token, lnum, start, line))
+                            tok = (Token.ASYNC, token, lnum, start, line)
+                            yield tok
                         elif token == 'await':
-                            token_list.append((Token.AWAIT, token, lnum, start, line))
+                            tok = (Token.AWAIT, token, lnum, start, line)
+                            yield tok
                         else:
-                            token_list.append((Token.NAME, token, lnum, start, line))
+                            tok = (Token.NAME, token, lnum, start, line)
+                            yield tok
                     elif token == 'async':                 # async token, look ahead
                         #ahead token
                         if pos < max:
@@ -273,13 +652,17 @@ def generate_tokens(lines, flags):
                             if ahead_token == 'def':
                                 async_def = True
                                 async_def_indent = indents[-1]
-                                token_list.append((Token.ASYNC, token, lnum, start, line))
+                                tok = (Token.ASYNC, token, lnum, start, line)
+                                yield tok
                             else:
-                                token_list.append((Token.NAME, token, lnum, start, line))
+                                tok = (Token.NAME, token, lnum, start, line)
+                                yield tok
                         else:
-                            token_list.append((Token.NAME, token, lnum, start, line))
+                            tok = (Token.NAME, token, lnum, start, line)
+                            yield tok
                     else:
-                        token_list.append((Token.NAME, token, lnum, start, line))
+                        tok = (Token.NAME, token, lnum, start, line)
+                        yield tok
                     last_comment = ''
                 elif initial == '\\':                      # continued stmt
                     continued = 1
@@ -292,37 +675,34 @@ def generate_tokens(lines, flags):
                         parenlev = parenlev - 1
                         if parenlev < 0:
                             raise TokenError("unmatched '%s'" % initial, line,
-                                             lnum, start + 1, token_list)
+                                             lnum, start + 1, None)
                     if token in OPMAP:
                         punct = OPMAP[token]
                     else:
                         punct = Token.OP
-                    token_list.append((punct, token, lnum, start, line))
+                    tok = (punct, token, lnum, start, line)
+                    yield tok
                     last_comment = ''
             else:
-                start = whiteSpaceDFA.recognize(line, pos)
-                if start < 0:
-                    start = pos
                 if start<max and line[start] in single_quoted:
                     raise TokenError("EOL while scanning string literal",
-                             line, lnum, start+1, token_list)
+                             line, lnum, start+1, None)
                 tok = (Token.ERRORTOKEN, line[pos], lnum, pos, line)
-                token_list.append(tok)
+                yield tok
                 last_comment = ''
                 pos = pos + 1
 
     lnum -= 1
     if not (flags & consts.PyCF_DONT_IMPLY_DEDENT):
-        if token_list and token_list[-1][0] != Token.NEWLINE:
+        if tok is not None and tok[0] != Token.NEWLINE:
             tok = (Token.NEWLINE, '', lnum, 0, '\n')
-            token_list.append(tok)
+            yield tok
         for indent in indents[1:]:                # pop remaining indent levels
-            token_list.append((Token.DEDENT, '', lnum, pos, line))
-    tok = (Token.NEWLINE, '', lnum, 0, '\n')
-    token_list.append(tok)
+            tok = (Token.DEDENT, '', lnum, pos, line)
+            yield tok
+    yield (Token.NEWLINE, '', lnum, 0, '\n')
 
-    token_list.append((Token.ENDMARKER, '', lnum, pos, line))
-    return token_list
+    yield (Token.ENDMARKER, '', lnum, pos, line)
 
 
 def universal_newline(line):
@@ -0,0 +1,136 @@
+"""Completeness of the input of an interactive session.
+
+InputChecker answers the question a REPL asks after every line: should the
+input be run, should more lines be read, or is it invalid already?  It
+tokenizes and parses the input like PythonParser.parse_source() does in
+'single' mode, but with CheckState.check_token(), so that no tree is built.
+
+The state of the tokenizer and of the parser is kept between calls: when
+the input only grew by some lines, just the new lines are tokenized and
+parsed.  The tokenizer reads its lines from a queue, and pauses when the
+queue is empty instead of ending the source, see iter_tokens().
+
+The input is:
+
+* invalid when its lines so far have a syntax error;
+* complete when the parser accepted a whole statement, or when a blank
+  line ends a compound statement, like in the interactive interpreter;
+* incomplete otherwise, e.g. in a string, parentheses or continuation line,
+  or in the block of a compound statement which may go on.
+
+A last line without a line end is checked as if it had one.  When the input
+is not the previous one followed by more lines, e.g. because that last line
+got longer or an earlier line was edited, it is checked again from the
+start.
+"""
+
+import collections
+
+from . import pyparse, pytokenizer, error
+from .parser import ParseError
+from .pytoken import Token
+
+COMPLETE = "complete"
+INCOMPLETE = "incomplete"
+INVALID = "invalid"
+
+
+class InputChecker:
+    """Checker of the completeness of interactive input.
+
+    check() takes the whole input typed so far and returns COMPLETE,
+    INCOMPLETE or INVALID.  The SyntaxError of invalid input is kept in
+    `error`.
+    """
+
+    def __init__(self, version, filename="<stdin>", flags=0,
+                 tokenizer="dfa"):
+        self.parser = pyparse.PythonParser(version, tokenizer=tokenizer)
+        self.filename = filename
+        self.flags = flags
+        self.reset()
+
+    def reset(self):
+        """Forget the input checked so far."""
+        # the input given to the tokenizer, and whether its last line had
+        # no line end
+        self.source = ""
+        self.partial = False
+        self.status = None
+        self.error = None
+        # the lines not given to the tokenizer yet, and whether the input
+        # was ended for it
+        self.lines = collections.deque()
+        self.closed = False
+        self.blank = True
+        self.done = False
+        self.last_value_seen = None
+        self.state = self.parser.new_check_state(self.parser.syms.single_input)
+        self.tokens = pytokenizer.iter_tokens(self._read_lines(), self.flags,
+                                              tokenizer=self.parser.tokenizer)
+
+    def _read_lines(self):
+        while True:
+            if self.lines:
+                yield self.lines.popleft()
+            elif self.closed:
+                return
+            else:
+                yield None
+
+    def check(self, source):
+        """Return the completeness of the input `source`."""
+        if source == self.source and self.status is not None:
+            return self.status
+        if (self.partial or self.closed or
+                not source.startswith(self.source)):
+            self.reset()
+        lines = source[len(self.source):].splitlines(True)
+        self.source = source
+        if lines:
+            if lines[-1][-1] not in "\r\n":
+                self.partial = True
+                lines[-1] += "\n"
+            self.blank = not lines[-1].strip()
+            self.lines.extend(lines)
+        if self.status != INVALID:
+            self.status = self._feed()
+        return self.status
+
+    def _feed(self):
+        state = self.state
+        tp = 0
+        next_value_seen = None
+        try:
+            for tok in self.tokens:
+                if tok is pytokenizer.PAUSE_IN_STATEMENT:
+                    return INCOMPLETE
+                if tok is pytokenizer.PAUSE:
+                    if self.done:
+                        return COMPLETE
+                    if not self.blank:
+                        return INCOMPLETE
+                    # a blank line ends the compound statement
+                    self.closed = True
+                    continue
+                tp, value, lineno, column, line = tok
+                if self.done:
+                    if tp == Token.NEWLINE or tp == Token.ENDMARKER:
+                        continue
+                    raise error.SyntaxError(
+                        "multiple statements found while compiling a "
+                        "single statement", lineno, column, line,
+                        self.filename)
+                next_value_seen = value
+                if state.check_token(tp, value, lineno, column, line):
+                    self.done = True
+                self.last_value_seen = value
+        except ParseError as e:
+            self.error = pyparse.convert_parse_error(
+                e, tp, self.last_value_seen, next_value_seen, self.filename)
+            return INVALID
+        except error.SyntaxError as e:
+            e.filename = self.filename
+            self.error = e
+            return INVALID
+        return COMPLETE
@@ -0,0 +1,379 @@
+"""Outlines of modules, read from their tokens.
+
+Skimmer.skim() returns the `def`, `class` and `import` statements of a
+module, at any depth, as OutlineItem objects.  It only tokenizes the
+source: the tokens are scanned for the statements it looks for while
+keeping track of the indentation and of the depth of parentheses, and the
+parser and ASTBuilder are not run.  This is 8 to 10 times faster than
+PythonParser.parse() with either tokenizer, see benchmarks/bench_skim.py.
+
+The skimmer does not check the rest of the syntax, so a module with syntax
+errors outside the statements it reads may still have an outline.  When
+it finds something it does not expect, like a decorator which is not
+followed by a definition or an import statement it cannot read, and when
+the source does not tokenize, it falls back to a full parse.  This raises
+the SyntaxError of the source, if any, and otherwise gives the same
+outline from the parse tree.
+"""
+
+from . import pyparse, pytokenizer, astbuilder, ast, misc, error
+from .pytoken import Token
+
+
+class OutlineItem:
+    """A statement of the outline of a module.
+
+    * kind: "def", "async def", "class", "import" or "from".
+    * name: The name of a definition, None for imports.
+    * qualname: The qualified name of a definition, like the __qualname__
+      of functions and classes, e.g. "C.f.<locals>.g"; None for imports.
+    * scope: The qualname of the definition holding the statement, or None
+      at the top level of the module.
+    * lineno, col_offset: Where the statement starts, at its first
+      decorator for decorated definitions.
+    * end_lineno: The last line of the statement, including its body.
+    * module: The module name of a "from" import, None if it has only
+      dots.
+    * level: The number of dots of a "from" import.
+    * names: The ast.alias of every name imported.
+    """
+
+    __slots__ = ("kind", "name", "qualname", "scope", "lineno",
+                 "col_offset", "end_lineno", "module", "level", "names")
+
+    def __init__(self, kind, name, qualname, scope, lineno, col_offset,
+                 end_lineno=0, module=None, level=0, names=None):
+        self.kind = kind
+        self.name = name
+        self.qualname = qualname
+        self.scope = scope
+        self.lineno = lineno
+        self.col_offset = col_offset
+        self.end_lineno = end_lineno
+        self.module = module
+        self.level = level
+        self.names = names
+
+    def __repr__(self):
+        if self.name is None:
+            return "<OutlineItem %s at lines %d-%d>" % (
+                self.kind, self.lineno, self.end_lineno)
+        return "<OutlineItem %s %s at lines %d-%d>" % (
+            self.kind, self.qualname, self.lineno, self.end_lineno)
+
+
+def _qualname(scope, scope_kind, name):
+    if scope is None:
+        return name
+    if scope_kind == "class":
+        return "%s.%s" % (scope, name)
+    return "%s.<locals>.%s" % (scope, name)
+
+
+class Ambiguous(Exception):
+    """Raised when the tokens are not what the skimmer expects."""
+
+
+OPENING = frozenset([Token.LPAR, Token.LSQB, Token.LBRACE])
+CLOSING = frozenset([Token.RPAR, Token.RSQB, Token.RBRACE])
+
+
+class Skimmer:
+    """Reads the outline of modules for the given version of Python.
+
+    `tokenizer` is passed to the tokenizer, see pytokenizer.TOKENIZERS.
+    """
+
+    def __init__(self, version, tokenizer="dfa"):
+        self.parser = pyparse.PythonParser(version, tokenizer=tokenizer)
+
+    def skim(self, bytessrc, compile_info):
+        """Return the list of OutlineItems of a module, in source order."""
+        parser = self.parser
+        source_lines, flags, enc = parser.decode_source(bytessrc,
+                                                        compile_info)
+        try:
+            tokens = pytokenizer.generate_tokens(source_lines, flags,
+                                                 parser.tokenizer)
+            items = self._skim_tokens(tokens)
+        except (error.TokenError, error.TokenIndentationError, Ambiguous):
+            items = self.outline_from_tree(bytessrc, compile_info)
+        if enc is not None:
+            compile_info.encoding = enc
+        return items
+
+    def _skim_tokens(self, tokens):
+        items = []
+        # the open definitions: (item, kind, indent of their block), with
+        # an indent of -1 for a definition whose body is on its line
+        scopes = []
+        scope = None
+        scope_kind = None
+        indent = 0
+        decorator = None
+        line_start = True
+        last_lineno = 0
+        i = 0
+        while True:
+            tp, value, lineno, column, line = tokens[i]
+            if tp == Token.NEWLINE:
+                last_lineno = lineno
+                line_start = True
+                while scopes and scopes[-1][2] < 0:
+                    scopes.pop()[0].end_lineno = lineno
+                i += 1
+            elif tp == Token.INDENT:
+                indent += 1
+                i += 1
+            elif tp == Token.DEDENT:
+                indent -= 1
+                while scopes and scopes[-1][2] > indent:
+                    scopes.pop()[0].end_lineno = last_lineno
+                i += 1
+            elif tp == Token.ENDMARKER:
+                break
+            else:
+                if scopes:
+                    scope = scopes[-1][0].qualname
+                    scope_kind = scopes[-1][1]
+                else:
+                    scope = scope_kind = None
+                if tp == Token.NAME and value in ("import", "from"):
+                    item, i = self._read_import(tokens, i, scope)
+                    items.append(item)
+                elif (tp == Token.AT or
+                        tp == Token.NAME and value in ("def", "class") or
+                        tp == Token.ASYNC and tokens[i + 1][1] == "def"):
+                    if not line_start:
+                        raise Ambiguous
+                    if tp == Token.AT:
+                        if decorator is None:
+                            decorator = (lineno, column)
+                        i = self._skip_statement(tokens, i)
+                        if tokens[i][0] != Token.NEWLINE:
+                            raise Ambiguous
+                        continue
+                    if decorator is None:
+                        decorator = (lineno, column)
+                    item, i = self._read_definition(tokens, i, scope,
+                                                    scope_kind, decorator)
+                    items.append(item)
+                    decorator = None
+                    if (tokens[i][0] == Token.NEWLINE and
+                            tokens[i + 1][0] == Token.INDENT):
+                        last_lineno = tokens[i][2]
+                        indent += 1
+                        scopes.append((item, item.kind, indent))
+                        i += 2
+                    elif tokens[i][0] == Token.NEWLINE:
+                        raise Ambiguous
+                    else:
+                        scopes.append((item, item.kind, -1))
+                        line_start = False
+                    continue
+                else:
+                    i = self._skip_statement(tokens, i)
+                if decorator is not None:
+                    raise Ambiguous
+                if tokens[i][0] != Token.NEWLINE:
+                    # a statement after a semicolon or a colon
+                    line_start = False
+                    i += 1
+        return items
+
+    def _skip_statement(self, tokens, i):
+        """Return the index of the NEWLINE ending the statement at i, or of
+        the semicolon or colon after which a statement may start."""
+        depth = 0
+        while True:
+            tp = tokens[i][0]
+            if tp in OPENING:
+                depth += 1
+            elif tp in CLOSING:
+                depth -= 1
+            elif depth == 0 and (tp == Token.NEWLINE or tp == Token.SEMI or
+                                 tp == Token.COLON):
+                return i
+            elif tp == Token.ENDMARKER:
+                raise Ambiguous
+            i += 1
+
+    def _read_definition(self, tokens, i, scope, scope_kind, start):
+        """Read the header of a definition and return its OutlineItem and
+        the index of the token after its colon."""
+        kind = tokens[i][1]
+        if tokens[i][0] == Token.ASYNC:
+            i += 1
+            if tokens[i][1] != "def":
+                raise Ambiguous
+            kind = "async def"
+        name_token = tokens[i + 1]
+        if name_token[0] != Token.NAME:
+            raise Ambiguous
+        name = misc.new_identifier(name_token[1])
+        item = OutlineItem(kind, name, _qualname(scope, scope_kind, name),
+                           scope, start[0], start[1])
+        i = self._skip_statement(tokens, i + 2)
+        if tokens[i][0] != Token.COLON:
+            raise Ambiguous
+        return item, i + 1
+
+    def _read_import(self, tokens, i, scope):
+        """Read the import statement at i and return its OutlineItem and
+        the index of the token after it."""
+        tp, value, lineno, column, line = tokens[i]
+        if value == "import":
+            item = OutlineItem("import", None, None, scope, lineno, column)
+            names = []
+            i += 1
+            while True:
+                name, i = self._read_dotted_name(tokens, i)
+                alias, i = self._read_alias(tokens, i, name)
+                names.append(alias)
+                if tokens[i][0] != Token.COMMA:
+                    break
+                i += 1
+        else:
+            item = OutlineItem("from", None, None, scope, lineno, column)
+            i += 1
+            level = 0
+            while tokens[i][0] == Token.DOT or tokens[i][0] == Token.ELLIPSIS:
+                level += len(tokens[i][1])
+                i += 1
+            module = None
+            if tokens[i][1] != "import":
+                module, i = self._read_dotted_name(tokens, i)
+            if tokens[i][0] != Token.NAME or tokens[i][1] != "import":
+                raise Ambiguous
+            item.module = module
+            item.level = level
+            i += 1
+            if tokens[i][0] == Token.STAR:
+                alias, i = self._read_alias(tokens, i + 1, "*")
+                names = [alias]
+            else:
+                parenthesized = tokens[i][0] == Token.LPAR
+                if parenthesized:
+                    i += 1
+                names = []
+                while True:
+                    name_token = tokens[i]
+                    if name_token[0] != Token.NAME:
+                        raise Ambiguous
+                    alias, i = self._read_alias(
+                        tokens, i + 1, misc.new_identifier(name_token[1]))
+                    names.append(alias)
+                    if tokens[i][0] != Token.COMMA:
+                        break
+                    i += 1
+                    if parenthesized and tokens[i][0] == Token.RPAR:
+                        break
+                if parenthesized:
+                    if tokens[i][0] != Token.RPAR:
+                        raise Ambiguous
+                    i += 1
+        tp = tokens[i][0]
+        if tp != Token.NEWLINE and tp != Token.SEMI:
+            raise Ambiguous
+        item.names = names
+        item.end_lineno = tokens[i - 1][2]
+        return item, i
+
+    def _read_dotted_name(self, tokens, i):
+        """Return the dotted name at i and the index of the token after
+        it."""
+        parts = []
+        while True:
+            if tokens[i][0] != Token.NAME:
+                raise Ambiguous
+            parts.append(misc.new_identifier(tokens[i][1]))
+            i += 1
+            if tokens[i][0] != Token.DOT:
+                return ".".join(parts), i
+            i += 1
+
+    def _read_alias(self, tokens, i, name):
+        """Return the ast.alias of `name`, followed by an optional `as` at
+        i, and the index of the token after it."""
+        asname = None
+        if tokens[i][0] == Token.NAME and tokens[i][1] == "as":
+            if tokens[i + 1][0] != Token.NAME:
+                raise Ambiguous
+            asname = misc.new_identifier(tokens[i + 1][1])
+            i += 2
+        return ast.alias(name, asname), i
+
+    def outline_from_tree(self, bytessrc, compile_info):
+        """Return the outline of a module like skim(), from its parse tree.
+
+        This is the fallback of skim(); it parses the whole module and
+        raises its SyntaxError, if any.
+        """
+        parser = self.parser
+        tree = parser.parse_source(bytessrc, compile_info)
+        syms = parser.syms
+        builder = astbuilder.ASTBuilder(tree, compile_info, syms)
+        items = []
+        # (node, scope item or None) in reverse source order
+        todo = [(tree, None)]
+        while todo:
+            node, scope_item = todo.pop()
+            node_type = node.type
+            if scope_item is None:
+                scope = scope_kind = None
+            else:
+                scope = scope_item.qualname
+                scope_kind = scope_item.kind
+            if node_type == syms.import_stmt:
+                stmt = builder.handle_import_stmt(node)
+                if isinstance(stmt, ast.Import):
+                    item = OutlineItem("import", None, None, scope,
+                                       stmt.lineno, stmt.col_offset)
+                else:
+                    item = OutlineItem("from", None, None, scope,
+                                       stmt.lineno, stmt.col_offset,
+                                       module=stmt.module, level=stmt.level)
+                item.names = stmt.names
+                item.end_lineno = _end_lineno(node)
+                items.append(item)
+                continue
+            if node_type == syms.decorated or node_type == syms.async_stmt:
+                definition = node.get_child(node.num_children() - 1)
+                if definition.type == syms.async_funcdef:
+                    definition = definition.get_child(1)
+                    kind = "async def"
+                elif definition.type == syms.funcdef:
+                    kind = "def" if node_type == syms.decorated else "async def"
+                elif definition.type == syms.classdef:
+                    kind = "class"
+                else:
+                    definition = None
+            elif node_type == syms.funcdef or node_type == syms.classdef:
+                definition = node
+                kind = "def" if node_type == syms.funcdef else "class"
+            else:
+                definition = None
+            if definition is not None:
+                name = misc.new_identifier(definition.get_child(1).get_value())
+                item = OutlineItem(kind, name,
+                                   _qualname(scope, scope_kind, name), scope,
+                                   node.get_lineno(), node.get_column(),
+                                   _end_lineno(node))
+                items.append(item)
+                scope_item = item
+                node = definition.get_child(definition.num_children() - 1)
+            for i in range(node.num_children() - 1, -1, -1):
+                child = node.get_child(i)
+                if child.num_children():
+                    todo.append((child, scope_item))
+        return items
+
+
+def _end_lineno(node):
+    """Return the line of the last token of a node, but for DEDENTs."""
+    while node.num_children():
+        child = node.get_child(node.num_children() - 1)
+        if child.type == Token.DEDENT:
+            child = node.get_child(node.num_children() - 2)
+        node = child
+    return node.get_lineno()
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import random
 import string
 import sys
@@ -32,6 +34,28 @@ class TestAstBuilder(TestCase):
         self.assertEqual(len(mod.body), 1)
         return mod.body[0]
 
+    def test_nodes_have_no_dict(self):
+        mod = self.get_ast("x = f(a, *b)")
+        self.assertFalse(hasattr(mod, "__dict__"))
+        call = mod.body[0].value
+        self.assertFalse(hasattr(call, "__dict__"))
+        self.assertEqual(call.lineno, 1)
+        self.assertEqual(call.col_offset, 4)
+        self.assertFalse(hasattr(call.args[1], "__dict__"))
+
+    def test_shared_operators(self):
+        mod = self.get_ast("x = a + b + c\ny = a + b")
+        first = mod.body[0].value
+        self.assertIs(first.op, ast.Add)
+        self.assertIs(first.left.op, ast.Add)
+        self.assertIs(mod.body[1].value.op, ast.Add)
+        self.assertIs(first.left.left.ctx, ast.Load)
+        self.assertIs(mod.body[0].targets[0].ctx, ast.Store)
+        self.assertIsInstance(ast.Add, ast.operator)
+        self.assertRaises(AttributeError, setattr, ast.Add, "x", 1)
+        self.assertIs(copy.deepcopy(ast.Add), ast.Add)
+        self.assertIs(pickle.loads(pickle.dumps(ast.NotIn)), ast.NotIn)
+
     def test_top_level(self):
         mod = self.get_ast("hi = 32")
         self.assertIsInstance(mod, ast.Module)
@@ -1400,3 +1424,33 @@ class TestAstBuilder(TestCase):
         # self.assertEqual(exc.msg,
         #                  "(unicode error) 'unicodeescape' codec can't decode"
         #                  " bytes in position 0-2: truncated \\xXX escape")
+
+
+class TestCompactAstBuilder(TestAstBuilder):
+    """Same tests, building the AST from compact parse trees."""
+
+    def setUp(self):
+        self.parser = pyparse.PythonParser("3.5", compact=True)
+
+
+class TestSinglePassAstBuilder(TestAstBuilder):
+    """Same tests, building the AST while parsing."""
+
+    def get_ast(self, source, p_mode=None, flags=None):
+        if p_mode is None:
+            p_mode = "exec"
+        if flags is None:
+            flags = consts.CO_FUTURE_WITH_STATEMENT
+        info = pyparse.CompileInfo("<test>", p_mode, flags)
+        if isinstance(source, str):
+            source = source.encode()
+        return self.parser.parse(source, info, single_pass=True)
+
+    def test_parse_tree_is_freed(self):
+        info = pyparse.CompileInfo("<test>", "exec")
+        mod = self.parser.parse(b"x = 1\ndef f():\n    return 2\n", info,
+                                single_pass=True)
+        self.assertEqual(len(mod.body), 2)
+        self.assertIsInstance(mod.body[1].body[0], ast.Return)
+        self.assertEqual(self.parser.reducers, {})
+        self.assertIsNone(self.parser.root)
@@ -0,0 +1,75 @@
+import pickle
+from .. import pyparse, ast, astdump
+from ..error import SyntaxError
+from . import TestCase, expressions
+
+
+class TestAstDump(TestCase):
+
+    def setUp(self):
+        self.parser = pyparse.PythonParser("3.5")
+
+    def get_ast(self, source):
+        info = pyparse.CompileInfo("<test>", "exec")
+        return self.parser.parse(source.encode(), info)
+
+    def assertSameTree(self, tree, other):
+        todo = [(tree, other)]
+        while todo:
+            tree, other = todo.pop()
+            self.assertIs(type(tree), type(other))
+            if isinstance(tree, ast.AST):
+                if tree in astdump.SHARED_INSTANCES:
+                    self.assertIs(tree, other)
+                    continue
+                for name in astdump.node_slots(type(tree)):
+                    todo.append((getattr(tree, name), getattr(other, name)))
+            elif isinstance(tree, list):
+                self.assertEqual(len(tree), len(other))
+                todo.extend(zip(tree, other))
+            else:
+                self.assertEqual(repr(tree), repr(other))
+
+    def roundtrip(self, tree):
+        dumped = astdump.dump(tree)
+        self.assertIsInstance(dumped, bytes)
+        return astdump.load(dumped)
+
+    def test_expressions(self):
+        for group in expressions.TESTS + expressions.EXEC_INPUTS:
+            for source in group:
+                try:
+                    tree = self.get_ast(source)
+                except SyntaxError:
+                    continue
+                self.assertSameTree(tree, self.roundtrip(tree))
+
+    def test_constants(self):
+        tree = self.get_ast("x = (1, 1.0, True, 0.0, -0.0, 1j, b'1', '1', None)")
+        values = self.roundtrip(tree).body[0].value.elts
+        self.assertEqual([repr(value.n) for value in values[:2]],
+                         ["1", "1.0"])
+        self.assertIs(values[2].value, True)
+        self.assertEqual(repr(values[3].n), "0.0")
+        self.assertEqual(repr(values[4].operand.n), "0.0")
+        self.assertEqual(repr(values[5].n), "1j")
+        self.assertEqual(values[6].s, b"1")
+        self.assertEqual(values[7].s, "1")
+        self.assertIs(values[8].value, None)
+
+    def test_signed_zeros(self):
+        tree = ast.Module([ast.Expr(ast.Num(-0.0, 1, 0), 1, 0),
+                           ast.Expr(ast.Num(0.0, 1, 0), 1, 0)])
+        body = self.roundtrip(tree).body
+        self.assertEqual(repr(body[0].value.n), "-0.0")
+        self.assertEqual(repr(body[1].value.n), "0.0")
+
+    def test_deep_tree(self):
+        tree = self.get_ast("x = " + " + ".join(["a"] * 5000))
+        self.assertRaises(RecursionError, pickle.dumps, tree)
+        self.assertSameTree(tree, self.roundtrip(tree))
+
+    def test_shared_instances(self):
+        tree = self.roundtrip(self.get_ast("a = b + c"))
+        self.assertIs(tree.body[0].targets[0].ctx, ast.Store)
+        self.assertIs(tree.body[0].value.op, ast.Add)
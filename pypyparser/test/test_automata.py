@@ -1,4 +1,5 @@
-from ..automata import DFA, DEFAULT
+from ..automata import DFA, NonGreedyDFA, DEFAULT
+from ..pytokenize import pseudoDFA
 from . import TestCase
 
 
@@ -6,11 +7,24 @@ class TestAutomata(TestCase):
 
     def test_states(self):
         d = DFA([{"\x00": 1}, {"\x01": 0}], [False, True])
-        self.assertEqual(d.states, "\x01\xff\xff\x00")
-        self.assertEqual(d.defaults, "\xff\xff")
-        self.assertEqual(d.max_char, 2)
+        self.assertEqual(d.num_classes, 3)
+        self.assertEqual(d.class_map, b"\x01\x02" + b"\x00" * 127)
+        self.assertEqual(d.transitions, b"\xff\x01\xff\xff\xff\x00")
 
         d = DFA([{"\x00": 1}, {DEFAULT: 0}], [False, True])
-        self.assertEqual(d.states, "\x01\x00")
-        self.assertEqual(d.defaults, "\xff\x00")
-        self.assertEqual(d.max_char, 1)
+        self.assertEqual(d.num_classes, 2)
+        self.assertEqual(d.class_map, b"\x01" + b"\x00" * 128)
+        self.assertEqual(d.transitions, b"\xff\x01\x00\x00")
+
+    def test_classes(self):
+        # all the letters but the string prefixes behave the same
+        classes = set(pseudoDFA.class_map[ord(c)] for c in "ghkmqsvwyz_GHKMQSVWYZ")
+        self.assertEqual(len(classes), 1)
+        self.assertTrue(pseudoDFA.num_classes < 64)
+
+    def test_non_ascii(self):
+        d = DFA([{"\x80": 1}, {}], [False, True])
+        self.assertEqual(d.recognize("€"), 1)
+        self.assertEqual(d.recognize("\x7f"), -1)
+        d = NonGreedyDFA([{DEFAULT: 0, "'": 1}, {}], [False, True])
+        self.assertEqual(d.recognize("€\xe9'x"), 3)
@@ -162,3 +162,26 @@ class TestFuture(TestCase):
         s = ('from __future__ import division;\n'
              'from __future__ import with_statement;')
         self.assertEqual(self._run(s, (2, 23)), 0)
+
+    def test_lazy_tokens(self):
+        s = '"doc"\nfrom __future__ import division\nx = 1\n'
+        tokens = pytokenizer.generate_tokens(s.splitlines(True), 0)
+        stream = pytokenizer.iter_tokens(s.splitlines(True), 0)
+        it = future.TokenIterator(stream)
+        flags, last_future_import = future.add_future_flags(
+            future.FUTURE_FLAGS["3.5"], it)
+        self.assertEqual(last_future_import, (2, 23))
+        # only the prefix was tokenized, the rest is still pending
+        self.assertTrue(len(it.seen) < len(tokens))
+        self.assertEqual(list(it.replay()), tokens)
+
+    def test_token_buffer(self):
+        s = '"doc"\nfrom __future__ import division\nx = 1\n'
+        tokens = pytokenizer.generate_tokens(s.splitlines(True), 0)
+        buffer = pytokenizer.tokenize_buffer(s.splitlines(True), 0)
+        it = future.TokenIterator(buffer)
+        flags, last_future_import = future.add_future_flags(
+            future.FUTURE_FLAGS["3.5"], it)
+        self.assertEqual(last_future_import, (2, 23))
+        self.assertEqual(it.seen, [])
+        self.assertEqual(list(it.replay()), tokens)
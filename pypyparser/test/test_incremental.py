@@ -0,0 +1,140 @@
+import random
+from .. import pyparse, astdump, incremental
+from ..error import SyntaxError
+from . import TestCase
+
+
+SOURCE = """\
+import os
+
+def f(x):
+    return x + 1
+
+# a comment
+class C:
+    a = 1
+
+    def g(self):
+        return [self.a,
+                2]
+
+@decorator
+def h(): pass
+x = 1; y = 2
+s = '''multi
+line'''
+"""
+
+
+class TestIncrementalParser(TestCase):
+
+    def setUp(self):
+        self.parser = pyparse.PythonParser("3.5")
+
+    def check(self, inc):
+        source = inc.get_source()
+        expected = self.parser.parse(source, pyparse.CompileInfo("<test>"))
+        self.assertEqual(astdump.dump(inc.module), astdump.dump(expected))
+
+    def edit(self, inc, start, end, text):
+        inc.edit(start, end, text)
+        self.check(inc)
+
+    def test_edit_in_line(self):
+        inc = incremental.IncrementalParser("3.5", SOURCE)
+        self.check(inc)
+        old_class = inc.module.body[2]
+        self.edit(inc, (4, 15), (4, 16), "2")
+        self.assertEqual(inc.module.body[1].body[0].value.right.n, 2)
+        self.assertIs(inc.module.body[2], old_class)
+
+    def test_insert_lines(self):
+        inc = incremental.IncrementalParser("3.5", SOURCE)
+        last = inc.module.body[-1]
+        self.edit(inc, (2, 0), (2, 0), "a = 1\nb = 2\n")
+        self.assertIs(inc.module.body[-1], last)
+        self.assertEqual(last.lineno, 19)
+        self.edit(inc, (2, 0), (4, 0), "")
+        self.assertEqual(last.lineno, 17)
+
+    def test_lines_moved_when_read(self):
+        inc = incremental.IncrementalParser("3.5", SOURCE)
+        cls = inc.module.body[2]
+        method = cls.body[1]
+        self.edit(inc, (2, 0), (2, 0), "\n")
+        self.assertEqual((cls.lineno, method.lineno), (8, 11))
+        inc.edit((1, 0), (1, 0), "\n\n")
+        self.assertEqual(method.lineno, 11)
+        self.assertIs(inc.module.body[2], cls)
+        self.assertEqual((cls.lineno, method.lineno), (10, 13))
+        inc.edit((1, 0), (2, 0), "")
+        self.assertEqual([stmt.lineno for stmt in inc.module.body[-3:]],
+                         [18, 18, 19])
+        self.assertEqual([stmt.lineno for stmt in reversed(inc.module.body)],
+                         [19, 18, 18, 16, 9, 5, 2])
+        self.check(inc)
+
+    def test_join_lines(self):
+        inc = incremental.IncrementalParser("3.5", SOURCE)
+        self.edit(inc, (16, 12), (17, 0), "; ")
+        self.edit(inc, (16, 14), (16, 14), "\n")
+
+    def test_indented_line_joins_previous_statement(self):
+        inc = incremental.IncrementalParser("3.5", SOURCE)
+        self.edit(inc, (5, 0), (5, 0), "    y = 2\n")
+        self.assertEqual(len(inc.module.body[1].body), 2)
+
+    def test_error_and_fix(self):
+        inc = incremental.IncrementalParser("3.5", SOURCE)
+        exc = self.assertRaises(SyntaxError, inc.edit, (18, 7), (18, 7), "(")
+        self.assertEqual(exc.msg, "parenthesis is never closed")
+        self.assertIsNone(inc.module)
+        self.assertIs(inc.error, exc)
+        self.edit(inc, (18, 8), (18, 8), ")")
+        self.assertIsNone(inc.error)
+        inc = incremental.IncrementalParser("3.5", "x = (\n")
+        self.assertIsNone(inc.module)
+        self.edit(inc, (1, 5), (1, 5), "1)")
+
+    def test_string_over_statements(self):
+        inc = incremental.IncrementalParser("3.5", SOURCE)
+        self.assertRaises(SyntaxError, inc.edit, (2, 0), (2, 0), "'''")
+        self.edit(inc, (5, 0), (5, 0), "'''")
+        self.assertEqual(len(inc.module.body), 7)
+
+    def test_edit_at_ends(self):
+        inc = incremental.IncrementalParser("3.5", SOURCE)
+        self.edit(inc, (1, 0), (1, 0), "import sys\n")
+        self.edit(inc, (20, 0), (20, 0), "z = 3")
+        self.edit(inc, (20, 5), (20, 5), "\nw = 4\n")
+        self.assertEqual(inc.module.body[-1].lineno, 21)
+        inc = incremental.IncrementalParser("3.5", "")
+        self.edit(inc, (1, 0), (1, 0), "x = 1\n")
+
+    def test_random_edits(self):
+        rnd = random.Random(42)
+        snippets = ["", "x", "\n", "    ", "(", ")", "1", " + ", ":", "'",
+                    "\ndef k():\n    pass\n", "\n\n", "@d\n", "#"]
+        inc = incremental.IncrementalParser("3.5", SOURCE)
+        for i in range(300):
+            lines = inc.get_source().splitlines(True) or [""]
+            start_line = rnd.randrange(len(lines))
+            start_col = rnd.randrange(len(lines[start_line]) + 1)
+            end_line = min(start_line + rnd.choice([0, 0, 1]), len(lines) - 1)
+            if end_line == start_line:
+                end_col = rnd.randrange(start_col, len(lines[end_line]) + 1)
+            else:
+                end_col = rnd.randrange(len(lines[end_line]) + 1)
+            try:
+                inc.edit((start_line + 1, start_col), (end_line + 1, end_col),
+                         rnd.choice(snippets))
+            except SyntaxError:
+                self.assertIsNone(inc.module)
+                self.assertRaises(SyntaxError, self.parser.parse,
+                                  inc.get_source(),
+                                  pyparse.CompileInfo("<test>"))
+            else:
+                self.check(inc)
+            if rnd.random() < 0.1:
+                # get back to a valid source now and then
+                inc = incremental.IncrementalParser("3.5", SOURCE)
@@ -0,0 +1,106 @@
+import copy
+from .. import pyparse, astdump, lazyast, ast
+from ..error import SyntaxError
+from . import TestCase
+
+
+SOURCE = b"""\
+import os
+
+class C(Base):
+    x = 1; y = 2
+
+    def m(self):
+        if self:
+            return 1
+        elif x:
+            pass
+        else:
+            for i in y: pass
+        try:
+            f()
+        except E as e:
+            g()
+        finally:
+            h()
+
+@decorator
+async def f(a):
+    async with a as b:
+        await b
+"""
+
+
+class TestLazyAST(TestCase):
+
+    def setUp(self):
+        self.parser = pyparse.PythonParser("3.5")
+
+    def build(self, source, mode="exec"):
+        info = pyparse.CompileInfo("<test>", mode)
+        tree = self.parser.parse_source(source, info)
+        return lazyast.LazyASTBuilder(tree, info, self.parser.syms).build_ast()
+
+    def test_materialize(self):
+        module = self.build(SOURCE)
+        expected = self.parser.parse(SOURCE, pyparse.CompileInfo("<test>"))
+        self.assertEqual(astdump.dump(lazyast.materialize(module)),
+                         astdump.dump(expected))
+
+    def test_materialize_after_reads(self):
+        module = self.build(SOURCE)
+        method = module.body[1].body[2]
+        method.body[1].handlers[0].body
+        expected = self.parser.parse(SOURCE, pyparse.CompileInfo("<test>"))
+        self.assertEqual(astdump.dump(lazyast.materialize(module)),
+                         astdump.dump(expected))
+        self.assertIs(module.body[1].body[2], method.node)
+
+    def test_statements_built_on_read(self):
+        module = self.build(SOURCE)
+        self.assertIsInstance(module, ast.Module)
+        cls = module.body[1]
+        self.assertIsInstance(cls, lazyast.LazyStmt)
+        self.assertIsNone(cls.node)
+        self.assertEqual(cls.name, "C")
+        self.assertIsInstance(cls.node, ast.ClassDef)
+        self.assertEqual(cls.lineno, 3)
+        self.assertEqual(cls.bases[0].id, "Base")
+        x, y, method = cls.body
+        self.assertIsNone(method.node)
+        self.assertEqual(method.name, "m")
+        self.assertTrue(all(stmt.node is None for stmt in method.body))
+        self.assertIs(x.get_node(), x.get_node())
+        self.assertEqual(y.targets[0].id, "y")
+        func = module.body[2]
+        self.assertIsInstance(func.get_node(), ast.AsyncFunctionDef)
+        self.assertEqual(func.lineno, 20)
+        self.assertEqual(func.decorator_list[0].id, "decorator")
+
+    def test_set_field(self):
+        stmt = self.build(b"x = 1\n").body[0]
+        stmt.lineno = 5
+        self.assertEqual(stmt.node.lineno, 5)
+
+    def test_copy(self):
+        stmt = self.build(b"x = 1\n").body[0]
+        stmt_copy = copy.copy(stmt)
+        self.assertIsNone(stmt_copy.node)
+        self.assertEqual(stmt_copy.targets[0].id, "x")
+        self.assertIsNone(stmt.node)
+        empty = lazyast.LazyStmt.__new__(lazyast.LazyStmt)
+        self.assertRaises(AttributeError, getattr, empty, "node")
+
+    def test_errors_raised_on_read(self):
+        module = self.build(b"x = 1\n1 = y\n")
+        self.assertEqual(module.body[0].targets[0].id, "x")
+        exc = self.assertRaises(SyntaxError, getattr, module.body[1], "value")
+        self.assertEqual(exc.msg, "can't assign to literal")
+        self.assertEqual(exc.lineno, 2)
+
+    def test_other_modes(self):
+        tree = self.build(b"x + 1", "eval")
+        self.assertIsInstance(tree, ast.Expression)
+        tree = self.build(b"x = 1; y = 2\n", "single")
+        self.assertEqual([stmt.targets[0].id for stmt in tree.body],
+                         ["x", "y"])
@@ -0,0 +1,120 @@
+from .. import pyparse, astdump, lazyfunctions, ast
+from ..error import SyntaxError, IndentationError, TokenError
+from . import TestCase
+
+
+SOURCE = b"""\
+import os
+
+def f(x):
+    if x:
+        return 1
+    def g():
+        class D:
+            def h(self):
+                return 2
+        return D
+    return g
+
+class C:
+    def m(self): return 2
+
+    @decorator
+    async def n(self, y,
+                z):
+        await y(lambda: z)
+        x = (1,
+  2)
+
+def last():
+    pass
+"""
+
+
+class TestLazyParser(TestCase):
+
+    def setUp(self):
+        self.parser = pyparse.PythonParser("3.5")
+        self.lazy_parser = lazyfunctions.LazyParser("3.5")
+
+    def parse(self, source, mode="exec"):
+        return self.lazy_parser.parse(source,
+                                      pyparse.CompileInfo("<test>", mode))
+
+    def test_same_ast(self):
+        module = self.parse(SOURCE)
+        expected = self.parser.parse(SOURCE, pyparse.CompileInfo("<test>"))
+        self.assertEqual(astdump.dump(module), astdump.dump(expected))
+
+    def test_lazy_functions(self):
+        module = self.parse(SOURCE)
+        f = module.body[1]
+        self.assertIsInstance(f, lazyfunctions.LazyFunctionDef)
+        self.assertIsInstance(f, ast.FunctionDef)
+        self.assertIsNotNone(f.lazy_body)
+        self.assertEqual(f.name, "f")
+        self.assertEqual(f.lineno, 3)
+        body = f.body
+        self.assertIsNone(f.lazy_body)
+        self.assertIs(f.body, body)
+        self.assertEqual(len(body), 3)
+        self.assertEqual(body[0].lineno, 4)
+        g = body[1]
+        self.assertIsInstance(g, lazyfunctions.LazyFunctionDef)
+        h = g.body[0].body[0]
+        self.assertIsInstance(h, lazyfunctions.LazyFunctionDef)
+        self.assertEqual(h.body[0].lineno, 9)
+
+    def test_same_line_body_is_parsed(self):
+        module = self.parse(SOURCE)
+        m, n = module.body[2].body
+        self.assertIs(type(m), ast.FunctionDef)
+        self.assertIsInstance(n, lazyfunctions.LazyAsyncFunctionDef)
+        self.assertEqual(n.name, "n")
+        self.assertEqual(len(n.decorator_list), 1)
+        self.assertEqual([stmt.lineno for stmt in n.body], [19, 20])
+
+    def test_set_body(self):
+        f = self.parse(SOURCE).body[1]
+        f.body = []
+        self.assertIsNone(f.lazy_body)
+        self.assertEqual(f.body, [])
+
+    def test_other_modes(self):
+        tree = self.parse(b"x + 1", "eval")
+        self.assertIsInstance(tree, ast.Expression)
+        tree = self.parse(b"def f():\n    pass\n\n", "single")
+        self.assertIs(type(tree.body[0]), ast.FunctionDef)
+
+    def test_errors_in_body(self):
+        f = self.parse(b"def f():\n    x = = 1\n").body[0]
+        exc = self.assertRaises(SyntaxError, getattr, f, "body")
+        self.assertEqual(exc.msg, "invalid syntax")
+        self.assertEqual(exc.lineno, 2)
+        self.assertEqual(exc.offset, 8)
+        self.assertEqual(exc.text, "    x = = 1\n")
+        f = self.parse(b"def f():\n    if x:\n    y\n").body[0]
+        exc = self.assertRaises(IndentationError, getattr, f, "body")
+        self.assertEqual(exc.msg, "expected an indented block")
+        self.assertEqual(exc.lineno, 3)
+
+    def test_errors_in_body_raised_again(self):
+        f = self.parse(b"def f():\n    x = = 1\n").body[0]
+        self.assertRaises(SyntaxError, getattr, f, "body")
+        self.assertRaises(SyntaxError, getattr, f, "body")
+        self.assertIsNotNone(f.lazy_body)
+
+    def test_errors_raised_by_parse(self):
+        self.assertRaises(SyntaxError, self.parse, b"def f(:\n    pass\n")
+        exc = self.assertRaises(TokenError, self.parse,
+                                b"def f():\n  x = '''\n")
+        self.assertEqual(exc.filename, "<test>")
+
+    def test_future_flags(self):
+        source = b"from __future__ import generator_stop\ndef f():\n    yield\n"
+        info = pyparse.CompileInfo("<test>")
+        self.lazy_parser.parse(source, info)
+        expected = pyparse.CompileInfo("<test>")
+        self.parser.parse(source, expected)
+        self.assertEqual(info.last_future_import, expected.last_future_import)
+        self.assertEqual(info.flags, expected.flags)
@@ -36,6 +36,21 @@ class TestParserGenerator(TestCase):
         self.assertEqual(states, [([(1, 1)], False), ([], True)])
         self.assertEqual(g.labels[0], 0)
 
+    def test_dispatch(self):
+        g = self.gram_for("foo: bar NAME\nbar: baz | NUMBER\nbaz: STRING")
+        foo, bar, baz = [g.symbol_ids[name] for name in ("foo", "bar", "baz")]
+        name, number, string = [g.token_ids[getattr(token, tp)]
+                                for tp in ("NAME", "NUMBER", "STRING")]
+        self.assertEqual(len(g.dispatch), 3)
+        actions = g.dispatch[foo - 256]
+        self.assertEqual(actions[0], {
+            number: (1, ((1, bar),)),
+            string: (1, ((1, bar), (1, baz))),
+        })
+        self.assertEqual(actions[1], {name: (2, ())})
+        self.assertEqual(actions[2], {})
+        self.assertEqual(g.dispatch[baz - 256][0], {string: (1, ())})
+
     def test_load_python_grammars(self):
         gram_pat = os.path.join(os.path.dirname(__file__), "..", "data",
                                 "Grammar*")
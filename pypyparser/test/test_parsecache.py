@@ -0,0 +1,119 @@
+import os
+import tempfile
+from .. import pyparse, astdump, consts, parsecache
+from ..error import SyntaxError
+from . import TestCase
+
+
+class TestParseCache(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = parsecache.ParseCache(self.tmp.name, "3.5")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def parse(self, source, mode="exec", flags=0, cache=None):
+        info = pyparse.CompileInfo("<test>", mode, flags)
+        return (cache or self.cache).parse(source, info), info
+
+    def entry_paths(self):
+        return [path for path, size, mtime in self.cache._entries()]
+
+    def test_hit_and_miss(self):
+        tree, info = self.parse(b"x = 1\n")
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        cached, info = self.parse(b"x = 1\n")
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(astdump.dump(cached), astdump.dump(tree))
+        # a new cache on the same directory uses the same files
+        cache = parsecache.ParseCache(self.tmp.name, "3.5")
+        self.parse(b"x = 1\n", cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_key(self):
+        self.parse(b"x = 1\n")
+        self.parse(b"x = 2\n")
+        self.parse(b"x = 1\n", mode="single")
+        self.parse(b"x = 1\n", flags=consts.PyCF_DONT_IMPLY_DEDENT)
+        self.assertEqual(self.cache.misses, 4)
+        self.assertEqual(len(self.entry_paths()), 4)
+        cache = parsecache.ParseCache(self.tmp.name, "3.2")
+        info = pyparse.CompileInfo("<test>")
+        self.assertNotEqual(cache.key(b"x = 1\n", info),
+                            self.cache.key(b"x = 1\n", info))
+
+    def test_str_and_bytes(self):
+        source = '# coding: latin-1\nx = "\xe9"\n'
+        tree, info = self.parse(source.encode("utf-8"))
+        self.assertEqual(tree.body[0].value.s, "\xc3\xa9")
+        self.assertEqual(info.encoding, "iso-8859-1")
+        tree, info = self.parse(source)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        self.assertEqual(tree.body[0].value.s, "\xe9")
+        self.assertEqual(info.encoding, None)
+        cached, info = self.parse(source)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(cached.body[0].value.s, "\xe9")
+        self.assertEqual(info.encoding, None)
+
+    def test_compile_info(self):
+        source = (b"# coding: latin-1\n"
+                  b"from __future__ import barry_as_FLUFL\nx <> y\n")
+        tree, info = self.parse(source)
+        cached, cached_info = self.parse(source)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(cached_info.encoding, "iso-8859-1")
+        self.assertEqual(cached_info.flags, info.flags)
+        self.assertTrue(cached_info.flags & consts.CO_FUTURE_BARRY_AS_BDFL)
+        self.assertEqual(cached_info.last_future_import,
+                         info.last_future_import)
+
+    def test_syntax_error(self):
+        self.assertRaises(SyntaxError, self.parse, b"x = = 1\n")
+        self.assertRaises(SyntaxError, self.parse, b"x = = 1\n")
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        self.assertEqual(self.entry_paths(), [])
+
+    def test_corrupted_entry(self):
+        self.parse(b"x = 1\n")
+        path, = self.entry_paths()
+        with open(path, "rb") as f:
+            entry = f.read()
+        with open(path, "wb") as f:
+            f.write(entry[:len(entry) // 2])
+        tree, info = self.parse(b"x = 1\n")
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        self.assertEqual(tree.body[0].value.n, 1)
+        self.parse(b"x = 1\n")
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_eviction(self):
+        self.parse(b"x = 0\n")
+        size = self.cache.size
+        # room for three entries, which are about the same size
+        max_size = 3 * size + size // 2
+        cache = parsecache.ParseCache(self.tmp.name, "3.5", max_size)
+        self.assertEqual(cache.size, size)
+        for i in range(1, 3):
+            self.parse(b"x = %d\n" % (i,), cache=cache)
+        self.assertEqual(cache.evictions, 0)
+        # make x = 0 the least recently used entry
+        for path in self.entry_paths():
+            os.utime(path, ns=(10**18, 10**18))
+        os.utime(cache._path(cache.key(b"x = 0\n", pyparse.CompileInfo(
+            "<test>"))), ns=(10**9, 10**9))
+        self.parse(b"x = 3\n", cache=cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.size, max_size)
+        self.assertEqual(len(self.entry_paths()), 3)
+        self.parse(b"x = 1\n", cache=cache)
+        self.parse(b"x = 0\n", cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+    def test_clear(self):
+        self.parse(b"x = 1\n")
+        self.cache.clear()
+        self.assertEqual(self.entry_paths(), [])
+        self.assertEqual(self.cache.size, 0)
@@ -86,6 +86,15 @@ class TestParser(TestCase):
         g = pgen.build_grammar(MyGrammar)
         return SimpleParser(g, self), g
 
+    def test_shared_copy(self):
+        p, gram = self.parser_for("foo: 'a' bar\nbar: 'b'")
+        copy = gram.shared_copy()
+        self.assertIs(copy.symbol_names, gram.symbol_names)
+        self.assertIs(copy.dfas, gram.dfas)
+        self.assertEqual(copy.start, gram.start)
+        tree = SimpleParser(copy, self).parse("a b")
+        self.assertEqual(tree, p.parse("a b"))
+
     def test_multiple_rules(self):
         gram = """foo: 'next_rule' bar 'end' NEWLINE ENDMARKER
 bar: NAME NUMBER\n"""
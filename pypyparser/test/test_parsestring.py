@@ -93,3 +93,25 @@ class TestParsetring(TestCase):
         input = ["'", 'x', ' ', chr(0xc3), chr(0xa9), ' ', chr(92), 'n', "'"]
         w_ret = parsestring.parsestr(''.join(input))
         self.assertEqual(w_ret, ''.join(expected))
+
+    def test_escapes_at_edges(self):
+        decode = parsestring.decode_unicode_escape
+        self.assertEqual(decode('\\x41bc\\n'), 'Abc\n')
+        self.assertEqual(decode('a\\q\\\\'), 'a\\q\\')
+        self.assertEqual(decode('\\7\\18'), '\x07\x018')
+        self.assertEqual(decode('\\u00e9\\U0001F600'), '\xe9\U0001F600')
+        self.assertRaises(ValueError, decode, 'abc\\')
+        self.assertRaises(ValueError, decode, 'abc\\x4')
+        self.assertRaises(ValueError, decode, 'abc\\u00e')
+        decode = parsestring.decode_bytes_escape
+        self.assertEqual(decode(b'\\x41bc\\n'), b'Abc\n')
+        self.assertEqual(decode(b'a\\q\\\\'), b'a\\q\\')
+        self.assertEqual(decode(b'\\7\\18'), b'\x07\x018')
+        self.assertRaises(ValueError, decode, b'abc\\')
+        self.assertRaises(ValueError, decode, b'abc\\x4')
+
+    def test_no_escape(self):
+        s = 'x' * 100
+        self.assertIs(parsestring.decode_unicode_escape(s), s)
+        b = b'x' * 100
+        self.assertIs(parsestring.decode_bytes_escape(b), b)
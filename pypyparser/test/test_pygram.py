@@ -0,0 +1,38 @@
+import os
+import glob
+import warnings
+from .. import metaparser, pygram
+from . import TestCase
+
+
+class TestGeneratedGrammars(TestCase):
+
+    def grammar_files(self):
+        gram_pat = os.path.join(os.path.dirname(__file__), "..", "data",
+                                "Grammar*")
+        for gram_file in sorted(glob.glob(gram_pat)):
+            with open(gram_file) as fp:
+                yield os.path.basename(gram_file), fp.read()
+
+    def test_up_to_date(self):
+        for filename, gram_source in self.grammar_files():
+            gram = pygram.load_generated_grammar(filename, gram_source)
+            self.assertIsNotNone(gram, "run python -m pypyparser.gengrammar")
+            pgen = metaparser.ParserGenerator(gram_source)
+            expected = pgen.build_grammar(pygram.PythonGrammar)
+            for name in ("symbol_ids", "symbol_names", "symbol_to_label",
+                         "keyword_ids", "labels", "token_ids", "start",
+                         "dfas", "dispatch"):
+                self.assertEqual(getattr(gram, name), getattr(expected, name))
+
+    def test_stale(self):
+        filename, gram_source = next(self.grammar_files())
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            gram = pygram.load_generated_grammar(filename, gram_source + "\n")
+        self.assertIsNone(gram)
+        self.assertEqual(len(w), 1)
+        self.assertIn("out of date", str(w[0].message))
+
+    def test_missing(self):
+        self.assertIsNone(pygram.load_generated_grammar("Grammar0.1", ""))
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
-from .. import pyparse
+import os
+import tempfile
+from .. import pyparse, ast, astdump
 from ..error import SyntaxError, IndentationError, TabError
-from .. import consts
-from . import TestCase
+from .. import consts, pytokenizer
+from ..error import TokenError
+from ..parser import ParseError
+from . import TestCase, expressions
 
 
 class TestPythonParserWithoutSpace(TestCase):
@@ -67,6 +71,186 @@ class TestPythonParserWithoutSpace(TestCase):
         self.assertEqual(exc.lineno, 1)
         self.assertEqual(exc.offset, 4)
 
+    def test_tokens_are_streamed(self):
+        # the parser sees the tokens as they are produced, so the first error
+        # in the source is reported even if a later line does not tokenize
+        exc = self.assertRaises(SyntaxError, self.parse, b"x = = 1\ny = '''\n")
+        self.assertEqual(exc.msg, "invalid syntax")
+        self.assertEqual(exc.lineno, 1)
+
+    def test_token_buffer(self):
+        source = ("# comment\r\nx = (1,\n     2)  # end\n"
+                  "if x:\n    s = \"\"\"a\r\nb\"\"\"\n    y = 'c\\\nd'\n")
+        lines = source.splitlines(True)
+        buffer = pytokenizer.tokenize_buffer(lines, 0)
+        tokens = pytokenizer.generate_tokens(lines, 0)
+        self.assertEqual(list(buffer), tokens)
+        self.assertEqual(buffer[-1], tokens[-1])
+        # only the NEWLINE after a comment and the tokens added at the end
+        # have a string or line which is not a slice of the source
+        self.assertEqual(buffer.extra_values, {7: "# end"})
+        self.assertEqual(sorted(buffer.extra_lines),
+                         list(range(len(tokens) - 3, len(tokens))))
+        exc = self.assertRaises(TokenError, pytokenizer.tokenize_buffer,
+                                ["x = (\n"], 0)
+        self.assertEqual([tok[1] for tok in exc.tokens], ["x", "=", "("])
+
+    def test_source_text(self):
+        text = 'a = 1\r\nb = """x\ry"""\n\x0cc\rd'
+        source = pytokenizer.SourceText(text, 3)
+        self.assertEqual(list(source),
+                         ['a = 1\n', 'b = """x\n', 'y"""\n', '\x0c', 'c\n',
+                          'd\n'])
+        self.assertEqual(len(source), 6)
+        self.assertEqual(source.get_line(4), 'b = """x\n')
+        self.assertRaises(IndexError, source.get_line, 9)
+        offset = text.index("y")
+        self.assertEqual(source.offset_to_position(offset), (5, 0))
+        self.assertEqual(source.position_to_offset(5, 0), offset)
+        self.assertEqual(source.offset_to_position(len(text)), (8, 1))
+        source = pytokenizer.SourceText("x\n")
+        self.assertEqual(source.offset_to_position(2), (2, 0))
+        self.assertEqual(source.position_to_offset(2, 0), 2)
+
+    def test_source_text_tokens(self):
+        text = 'a = 1\r\nb = """x\ry"""\n\nif a:\r  c = (1,\r\n2)\r\nd'
+        lines = text.splitlines(True)
+        lines[-1] += "\n"
+        self.assertEqual(
+            list(pytokenizer.iter_tokens(pytokenizer.SourceText(text), 0)),
+            list(pytokenizer.iter_tokens(lines, 0)))
+
+    def test_utf8_source_text(self):
+        text = 'é = 1\r\nb = """x\u2028y"""\x85c = \'€\'\rd'
+        source = pytokenizer.Utf8SourceText(text.encode("utf-8"))
+        self.assertEqual(list(source), list(pytokenizer.SourceText(text)))
+        offset = text.encode("utf-8").index(b"c")
+        self.assertEqual(source.offset_to_position(offset), (4, 0))
+        # the columns count characters
+        self.assertEqual(source.offset_to_position(offset + 8), (4, 6))
+        self.assertEqual(source.position_to_offset(4, 6), offset + 8)
+        text = 'é = 1\r\nb = """x\u2028y"""\nc = \'€\'\rd'
+        info = pyparse.CompileInfo("<test>")
+        self.assertEqual(self.parse(text.encode("utf-8"), info=info),
+                         self.parse(text))
+        self.assertEqual(info.encoding, "utf-8")
+
+    def test_utf8_decode_error(self):
+        exc = self.assertRaises(SyntaxError, self.parse,
+                                b"x = 1\ny = '\xff'\n")
+        self.assertEqual(exc.lineno, 2)
+        self.assertEqual(exc.offset, 6)
+        self.assertIn("can't decode byte 0xff", exc.msg)
+        self.assertEqual(exc.filename, "<test>")
+        # other encodings are still decoded at once
+        source = "# coding: latin-1\nx = 'é'\n"
+        tree = self.parse(source.encode("latin-1"))
+        self.assertEqual(tree, self.parse(source))
+
+    def test_add_tokens(self):
+        source = "def f(a):\n    return [a, 'b'] # c\n\nf(1)\n"
+        buffer = pytokenizer.tokenize_buffer(source.splitlines(True), 0)
+        self.parser.prepare(self.parser.syms.file_input)
+        self.assertEqual(self.parser.add_tokens(buffer), len(buffer) - 1)
+        tree = self.parser.root
+        self.assertEqual(tree, self.parse(source.encode()))
+        buffer = pytokenizer.tokenize_buffer(["x = 1\n", "y = = 2\n"], 0)
+        self.parser.prepare(self.parser.syms.file_input)
+        exc = self.assertRaises(ParseError, self.parser.add_tokens, buffer)
+        self.assertEqual((exc.value, exc.lineno, exc.column), ("=", 2, 4))
+        self.assertEqual(exc.line, "y = = 2\n")
+
+    def test_check_syntax(self):
+        for group in expressions.TESTS + expressions.EXEC_INPUTS:
+            for source in group:
+                source = source.encode()
+                try:
+                    self.parse(source)
+                except SyntaxError as e:
+                    exc = self.assertRaises(
+                        type(e), self.parser.check_syntax, source,
+                        pyparse.CompileInfo("<test>"))
+                    self.assertEqual((exc.msg, exc.lineno, exc.offset),
+                                     (e.msg, e.lineno, e.offset))
+                else:
+                    info = pyparse.CompileInfo("<test>")
+                    self.assertIsNone(self.parser.check_syntax(source, info))
+        for source, mode in [(b"x = = 1\n", "exec"), (b"def f():\nx\n", "exec"),
+                             (b"if 1:\n  x\n    y\n", "exec"), (b"f(\n", "exec"),
+                             (b"print 1\n", "exec"), (b"x = 1\ny\n", "single"),
+                             (b"1 1", "eval")]:
+            e = self.assertRaises(SyntaxError, self.parse, source, mode)
+            exc = self.assertRaises(
+                type(e), self.parser.check_syntax, source,
+                pyparse.CompileInfo("<test>", mode))
+            self.assertEqual((exc.msg, exc.lineno, exc.offset, exc.text),
+                             (e.msg, e.lineno, e.offset, e.text))
+        info = pyparse.CompileInfo("<test>")
+        self.parser.check_syntax(b"from __future__ import barry_as_FLUFL\n",
+                                 info)
+        self.assertTrue(info.flags & consts.CO_FUTURE_BARRY_AS_BDFL)
+        self.assertIsNone(self.parser.root)
+
+    def test_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        sources = []
+        for group in expressions.TESTS + expressions.EXEC_INPUTS:
+            sources.extend(source.encode() for source in group)
+        sources.append(b"x = (\n")
+
+        def run(source):
+            try:
+                tree = self.parser.parse(source, pyparse.CompileInfo("<test>"))
+            except SyntaxError as e:
+                return (e.msg, e.lineno, e.offset)
+            return astdump.dump(tree)
+
+        def check(source):
+            try:
+                self.parser.check_syntax(source, pyparse.CompileInfo("<test>"))
+            except SyntaxError as e:
+                return (e.msg, e.lineno, e.offset)
+
+        expected = [run(source) for source in sources]
+        expected_checks = [check(source) for source in sources]
+        with ThreadPoolExecutor(8) as pool:
+            for i in range(5):
+                self.assertEqual(list(pool.map(run, sources)), expected)
+                self.assertEqual(list(pool.map(check, sources)),
+                                 expected_checks)
+        self.assertIsNone(self.parser.root)
+
+    def test_nested_parses(self):
+        # a reducer may start another parse with the same parser
+        p = self.parser
+        inner = []
+
+        def reduce_stmt(node):
+            inner.append(p.parse_source(b"y = 2\n",
+                                        pyparse.CompileInfo("<test>")))
+            return node
+
+        state = p.new_state(p.syms.file_input, {p.syms.stmt: reduce_stmt})
+        tree = p._parse_source(b"x = 1\nz = 3\n", pyparse.CompileInfo("<test>"),
+                               1, state)
+        self.assertEqual(tree, self.parse(b"x = 1\nz = 3\n"))
+        self.assertEqual(inner, [self.parse(b"y = 2\n")] * 2)
+
+    def test_compact_tree(self):
+        p = pyparse.PythonParser("3.5", compact=True)
+        tree = p.parse_source(b"x = y\n", pyparse.CompileInfo("<test>"))
+        expr_stmt = tree.get_child(0).get_child(0).get_child(0).get_child(0)
+        self.assertEqual(expr_stmt.type, p.syms.expr_stmt)
+        self.assertEqual(expr_stmt.num_children(), 3)
+        self.assertEqual(expr_stmt.get_child(0).type, p.syms.testlist_star_expr)
+        self.assertEqual(expr_stmt.get_child(0).get_child(0).type, p.syms.atom)
+        self.assertEqual(expr_stmt.get_child(2).get_child(0).type, p.syms.atom)
+        # nodes with several children are kept
+        tree = p.parse_source(b"x + y\n", pyparse.CompileInfo("<test>"))
+        expr_stmt = tree.get_child(0).get_child(0).get_child(0).get_child(0)
+        self.assertEqual(expr_stmt.get_child(0).get_child(0).type,
+                         p.syms.arith_expr)
+
     def test_is(self):
         self.parse(b"x is y")
         self.parse(b"x is not y")
@@ -193,6 +377,128 @@ if 1:
         pass""")
         self.assertRaises(SyntaxError, self.parse, b'def foo(): async with a: pass')
 
+    def test_parse_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(10):
+                path = os.path.join(tmp, "mod%d.py" % (i,))
+                with open(path, "wb") as f:
+                    f.write(b"x = %d\n" % (i,) if i != 7 else b"x = = 7\n")
+                    if i == 3:
+                        # too deep for pickle
+                        f.write(b"y = " + b" + ".join([b"a"] * 5000) + b"\n")
+                paths.append(path)
+            missing = os.path.join(tmp, "missing.py")
+            deep = os.path.join(tmp, "deep.py")
+            with open(deep, "wb") as f:
+                f.write(b"x = " + b"(" * 400 + b"1" + b")" * 400 + b"\n")
+            paths[:0] = [missing, deep]
+            results = dict(pyparse.parse_files(paths, "3.5", workers=2))
+        self.assertEqual(sorted(results), sorted(paths))
+        self.assertIsInstance(results[missing], FileNotFoundError)
+        self.assertEqual(results[missing].filename, missing)
+        self.assertIsInstance(results[deep], RecursionError)
+        del paths[:2]
+        for i, path in enumerate(paths):
+            if i == 7:
+                self.assertIsInstance(results[path], SyntaxError)
+                self.assertEqual(results[path].msg, "invalid syntax")
+                self.assertEqual(results[path].filename, path)
+            else:
+                self.assertIsInstance(results[path], ast.Module)
+                self.assertEqual(results[path].body[0].value.n, i)
+                self.assertIs(results[path].body[0].targets[0].ctx, ast.Store)
+        self.assertEqual(len(results[paths[3]].body), 2)
+
+    def test_parse_imports(self):
+        source = b"""\
+import os.path as p, sys
+x = {1: 2}; from .. import (a as b,
+                            c,)
+try:
+    from m import *
+except ImportError:
+    def f(): import n
+y = lambda: 0; import q
+"""
+        info = pyparse.CompileInfo("<test>")
+        imports = self.parser.parse_imports(source, info)
+        self.assertEqual(info.encoding, "utf-8")
+        self.assertEqual([type(stmt) for stmt in imports],
+                         [ast.Import, ast.ImportFrom, ast.ImportFrom,
+                          ast.Import, ast.Import])
+        self.assertEqual([(stmt.lineno, stmt.col_offset) for stmt in imports],
+                         [(1, 0), (2, 12), (5, 4), (7, 13), (8, 15)])
+        self.assertEqual([[(alias.name, alias.asname) for alias in stmt.names]
+                          for stmt in imports],
+                         [[("os.path", "p"), ("sys", None)],
+                          [("a", "b"), ("c", None)], [("*", None)],
+                          [("n", None)], [("q", None)]])
+        self.assertEqual(imports[1].module, None)
+        self.assertEqual(imports[1].level, 2)
+        self.assertEqual(imports[2].module, "m")
+
+    def test_parse_imports_errors(self):
+        info = pyparse.CompileInfo("<test>")
+        # only the import statements are parsed
+        self.assertEqual(self.parser.parse_imports(b"x = = 1\n", info), [])
+        exc = self.assertRaises(SyntaxError, self.parser.parse_imports,
+                                b"x = 1\nimport a b\n", info)
+        self.assertEqual(exc.msg, "invalid syntax")
+        self.assertEqual((exc.lineno, exc.offset), (2, 9))
+        self.assertEqual(exc.filename, "<test>")
+        exc = self.assertRaises(SyntaxError, self.parser.parse_imports,
+                                b"from a import b,\n", info)
+        self.assertEqual(exc.msg, "trailing comma is only allowed with "
+                                  "surronding parenthesis")
+        self.assertRaises(TokenError, self.parser.parse_imports,
+                          b"import a\nx = '''\n", info)
+
+    def test_parse_tree_imports(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.mkdir(os.path.join(tmp, "pkg"))
+            sources = {
+                "a.py": b"import pkg.b\n",
+                os.path.join("pkg", "__init__.py"): b"",
+                os.path.join("pkg", "b.py"): b"def f():\n    from . import c\n",
+                os.path.join("pkg", "c.py"): b"import import\n",
+                os.path.join("pkg", "data.txt"): b"import d\n",
+            }
+            for name, source in sources.items():
+                with open(os.path.join(tmp, name), "wb") as f:
+                    f.write(source)
+            os.symlink(os.path.join(tmp, "gone.py"),
+                       os.path.join(tmp, "pkg", "dangling.py"))
+            results = dict(pyparse.parse_tree_imports(tmp, "3.5", workers=2))
+        path = lambda *names: os.path.join(tmp, *names)
+        self.assertEqual(sorted(results),
+                         [path("a.py"), path("pkg", "__init__.py"),
+                          path("pkg", "b.py"), path("pkg", "c.py"),
+                          path("pkg", "dangling.py")])
+        self.assertIsInstance(results[path("pkg", "dangling.py")],
+                              FileNotFoundError)
+        self.assertEqual(results[path("a.py")][0].names[0].name, "pkg.b")
+        self.assertEqual(results[path("pkg", "__init__.py")], [])
+        from_import = results[path("pkg", "b.py")][0]
+        self.assertEqual((from_import.level, from_import.lineno), (1, 2))
+        self.assertIsInstance(results[path("pkg", "c.py")], SyntaxError)
+
+    def test_parse_file_imports_error(self):
+        class FailingParser:
+            def parse_imports(self, source, compile_info):
+                raise RecursionError("maximum recursion depth exceeded")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "a.py")
+            with open(path, "wb") as f:
+                f.write(b"import a\n")
+            worker_parser = pyparse._worker_parser
+            pyparse._worker_parser = FailingParser()
+            try:
+                result_path, result = pyparse._parse_file_imports(path)
+            finally:
+                pyparse._worker_parser = worker_parser
+        self.assertEqual(result_path, path)
+        self.assertIsInstance(result, RecursionError)
 
 
 class TestPythonParserWithSpace(TestCase):
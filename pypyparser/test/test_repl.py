@@ -0,0 +1,87 @@
+from .. import pyparse, repl, pytokenizer
+from ..error import SyntaxError
+from . import TestCase
+
+
+class TestInputChecker(TestCase):
+
+    def setUp(self):
+        self.checker = repl.InputChecker("3.5")
+
+    def test_status(self):
+        for source, status in [
+                ("", repl.COMPLETE),
+                ("x = 1", repl.COMPLETE),
+                ("x = 1\n\n", repl.COMPLETE),
+                ("x = (1,\n", repl.INCOMPLETE),
+                ("x = (1,\n  2)\n", repl.COMPLETE),
+                ("s = '''a\n\n", repl.INCOMPLETE),
+                ("x = 1 + \\\n", repl.INCOMPLETE),
+                ("if x:\n", repl.INCOMPLETE),
+                ("if x:\n    y\n", repl.INCOMPLETE),
+                ("if x:\n    y\n    # c\n", repl.INCOMPLETE),
+                ("if x:\n    y\n\n", repl.COMPLETE),
+                ("if x:\n    y\nelse:\n    z\n  \n", repl.COMPLETE),
+                ("@d\nclass A: pass\n", repl.INCOMPLETE),
+                ("@d\nclass A: pass\n\n", repl.COMPLETE),
+                ("if x:\n\n", repl.INVALID),
+                ("x = = 1\n", repl.INVALID),
+                ("x = 'abc\n", repl.INVALID),
+                ("x = 1\ny = 2\n", repl.INVALID),
+                ("if x:\n    y\nz\n", repl.INVALID)]:
+            self.assertEqual(repl.InputChecker("3.5").check(source), status,
+                             source)
+
+    def test_errors(self):
+        for source in ["x = = 1\n", "print 1\n", "if x:\n\n",
+                       "x = 'abc\n", "x = 1\ny = 2\n", "  x\n"]:
+            checker = repl.InputChecker("3.5")
+            self.assertEqual(checker.check(source), repl.INVALID)
+            info = pyparse.CompileInfo("<stdin>", "single")
+            e = self.assertRaises(SyntaxError,
+                                  pyparse.PythonParser("3.5").parse_source,
+                                  source, info)
+            self.assertEqual(type(checker.error), type(e))
+            self.assertEqual((checker.error.msg, checker.error.lineno,
+                              checker.error.offset, checker.error.filename),
+                             (e.msg, e.lineno, e.offset, e.filename))
+
+    def test_incremental(self):
+        checker = self.checker
+        lines = ["def f(x):\n", "    return (x +\n", "            1)\n", "\n"]
+        statuses = []
+        for i in range(1, len(lines) + 1):
+            statuses.append(checker.check("".join(lines[:i])))
+            if i == 1:
+                tokens = checker.tokens
+            # the tokenizer goes on with the new lines
+            self.assertIs(checker.tokens, tokens)
+        self.assertEqual(statuses, [repl.INCOMPLETE] * 3 + [repl.COMPLETE])
+        self.assertEqual(checker.check("".join(lines)), repl.COMPLETE)
+
+    def test_restart(self):
+        checker = self.checker
+        self.assertEqual(checker.check("x = (1"), repl.INCOMPLETE)
+        tokens = checker.tokens
+        # the last line got longer
+        self.assertEqual(checker.check("x = (1)"), repl.COMPLETE)
+        self.assertIsNot(checker.tokens, tokens)
+        tokens = checker.tokens
+        # an earlier line was edited
+        self.assertEqual(checker.check("if x:\n"), repl.INCOMPLETE)
+        self.assertIsNot(checker.tokens, tokens)
+        self.assertEqual(checker.check("if x:\n    y\n"), repl.INCOMPLETE)
+        self.assertEqual(checker.check("if x:\n    y = =\n"), repl.INVALID)
+        self.assertEqual(checker.check("if x:\n    y = =\n\n"), repl.INVALID)
+        self.assertEqual(checker.check("if x:\n    y = 1\n\n"),
+                         repl.COMPLETE)
+        self.assertIsNone(checker.error)
+
+    def test_tokenizer_pause(self):
+        lines = ["x = (1,\n", None, "2)\n", None, None, "y\n"]
+        tokens = list(pytokenizer.iter_tokens(lines, 0))
+        self.assertEqual(tokens[5], pytokenizer.PAUSE_IN_STATEMENT)
+        self.assertEqual(tokens[9:11], [pytokenizer.PAUSE] * 2)
+        self.assertEqual([tok for tok in tokens if isinstance(tok, tuple)],
+                         pytokenizer.generate_tokens(
+                             [line for line in lines if line is not None], 0))
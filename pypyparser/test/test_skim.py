@@ -0,0 +1,84 @@
+from .. import pyparse, skim
+from ..error import SyntaxError
+from . import TestCase
+
+
+SOURCE = b"""\
+import os.path, sys as system
+from . import a
+from ..pkg.mod import (b as c,
+                       d,)
+
+@decorator(1,
+           2)
+class C(Base):
+    x = {1: 2}; from m import *
+
+    def f(self, x: int=1) -> int:
+        if x: import y
+        def g():
+            class D: pass
+            return D
+        return g
+
+    async def h(self):
+        async with x:
+            pass
+
+def k(): return lambda: 0
+"""
+
+
+def summary(items):
+    return [(item.kind, item.qualname, item.scope, item.lineno,
+             item.col_offset, item.end_lineno, item.module, item.level,
+             None if item.names is None else
+             [(alias.name, alias.asname) for alias in item.names])
+            for item in items]
+
+
+class TestSkimmer(TestCase):
+
+    def setUp(self):
+        self.skimmer = skim.Skimmer("3.5")
+
+    def skim(self, source):
+        return self.skimmer.skim(source, pyparse.CompileInfo("<test>"))
+
+    def test_outline(self):
+        self.assertEqual(summary(self.skim(SOURCE)), [
+            ("import", None, None, 1, 0, 1, None, 0,
+             [("os.path", None), ("sys", "system")]),
+            ("from", None, None, 2, 0, 2, None, 1, [("a", None)]),
+            ("from", None, None, 3, 0, 4, "pkg.mod", 2,
+             [("b", "c"), ("d", None)]),
+            ("class", "C", None, 6, 0, 20, None, 0, None),
+            ("from", None, "C", 9, 16, 9, "m", 0, [("*", None)]),
+            ("def", "C.f", "C", 11, 4, 16, None, 0, None),
+            ("import", None, "C.f", 12, 14, 12, None, 0, [("y", None)]),
+            ("def", "C.f.<locals>.g", "C.f", 13, 8, 15, None, 0, None),
+            ("class", "C.f.<locals>.g.<locals>.D", "C.f.<locals>.g",
+             14, 12, 14, None, 0, None),
+            ("async def", "C.h", "C", 18, 4, 20, None, 0, None),
+            ("def", "k", None, 22, 0, 22, None, 0, None),
+        ])
+
+    def test_same_as_parse_tree(self):
+        info = pyparse.CompileInfo("<test>")
+        self.assertEqual(summary(self.skim(SOURCE)),
+                         summary(self.skimmer.outline_from_tree(SOURCE, info)))
+
+    def test_fallback(self):
+        # a decorator before a statement which is not a definition
+        exc = self.assertRaises(SyntaxError, self.skim, b"@d\nx = 1\n")
+        self.assertEqual(exc.lineno, 2)
+        self.assertRaises(SyntaxError, self.skim, b"import a b\n")
+        self.assertRaises(SyntaxError, self.skim, b"def f():\nx = 1\n")
+        self.assertRaises(SyntaxError, self.skim, b"x = '''\n")
+
+    def test_encoding(self):
+        info = pyparse.CompileInfo("<test>")
+        items = self.skimmer.skim("def café(): pass\n".encode("utf-8"),
+                                  info)
+        self.assertEqual(items[0].name, "café")
+        self.assertEqual(info.encoding, "utf-8")
@@ -0,0 +1,132 @@
+"""Differential tests of the tokenizers of pytokenizer.TOKENIZERS.
+
+tokenize() is the harness: it returns everything the tokenizer produces
+for some lines, tokens and error, so that the results of the "dfa" and
+"regex" tokenizers can be compared as a whole.
+"""
+
+import glob
+import os
+
+from .. import pytokenizer, pyparse, error
+from . import TestCase, expressions
+
+
+def tokenize(lines, tokenizer, flags=0):
+    """Return the tokens of `lines` followed by the error, if any."""
+    tokens = []
+    try:
+        for tok in pytokenizer.iter_tokens(lines, flags, tokenizer=tokenizer):
+            tokens.append(tok)
+    except error.SyntaxError as e:
+        tokens.append((type(e).__name__, e.msg, e.lineno, e.offset,
+                       e.lastlineno))
+    return tokens
+
+
+# Python 2 code, with the malformed numbers of Python 3 and other tokens
+# it no longer has.
+PY2_SOURCE = """\
+class Old:
+    def test(self):
+        self.assertEquals(0377, 255)
+        self.assertEquals(0777L, 511)
+        x = 1e+ 2 + .5e- + 1.5e+x + 0xffffffffL
+        print >> sys.stderr, `x`, x <> 1, ur'\\d'
+        exec "pass" in {}
+        return 07j, 00, 0o17, 1.e, 1ej, 0b2
+"""
+
+
+class TestTokenizers(TestCase):
+
+    def assertSameTokens(self, lines):
+        self.assertEqual(tokenize(lines, "regex"), tokenize(lines, "dfa"))
+
+    def test_expressions(self):
+        for group in (expressions.TESTS + expressions.EXEC_INPUTS +
+                      [expressions.constants]):
+            for source in group:
+                self.assertSameTokens((source + "\n").splitlines(True))
+                self.assertSameTokens(source.splitlines(True))
+
+    def test_edge_cases(self):
+        for source in ["x = 'abc\n", "x = b'\n", "x = rb'abc\\\ndef'\n",
+                       "f(u'''a\nb''', r\"\"\"c\\\"\"\"\"\"\")\n",
+                       "x = '''\n\n", "a = 1e5j + .5 + 0x1F + 0o17 + 0b1\n",
+                       "s = 'a\\\\\nb'\n", "x = $\n", "  \t# c\n  x\n",
+                       "if 1:\n  x\n y\n", "x = (1,\n", "x = \\\n  1\n",
+                       "a日本 = '€'\n", "x = f\"", "x = '",
+                       "async def f():\n    await x\n", "a <> b -> c\n"]:
+            self.assertSameTokens(source.splitlines(True))
+
+    def test_modules(self):
+        # the sources of the parser and of its tests
+        package = os.path.dirname(os.path.dirname(__file__))
+        paths = sorted(glob.glob(os.path.join(package, "*.py")) +
+                       glob.glob(os.path.join(package, "test", "*.py")))
+        for path in paths:
+            with open(path, encoding="utf-8", errors="surrogateescape") as f:
+                lines = f.read().splitlines(True)
+            self.assertSameTokens(lines)
+        self.assertSameTokens(PY2_SOURCE.splitlines(True))
+
+    def test_malformed_numbers(self):
+        # pseudoDFA backs up at most one character, so it finds no token
+        # where a shorter number would do; the regex tokenizer does the same
+        for number in ["0377", "1e+x", "1.5e+ 2", ".5e-", "1e+"]:
+            lines = ["x = %s\n" % (number,)]
+            for tokenizer in pytokenizer.TOKENIZERS:
+                tokens = tokenize(lines, tokenizer)
+                self.assertEqual(tokens[2][:3],
+                                 (pytokenizer.Token.ERRORTOKEN, " ", 1))
+            self.assertSameTokens(lines)
+        for number in ["0x", "0b2", "1.e", "1ej", "08.5", "0777j", "1..."]:
+            self.assertSameTokens(["x = %s\n" % (number,)])
+
+    def test_parser(self):
+        self.assertRaises(ValueError, pyparse.PythonParser, "3.5",
+                          tokenizer="lex")
+        parser = pyparse.PythonParser("3.5", tokenizer="regex")
+        source = b"def f(x):\n    return 'a' + x # y\n"
+        tree = parser.parse_source(source, pyparse.CompileInfo("<test>"))
+        expected = pyparse.PythonParser("3.5").parse_source(
+            source, pyparse.CompileInfo("<test>"))
+        self.assertEqual(tree, expected)
+        exc = self.assertRaises(error.SyntaxError, parser.parse_source,
+                                b"x = \"blah\n", pyparse.CompileInfo("<test>"))
+        self.assertEqual(exc.msg, "EOL while scanning string literal")
+
+    def test_quote_finders(self):
+        from ..pytokenize import endDFAs
+        samples = ["abc'", "a\\'b'", "a\\\\'b", "\\", "x\\\n'", "''''",
+                   "a\"'''", "a''b'''", "a\\'''b'''", "'\\''''", "",
+                   "€\\€'\"\"\"", "a\nb'\r\"\"\""]
+        for key, dfa in endDFAs.items():
+            finder = pytokenizer.endFinders[key]
+            if dfa is None:
+                self.assertIs(finder, None)
+                continue
+            for sample in samples:
+                for pos in range(len(sample) + 1):
+                    self.assertEqual(finder.recognize(sample, pos),
+                                     dfa.recognize(sample, pos))
+
+    def test_long_strings(self):
+        doc = ["    line %d with 'quotes', \\\" and # no comment\n" % i
+               for i in range(1000)]
+        lines = ['def f():\n', '    """\n'] + doc + ['    """ # c\n']
+        for tokenizer in pytokenizer.TOKENIZERS:
+            tokens = tokenize(lines, tokenizer)
+            self.assertEqual(tokens[7][:4], (pytokenizer.Token.STRING,
+                                             '"""\n' + "".join(doc) +
+                                             '    """', 2, 4))
+            self.assertEqual(tokens[8][:4], (pytokenizer.Token.NEWLINE,
+                                             "# c", 1003, 11))
+        self.assertSameTokens(lines)
+        data = "x = b'%s' + r'\\' # ' + '%s'\n" % ("\\x00" * 1000,
+                                                    "a" * 1000)
+        self.assertSameTokens([data])
+        self.assertEqual([tok[1] for tok in tokenize([data], "dfa")[:6]],
+                         ["x", "=", "b'%s'" % ("\\x00" * 1000,), "+",
+                          "r'\\' # '", "+"])
@@ -49,42 +49,170 @@ def is_simple_sum(sum):
     return True
 
 
+# How nodes are named in the "can't assign to ..." error messages.
+DESCRIPTIONS = {
+    "expr": None,
+    "BoolOp": "operator",
+    "BinOp": "operator",
+    "UnaryOp": "operator",
+    "Lambda": "lambda",
+    "IfExp": "conditional expression",
+    "Dict": "literal",
+    "Set": "literal",
+    "ListComp": "list comprehension",
+    "SetComp": "set comprehension",
+    "DictComp": "dict comprehension",
+    "GeneratorExp": "generator expression",
+    "Yield": "yield expression",
+    "Compare": "comparison",
+    "Call": "function call",
+    "Num": "literal",
+    "Str": "literal",
+    "Bytes": "literal",
+    "Ellipsis": "Ellipsis",
+    "Tuple": "()",
+}
+
+# Hand-written methods added to the generated classes.
+METHODS = {
+    "expr": """
+def set_context(self, ctx):
+    d = self._description
+    if d is None:
+        d = "%r" % (self,)
+    if ctx == Del:
+        msg = "can't delete %s" % (d,)
+    else:
+        msg = "can't assign to %s" % (d,)
+    raise UnacceptableExpressionContext(self, msg)
+""",
+    "Attribute": """
+def set_context(self, ctx):
+    if ctx == Store:
+        misc.check_forbidden_name(self.attr, self)
+    self.ctx = ctx
+""",
+    "Subscript": """
+def set_context(self, ctx):
+    self.ctx = ctx
+""",
+    "Starred": """
+def set_context(self, ctx):
+    self.ctx = ctx
+    self.value.set_context(ctx)
+""",
+    "Name": """
+def set_context(self, ctx):
+    if ctx == Store:
+        misc.check_forbidden_name(self.id, self)
+    self.ctx = ctx
+""",
+    "List": """
+def set_context(self, ctx):
+    if self.elts:
+        for elt in self.elts:
+            elt.set_context(ctx)
+    self.ctx = ctx
+""",
+    "Tuple": """
+def set_context(self, ctx):
+    if self.elts:
+        for elt in self.elts:
+            elt.set_context(ctx)
+        self.ctx = ctx
+    else:
+        # Assignment to () raises an error.
+        expr.set_context(self, ctx)
+""",
+}
+
+
 class ASTNodeVisitor(ASDLVisitor):
 
     def visitType(self, tp):
         self.visit(tp.value, tp.name)
 
     def visitSum(self, sum, base):
+        if is_simple_sum(sum):
+            self.make_simple_sum(sum, base)
+            return
         self.emit("class %s(AST):" % (base,))
+        self.make_slots(sum.attributes)
+        self.make_description(base)
+        if sum.attributes:
+            self.emit("")
         self.make_constructor(sum.attributes, sum)
+        self.make_methods(base)
+        self.emit("")
         self.emit("")
 
         for cons in sum.types:
             self.visit(cons, base, sum.attributes)
+
+    def make_simple_sum(self, sum, base):
+        # The constructors of simple sums have no fields: each name is bound
+        # to a single shared instance of its class, so that nodes can be
+        # compared by identity and no per-node object is allocated.
+        self.emit("class %s(AST):" % (base,))
+        self.emit("__slots__ = ()", 1)
+        self.emit("")
+        self.emit("def __repr__(self):", 1)
+        self.emit("return type(self).__name__", 2)
+        self.emit("")
+        self.emit("def __reduce__(self):", 1)
+        self.emit("return type(self).__name__", 2)
+        self.emit("")
+        self.emit("")
+        for cons in sum.types:
+            self.emit("class %s(%s):" % (cons.name, base))
+            self.emit("__slots__ = ()", 1)
+            self.emit("")
+            self.emit("%s = %s()" % (cons.name, cons.name))
+            self.emit("")
             self.emit("")
 
     def visitProduct(self, product, name):
         self.emit("class %s(AST):" % (name,))
+        self.make_slots(product.fields + product.attributes)
         self.make_fields(product.fields)
         self.emit("")
         self.make_constructor(product.fields + product.attributes, product)
+        self.make_methods(name)
         self.emit("")
         self.emit("")
 
     def visitConstructor(self, cons, base, extra_attributes):
         self.emit("class %s(%s):" % (cons.name, base))
+        self.make_slots(cons.fields)
+        self.make_description(cons.name)
         if cons.fields:
             self.make_fields(cons.fields)
+        if cons.fields or extra_attributes:
             self.emit("")
-        self.make_constructor(cons.fields, cons, extra_attributes, base)
+            self.make_constructor(cons.fields, cons, extra_attributes, base)
+        self.make_methods(cons.name)
+        self.emit("")
         self.emit("")
 
     def visitField(self, field):
         self.emit("self.%s = %s" % (field.name, field.name), 2)
 
+    def make_slots(self, fields):
+        self.emit("__slots__ = %s" % (tuple(f.name for f in fields),), 1)
+
+    def make_description(self, name):
+        if name in DESCRIPTIONS:
+            self.emit("_description = %r" % (DESCRIPTIONS[name],), 1)
+
     def make_fields(self, fields):
         self.emit("_fields = %s" % (tuple(f.name for f in fields),), 1)
 
+    def make_methods(self, name):
+        if name in METHODS:
+            self.emit("")
+            for line in METHODS[name].strip().split("\n"):
+                self.emit(line, 1)
+
     def make_constructor(self, fields, node, extras=None, base=None):
         if fields or extras:
             arg_fields = fields + extras if extras else fields
@@ -95,8 +223,6 @@ class ASTNodeVisitor(ASDLVisitor):
             if extras:
                 base_args = ", ".join(str(field.name) for field in extras)
                 self.emit("%s.__init__(self, %s)" % (base, base_args), 2)
-        else:
-            self.emit("pass", 1)
 
 
 class ASDLData(object):
@@ -146,10 +272,23 @@ class ASDLData(object):
         self.optional_masks = optional_masks
 
 
-HEAD = r"""
+HEAD = r"""# Generated by tools/asdl_py.py from tools/Python.asdl, do not edit.
+from . import misc
+
+class UnacceptableExpressionContext(Exception):
+
+    def __init__(self, node, msg):
+        self.node = node
+        self.msg = msg
+
+
 class AST:
+    # Nodes have no instance dictionary: an AST is made of many small nodes
+    # and the dictionaries would take most of its memory.
+    __slots__ = ()
     _fields = ()
 
+
 """
 
 visitors = [ASTNodeVisitor]